@@ -3,7 +3,7 @@ from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from recruitmentAPI.models import User, Post, Comment, Role, ConnectionRequest
 from .models.job_model import JobPost
-from .models.notification_model import Notification
+from .models.notification_model import Notification, BroadcastNotification
 from .models.quiz_model import Quiz, QuizAttempt
 from django.contrib.auth import get_user_model
 
@@ -152,6 +152,15 @@ class NotificationAdmin(admin.ModelAdmin):
         return mark_safe('<span style="background-color: #ffc107; color: white; padding: 3px 10px; border-description: 10px;">Unread</span>')
     status_badge.short_description = 'Status'
 
+@admin.register(BroadcastNotification)
+class BroadcastNotificationAdmin(admin.ModelAdmin):
+    list_display = ('sender', 'notification_type', 'content', 'created_at')
+    list_filter = ('notification_type', 'created_at')
+    search_fields = ('content', 'sender__email')
+    readonly_fields = ('created_at',)
+    date_hierarchy = 'created_at'
+    list_per_page = 20
+
 @admin.register(Quiz)
 class QuizAdmin(admin.ModelAdmin):
     list_display = ('job_title', 'attempts_count', 'created_at')
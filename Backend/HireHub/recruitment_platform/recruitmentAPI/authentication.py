@@ -0,0 +1,81 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+PRINCIPAL_TTL = 60  # seconds; User.save()/delete() also invalidate it; bounds queryset updates
+
+class LazyUser(SimpleLazyObject):
+    """
+    Stands in for request.user. id, user_type and is_active come from the
+    cached principal; touching anything else loads the full User row once.
+    """
+    def __init__(self, principal):
+        self.__dict__['_principal'] = principal
+        super().__init__(lambda: User.objects.get(id=principal['id']))
+
+    @property
+    def id(self):
+        return self._principal['id']
+
+    @property
+    def pk(self):
+        return self._principal['id']
+
+    @property
+    def user_type(self):
+        return self._principal['user_type']
+
+    @property
+    def is_active(self):
+        return self._principal['is_active']
+
+    @property
+    def is_authenticated(self):
+        return True
+
+    @property
+    def is_anonymous(self):
+        return False
+
+    def __bool__(self):
+        # IsAuthenticated checks bool(request.user); answer without loading the row
+        return True
+
+def get_principal(user_id):
+    """Minimal {id, user_type, is_active} for a user, cached for PRINCIPAL_TTL; None if missing"""
+    cache_key = User.principal_cache_key(user_id)
+    principal = cache.get(cache_key)
+    if principal is None:
+        principal = User.objects.filter(id=user_id).values('id', 'user_type', 'is_active').first()
+        if principal is None:
+            return None
+        cache.set(cache_key, principal, PRINCIPAL_TTL)
+    return principal
+
+def get_user_for_id(user_id):
+    """A LazyUser for an active user id, or None"""
+    principal = get_principal(user_id)
+    if not principal or not principal['is_active']:
+        return None
+    return LazyUser(principal)
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that resolves the user from the cached principal instead of the users table"""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        principal = get_principal(user_id)
+        if principal is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        if not principal['is_active']:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return LazyUser(principal)
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from recruitmentAPI.services.notification_retention_services import NotificationRetentionService
+
+class Command(BaseCommand):
+    help = 'Archive read notifications past their retention period (run daily)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=NotificationRetentionService.BATCH_SIZE,
+            help='Notifications moved per transaction'
+        )
+        parser.add_argument(
+            '--export-dir',
+            default=getattr(settings, 'NOTIFICATION_ARCHIVE_EXPORT_DIR', None),
+            help='Write archived notifications to gzipped JSON lines here instead of the archive table'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many notifications would be archived'
+        )
+
+    def handle(self, *args, **options):
+        archived = NotificationRetentionService.archive_expired(
+            batch_size=options['batch_size'],
+            dry_run=options['dry_run'],
+            export_dir=options['export_dir']
+        )
+        for notification_type, count in archived.items():
+            self.stdout.write(f'{notification_type}: {count}')
+
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'{sum(archived.values())} notifications would be archived'))
+            return
+
+        purged = NotificationRetentionService.purge_expired_broadcasts(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Archived {sum(archived.values())} notifications and purged {purged} expired broadcasts'
+            )
+        )
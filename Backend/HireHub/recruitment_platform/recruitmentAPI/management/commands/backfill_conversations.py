@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max, Q
+from recruitmentAPI.models import Conversation, Message, ConversationParticipant
+from recruitmentAPI.services.message_services import MessageService
+
+class Command(BaseCommand):
+    help = (
+        'Set participant_key, the last-message summary and read watermarks on conversations '
+        'created before they existed, and empty the retired Message.read_by table'
+    )
+
+    def handle(self, *args, **options):
+        conversations = Conversation.objects.filter(
+            participant_key__isnull=True
+        ).prefetch_related('participants').order_by('id')
+        keyed_count = 0
+        duplicate_count = 0
+
+        for conversation in conversations.iterator(chunk_size=500):
+            participant_ids = [participant.id for participant in conversation.participants.all()]
+            if not participant_ids:
+                continue
+            key = Conversation.build_participant_key(participant_ids)
+
+            # The oldest conversation keeps the key; later duplicates stay unkeyed
+            if Conversation.objects.filter(participant_key=key).exists():
+                duplicate_count += 1
+                self.stdout.write(f'Conversation {conversation.id} duplicates an existing participant set')
+                continue
+
+            conversation.participant_key = key
+            conversation.save(update_fields=['participant_key'])
+            keyed_count += 1
+
+        summarized_count = 0
+        for conversation in Conversation.objects.filter(last_message__isnull=True).iterator(chunk_size=500):
+            last_message = Message.objects.filter(conversation=conversation).order_by('-id').first()
+            if last_message:
+                MessageService.set_last_message(last_message)
+                summarized_count += 1
+
+        watermark_count = 0
+        read_by = Message.read_by.through
+        for conversation in Conversation.objects.prefetch_related('participants').iterator(chunk_size=500):
+            tracked = set(
+                ConversationParticipant.objects.filter(conversation=conversation).values_list('user_id', flat=True)
+            )
+            with transaction.atomic():
+                for participant in conversation.participants.all():
+                    if participant.id in tracked:
+                        continue
+                    # Everything up to the newest message the user sent or was recorded reading
+                    last_read_id = Message.objects.filter(
+                        Q(sender=participant) | Q(read_by=participant),
+                        conversation=conversation
+                    ).aggregate(latest=Max('id'))['latest'] or 0
+                    ConversationParticipant.objects.create(
+                        conversation=conversation,
+                        user=participant,
+                        last_read_message_id=last_read_id
+                    )
+                    watermark_count += 1
+                read_by.objects.filter(message__conversation=conversation).delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Keyed {keyed_count} conversations ({duplicate_count} duplicates left unkeyed), '
+                f'summarized {summarized_count}, created {watermark_count} read watermarks'
+            )
+        )
@@ -0,0 +1,82 @@
+import asyncio
+import time
+import uuid
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+class Command(BaseCommand):
+    help = (
+        'Round-trip direct and group messages through the configured channel layer. '
+        'Run from two shells with --listen / --send to check cross-process delivery.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--listen',
+            metavar='GROUP',
+            help='Join GROUP and wait for one message sent by another process'
+        )
+        parser.add_argument(
+            '--send',
+            metavar='GROUP',
+            help='Send one message to GROUP (pair with --listen in another process)'
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=10,
+            help='Seconds to wait for a message'
+        )
+
+    def handle(self, *args, **options):
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            raise CommandError('No channel layer is configured')
+        self.stdout.write(f'Channel layer: {channel_layer.__class__.__name__} ({settings.CHANNEL_LAYER_BACKEND})')
+
+        try:
+            if options['send']:
+                async_to_sync(channel_layer.group_send)(options['send'], {'type': 'layer.check', 'sent_at': time.time()})
+                self.stdout.write(self.style.SUCCESS(f"Sent to group {options['send']}"))
+            elif options['listen']:
+                elapsed = async_to_sync(self._listen)(channel_layer, options['listen'], options['timeout'])
+                self.stdout.write(self.style.SUCCESS(f'Received cross-process message after {elapsed * 1000:.1f}ms'))
+            else:
+                direct_ms, group_ms = async_to_sync(self._round_trip)(channel_layer, options['timeout'])
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f'Direct message round trip {direct_ms:.1f}ms, group message round trip {group_ms:.1f}ms'
+                    )
+                )
+        except TimeoutError:
+            raise CommandError('Timed out waiting for a message from the channel layer')
+
+    async def _round_trip(self, channel_layer, timeout):
+        channel_name = await channel_layer.new_channel()
+        started = time.perf_counter()
+        await channel_layer.send(channel_name, {'type': 'layer.check'})
+        await asyncio.wait_for(channel_layer.receive(channel_name), timeout)
+        direct_ms = (time.perf_counter() - started) * 1000
+
+        group = f'layer_check_{uuid.uuid4().hex}'
+        await channel_layer.group_add(group, channel_name)
+        try:
+            started = time.perf_counter()
+            await channel_layer.group_send(group, {'type': 'layer.check'})
+            await asyncio.wait_for(channel_layer.receive(channel_name), timeout)
+            group_ms = (time.perf_counter() - started) * 1000
+        finally:
+            await channel_layer.group_discard(group, channel_name)
+        return direct_ms, group_ms
+
+    async def _listen(self, channel_layer, group, timeout):
+        channel_name = await channel_layer.new_channel()
+        await channel_layer.group_add(group, channel_name)
+        try:
+            self.stdout.write(f'Listening on group {group}...')
+            message = await asyncio.wait_for(channel_layer.receive(channel_name), timeout)
+            return time.time() - message['sent_at']
+        finally:
+            await channel_layer.group_discard(group, channel_name)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from recruitmentAPI.services.upload_services import UploadService
+
+class Command(BaseCommand):
+    help = 'Expire chunked uploads that have stalled and remove their part files'
+
+    def handle(self, *args, **options):
+        expired_count = UploadService.expire_stale_sessions()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Expired {expired_count} stale uploads'
+            )
+        )
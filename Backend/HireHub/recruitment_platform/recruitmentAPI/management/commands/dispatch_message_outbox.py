@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from recruitmentAPI.services.message_services import MessageService
+
+class Command(BaseCommand):
+    help = 'Deliver chat messages whose broadcasts and notifications were not dispatched, e.g. after a restart or a channel layer outage'
+
+    def handle(self, *args, **options):
+        dispatched_count = MessageService.dispatch_outbox()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Dispatched {dispatched_count} messages from the outbox'
+            )
+        )
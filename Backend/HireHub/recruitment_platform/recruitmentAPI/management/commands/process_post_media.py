@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from recruitmentAPI.models.post_model import Post
+from recruitmentAPI.services.media_services import MediaService
+
+class Command(BaseCommand):
+    help = 'Generate media variants for posts that are pending, failed or were interrupted mid-processing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Reprocess every post with media, not only unfinished ones'
+        )
+
+    def handle(self, *args, **options):
+        posts = Post.objects.exclude(media_type='none')
+        if not options['all']:
+            posts = posts.filter(media_status__in=[
+                Post.MEDIA_STATUS_NONE,
+                Post.MEDIA_STATUS_PENDING,
+                Post.MEDIA_STATUS_PROCESSING,
+                Post.MEDIA_STATUS_FAILED,
+            ])
+
+        processed_count = 0
+        for post_id in posts.values_list('id', flat=True).iterator():
+            if MediaService.process_post_media(post_id) is not None:
+                processed_count += 1
+                self.stdout.write(f'Processed media for post {post_id}')
+            else:
+                self.stdout.write(self.style.WARNING(f'Failed to process media for post {post_id}'))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully processed media for {processed_count} posts'
+            )
+        )
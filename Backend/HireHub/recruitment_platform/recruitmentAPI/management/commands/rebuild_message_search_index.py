@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from recruitmentAPI.models import Message, MessageSearchTerm
+from recruitmentAPI.services.message_search_services import MessageSearchService
+
+class Command(BaseCommand):
+    help = 'Rebuild the message search index from scratch'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Messages indexed per batch'
+        )
+
+    def handle(self, *args, **options):
+        MessageSearchTerm.objects.all().delete()
+
+        batch = []
+        indexed_count = 0
+        for message in Message.objects.filter(is_deleted=False).only(
+            'id', 'conversation_id', 'content', 'is_deleted'
+        ).iterator(chunk_size=options['batch_size']):
+            batch.append(message)
+            if len(batch) >= options['batch_size']:
+                MessageSearchService.index_messages(batch)
+                indexed_count += len(batch)
+                batch = []
+        if batch:
+            MessageSearchService.index_messages(batch)
+            indexed_count += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Indexed {indexed_count} messages'
+            )
+        )
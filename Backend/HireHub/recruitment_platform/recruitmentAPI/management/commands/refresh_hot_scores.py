@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from recruitmentAPI.services.trending_services import TrendingService
+
+class Command(BaseCommand):
+    help = 'Re-apply recency decay to post and job trending scores (run periodically, e.g. every 15 minutes)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=TrendingService.REFRESH_WINDOW_DAYS,
+            help='Only refresh content created within this many days'
+        )
+
+    def handle(self, *args, **options):
+        days = options['days']
+        posts_updated = TrendingService.refresh_recent_posts(days=days)
+        jobs_updated = TrendingService.refresh_recent_jobs(days=days)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Refreshed hot scores for {posts_updated} posts and {jobs_updated} jobs'
+            )
+        )
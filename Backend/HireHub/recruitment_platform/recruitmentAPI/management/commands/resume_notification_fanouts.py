@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from recruitmentAPI.services.notification_services import NotificationService
+
+class Command(BaseCommand):
+    help = 'Resume follower notification fan-outs that were interrupted before finishing'
+
+    def handle(self, *args, **options):
+        resumed_count = NotificationService.resume_pending_fanouts()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Resumed {resumed_count} notification fan-outs'
+            )
+        )
@@ -1,18 +1,47 @@
+import asyncio
 import json
 import urllib.parse
 import logging
 from channels.generic.websocket import AsyncWebsocketConsumer
+from asgiref.sync import sync_to_async
 from channels.db import database_sync_to_async
 from django.contrib.auth import get_user_model
 import jwt
 from django.conf import settings
-from recruitmentAPI.models import Conversation
+from recruitmentAPI.authentication import get_user_for_id
+from recruitmentAPI.services.message_services import MessageService
+from recruitmentAPI.services.presence_services import PresenceService
 
 # Set up logging
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+def get_user_from_token(token):
+    """Authenticate user from JWT token"""
+    try:
+        # Decode token
+        payload = jwt.decode(
+            token, 
+            settings.SECRET_KEY,
+            algorithms=['HS256']
+        )
+        user_id = payload.get('user_id')
+        
+        # Get user from the cached principal; the full row loads only if needed
+        user = get_user_for_id(user_id)
+        if user is None:
+            logger.error(f"Token authentication error: user {user_id} not found or inactive")
+        return user
+    except jwt.InvalidTokenError as e:
+        logger.error(f"Token authentication error: {str(e)}")
+        return None
+
 class ChatConsumer(AsyncWebsocketConsumer):
+    # message.send frames arriving within this window are saved in one transaction
+    SEND_BATCH_WINDOW = 0.005  # seconds
+    SEND_BATCH_SIZE = 50
+    MAX_MESSAGE_LENGTH = 5000
+
     async def connect(self):
         # Get token from URL parameters
         token = self.scope['url_route']['kwargs'].get('token')
@@ -28,38 +57,45 @@ class ChatConsumer(AsyncWebsocketConsumer):
             
             # Authenticate the user from the token
             user = await self.get_user_from_token(decoded_token)
-            if not user:
+            if user is None:
                 logger.error(f"Failed to authenticate user with token")
                 await self.close()
                 return
             
             self.user = user
-            self.conversations = await self.get_user_conversations(user)
+            self.pending_sends = []
+            self.flush_task = None
+            self.flush_lock = asyncio.Lock()
             
-            # Join conversation groups
-            for conversation_id in self.conversations:
-                group_name = f"conversation_{conversation_id}"
-                await self.channel_layer.group_add(
-                    group_name,
-                    self.channel_name
-                )
-                logger.debug(f"User {user.id} joined group: {group_name}")
+            # One group per user: MessageService fans events out to each participant,
+            # so conversations created after connecting are delivered too
+            self.group_name = MessageService.user_group(user.id)
+            await self.channel_layer.group_add(
+                self.group_name,
+                self.channel_name
+            )
             
             await self.accept()
-            logger.info(f"WebSocket connected for user {user.id} with {len(self.conversations)} conversations")
+            await sync_to_async(PresenceService.heartbeat)(user.id)
+            # Clients do not send heartbeats, so the open socket keeps presence alive
+            self.presence_task = asyncio.ensure_future(self.keep_presence())
+            logger.info(f"WebSocket connected for user {user.id}")
         except Exception as e:
             logger.exception(f"WebSocket connection error: {str(e)}")
             await self.close()
     
     async def disconnect(self, close_code):
-        # Leave conversation groups
-        if hasattr(self, 'conversations'):
-            for conversation_id in self.conversations:
-                group_name = f"conversation_{conversation_id}"
-                await self.channel_layer.group_discard(
-                    group_name,
-                    self.channel_name
-                )
+        if getattr(self, 'presence_task', None):
+            self.presence_task.cancel()
+        # Persist anything still buffered; the acks cannot be delivered any more
+        if getattr(self, 'pending_sends', None):
+            await self.flush_sends()
+        # Leave the user group
+        if hasattr(self, 'group_name'):
+            await self.channel_layer.group_discard(
+                self.group_name,
+                self.channel_name
+            )
             logger.info(f"WebSocket disconnected for user {self.user.id if hasattr(self, 'user') else 'unknown'}, code: {close_code}")
     
     async def receive(self, text_data):
@@ -69,15 +105,119 @@ class ChatConsumer(AsyncWebsocketConsumer):
             
             if message_type == 'message.read':
                 # Handle read receipts
+                # MessageService only marks conversations the user participates in
                 conversation_id = data.get('conversation_id')
-                if conversation_id and str(conversation_id) in self.conversations:
-                    await self.mark_messages_as_read(conversation_id)
+                if str(conversation_id).isdigit() and await self.mark_messages_as_read(int(conversation_id)):
                     logger.debug(f"Marked messages as read in conversation {conversation_id} for user {self.user.id}")
             
+            elif message_type == 'message.send':
+                await self.queue_send(data)
+
+            elif message_type == 'presence.heartbeat':
+                await self.refresh_presence()
+
+            elif message_type == 'typing':
+                await self.handle_typing(data.get('conversation_id'))
+            
             # Additional message types can be handled here
         except json.JSONDecodeError:
             logger.warning(f"Received invalid JSON from user {self.user.id if hasattr(self, 'user') else 'unknown'}")
     
+    async def keep_presence(self):
+        """Refresh the user's presence every HEARTBEAT_INTERVAL while the socket is open"""
+        while True:
+            await asyncio.sleep(PresenceService.HEARTBEAT_INTERVAL)
+            await self.refresh_presence()
+
+    async def refresh_presence(self):
+        try:
+            await sync_to_async(PresenceService.heartbeat)(self.user.id)
+        except Exception as e:
+            logger.error(f"Error refreshing presence for user {self.user.id}: {str(e)}")
+
+    async def queue_send(self, data):
+        """Buffer a message.send frame; bursts are flushed together"""
+        conversation_id = data.get('conversation_id')
+        content = (data.get('content') or '').strip()
+        client_id = data.get('client_id')
+
+        if not str(conversation_id).isdigit() or not content:
+            await self.send_ack(client_id, error='conversation_id and content are required')
+            return
+        if len(content) > self.MAX_MESSAGE_LENGTH:
+            await self.send_ack(client_id, error=f'Message cannot exceed {self.MAX_MESSAGE_LENGTH} characters')
+            return
+
+        self.pending_sends.append((int(conversation_id), content, client_id))
+        if len(self.pending_sends) >= self.SEND_BATCH_SIZE:
+            await self.flush_sends()
+        elif self.flush_task is None:
+            self.flush_task = asyncio.ensure_future(self.flush_later())
+
+    async def flush_later(self):
+        await asyncio.sleep(self.SEND_BATCH_WINDOW)
+        await self.flush_sends()
+
+    async def flush_sends(self):
+        """Persist buffered messages and ack them; fan-out happens after commit"""
+        async with self.flush_lock:
+            batch, self.pending_sends = self.pending_sends, []
+            if self.flush_task is not None and self.flush_task is not asyncio.current_task():
+                self.flush_task.cancel()
+            self.flush_task = None
+            if not batch:
+                return
+
+            try:
+                results = await database_sync_to_async(MessageService.persist_messages)(
+                    self.user,
+                    [(conversation_id, content) for conversation_id, content, _ in batch]
+                )
+            except Exception as e:
+                logger.exception(f"Error saving {len(batch)} messages from user {self.user.id}: {str(e)}")
+                for _, _, client_id in batch:
+                    await self.send_ack(client_id, error='Message could not be sent')
+                return
+
+            # Participants (including this socket) receive chat_message from the outbox dispatcher
+            for (_, _, client_id), (message, message_data) in zip(batch, results):
+                if message is None:
+                    await self.send_ack(client_id, error='Conversation not found or you are not a participant')
+                    continue
+                await self.send_ack(client_id, message=message_data)
+
+    async def handle_typing(self, conversation_id):
+        """Relay a typing indicator to the other participants, coalesced per interval"""
+        if not str(conversation_id).isdigit():
+            return
+        conversation_id = int(conversation_id)
+        participant_ids = await sync_to_async(PresenceService.get_participant_ids)(conversation_id)
+        if self.user.id not in participant_ids:
+            return
+        if not await sync_to_async(PresenceService.should_broadcast_typing)(self.user.id, conversation_id):
+            return
+
+        for participant_id in participant_ids:
+            if participant_id != self.user.id:
+                await self.channel_layer.group_send(MessageService.user_group(participant_id), {
+                    'type': 'chat_typing',
+                    'conversation_id': conversation_id,
+                    'user_id': self.user.id
+                })
+
+    async def send_ack(self, client_id, message=None, error=None):
+        """Acknowledge a message.send frame with the saved message or an error"""
+        payload = {'type': 'message_ack', 'client_id': client_id}
+        if error:
+            payload['error'] = error
+        else:
+            payload['message'] = message
+        try:
+            await self.send(text_data=json.dumps(payload))
+        except Exception:
+            # The socket closed before the ack; the message is still saved and fanned out
+            logger.debug(f"Could not ack message for user {self.user.id}")
+
     # WebSocket event handlers
     async def chat_message(self, event):
         """Send message to WebSocket"""
@@ -89,6 +229,14 @@ class ChatConsumer(AsyncWebsocketConsumer):
         }))
         logger.debug(f"Sent new message to user {self.user.id if hasattr(self, 'user') else 'unknown'}")
     
+    async def chat_typing(self, event):
+        """Send typing indicator to WebSocket"""
+        await self.send(text_data=json.dumps({
+            'type': 'typing',
+            'conversation_id': event['conversation_id'],
+            'user_id': event['user_id']
+        }))
+
     async def chat_message_updated(self, event):
         """Send message update to WebSocket"""
         message = event['message']
@@ -113,29 +261,9 @@ class ChatConsumer(AsyncWebsocketConsumer):
     @database_sync_to_async
     def get_user_from_token(self, token):
         """Authenticate user from JWT token"""
-        try:
-            # Decode token
-            payload = jwt.decode(
-                token, 
-                settings.SECRET_KEY,
-                algorithms=['HS256']
-            )
-            user_id = payload.get('user_id')
-            
-            # Get user
-            return User.objects.get(id=user_id)
-        except (jwt.InvalidTokenError, User.DoesNotExist) as e:
-            logger.error(f"Token authentication error: {str(e)}")
-            return None
-    
-    @database_sync_to_async
-    def get_user_conversations(self, user):
-        """Get all conversation IDs for a user"""
-        conversations = Conversation.objects.filter(participants=user).values_list('id', flat=True)
-        return [str(conv_id) for conv_id in conversations]
+        return get_user_from_token(token)
     
     @database_sync_to_async
     def mark_messages_as_read(self, conversation_id):
         """Mark all messages in a conversation as read by the current user"""
-        from recruitmentAPI.services.message_services import MessageService
         return MessageService.mark_messages_as_read(self.user, conversation_id) 
\ No newline at end of file
@@ -0,0 +1,313 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-updated_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Interview',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scheduled_date', models.DateTimeField()),
+                ('duration_minutes', models.IntegerField(default=30)),
+                ('platform', models.CharField(choices=[('zoom', 'Zoom'), ('google_meet', 'Google Meet'), ('teams', 'Microsoft Teams')], default='zoom', max_length=20)),
+                ('meeting_link', models.URLField(blank=True, max_length=500, null=True)),
+                ('meeting_id', models.CharField(blank=True, max_length=100, null=True)),
+                ('meeting_password', models.CharField(blank=True, max_length=100, null=True)),
+                ('status', models.CharField(choices=[('scheduled', 'Scheduled'), ('completed', 'Completed'), ('cancelled', 'Cancelled'), ('rescheduled', 'Rescheduled')], default='scheduled', max_length=20)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('is_recorded', models.BooleanField(default=False)),
+                ('recording_url', models.URLField(blank=True, max_length=500, null=True)),
+            ],
+            options={
+                'ordering': ['-scheduled_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Message',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('is_edited', models.BooleanField(default=False)),
+                ('is_deleted', models.BooleanField(default=False)),
+            ],
+            options={
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(choices=[('NEW_FOLLOWER', 'New Follower'), ('CONNECTION_ACCEPTED', 'Connection Accepted'), ('POST_LIKE', 'Post Like'), ('POST_COMMENT', 'Post Comment'), ('NEW_JOB_POST', 'New Job Post'), ('JOB_OFFER_INITIAL', 'Job Offer Initial'), ('JOB_OFFER_ACCEPTED', 'Job Offer Accepted'), ('JOB_OFFER_REJECTED', 'Job Offer Rejected'), ('NEW_MESSAGE', 'New Message')], max_length=50)),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('is_read', models.BooleanField(default=False)),
+                ('related_object_type', models.CharField(blank=True, max_length=50, null=True)),
+                ('related_object_id', models.IntegerField(blank=True, null=True)),
+                ('status', models.CharField(blank=True, choices=[('PENDING', 'Pending'), ('ACCEPTED', 'Accepted'), ('REJECTED', 'Rejected'), ('IGNORED', 'Ignored')], max_length=20, null=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Quiz',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question_pool', models.JSONField(help_text="Questions categorized by difficulty: {'easy': [], 'medium': [], 'hard': []}")),
+                ('start_difficulty', models.CharField(choices=[('easy', 'Easy'), ('medium', 'Medium'), ('hard', 'Hard')], default='medium', help_text='Initial difficulty level for the quiz', max_length=10)),
+                ('passing_score', models.IntegerField(default=60, help_text='Minimum score required to pass the quiz (percentage)', validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Quizzes',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='QuizAttempt',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('answers', models.JSONField(default=dict, help_text="User's answers keyed by question reference (e.g., {'easy_0': 1, 'medium_2': 3})")),
+                ('current_difficulty', models.CharField(choices=[('easy', 'Easy'), ('medium', 'Medium'), ('hard', 'Hard')], default='medium', help_text='Current difficulty level being presented', max_length=10)),
+                ('questions_answered', models.JSONField(default=list, help_text='List of question references already answered in this attempt')),
+                ('correct_streak', models.IntegerField(default=0)),
+                ('incorrect_streak', models.IntegerField(default=0)),
+                ('last_question_ref', models.CharField(blank=True, help_text='Reference to the last question presented', max_length=50, null=True)),
+                ('total_questions_served', models.IntegerField(default=0)),
+                ('score', models.IntegerField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('passed', models.BooleanField(blank=True, null=True)),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-started_at'],
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='jobpost',
+            options={'ordering': ['-created_at']},
+        ),
+        migrations.RemoveIndex(
+            model_name='jobpost',
+            name='job_posts_locatio_5f6a66_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='jobpost',
+            name='job_posts_employm_8d817a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='jobpost',
+            name='job_posts_experie_71095e_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='jobpost',
+            new_name='recruitment_status_45c6b5_idx',
+            old_name='job_posts_status_022b42_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='jobpost',
+            new_name='recruitment_created_f94f47_idx',
+            old_name='job_posts_created_5ee012_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='jobpost',
+            new_name='recruitment_expires_ac04ca_idx',
+            old_name='job_posts_expires_034cc5_idx',
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='saved_by',
+            field=models.ManyToManyField(blank=True, related_name='saved_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='about_company',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='cv_file',
+            field=models.FileField(blank=True, null=True, upload_to='cvs/'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='cv_upload_date',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='date_joined',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='show_bio',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='show_github',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='show_linkedin',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='show_location',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='show_website',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='specializations',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='jobpost',
+            name='ai_matching_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='jobpost',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='jobpost',
+            name='posted_by',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='posted_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='content',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AlterModelTable(
+            name='jobpost',
+            table=None,
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='participants',
+            field=models.ManyToManyField(related_name='conversations', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='applicant',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interviews_as_applicant', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='interviewer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interviews_as_interviewer', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='job',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='interviews', to='recruitmentAPI.jobpost'),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='conversation',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='recruitmentAPI.conversation'),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='read_by',
+            field=models.ManyToManyField(blank=True, related_name='read_messages', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='sender',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sent_messages', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='recipient',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications_received', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='sender',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notifications_sent', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='quiz',
+            name='job',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='job_quiz', to='recruitmentAPI.jobpost'),
+        ),
+        migrations.AddField(
+            model_name='jobpost',
+            name='quiz',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='quiz_job', to='recruitmentAPI.quiz'),
+        ),
+        migrations.AddField(
+            model_name='quizattempt',
+            name='quiz',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attempts', to='recruitmentAPI.quiz'),
+        ),
+        migrations.AddField(
+            model_name='quizattempt',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='quiz_attempts', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['scheduled_date'], name='recruitment_schedul_2629c2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interview',
+            index=models.Index(fields=['status'], name='recruitment_status_182346_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-created_at'], name='recruitment_recipie_16d7f0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['notification_type'], name='recruitment_notific_81088b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['status'], name='recruitment_status_519a13_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='quizattempt',
+            unique_together={('quiz', 'user')},
+        ),
+    ]
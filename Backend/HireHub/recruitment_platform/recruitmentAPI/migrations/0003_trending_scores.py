@@ -0,0 +1,36 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0002_sync_models'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobpost',
+            name='hot_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='hot_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='hot_score_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='jobpost',
+            index=models.Index(fields=['status', 'is_active', '-hot_score', '-id'], name='recruitment_status_0431ec_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_active', 'is_hidden', '-hot_score', '-id'], name='recruitment_is_acti_85d64f_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0003_trending_scores'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='media_status',
+            field=models.CharField(choices=[('none', 'None'), ('pending', 'Pending'), ('processing', 'Processing'), ('ready', 'Ready'), ('failed', 'Failed')], default='none', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='media_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0004_post_media_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSession',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('target', models.CharField(choices=[('post_video', 'Post Video'), ('cv', 'CV')], max_length=20)),
+                ('file_name', models.CharField(max_length=255)),
+                ('content_type', models.CharField(max_length=100)),
+                ('total_size', models.BigIntegerField()),
+                ('received_bytes', models.BigIntegerField(default=0)),
+                ('checksum', models.CharField(blank=True, default='', max_length=64)),
+                ('status', models.CharField(choices=[('uploading', 'Uploading'), ('complete', 'Complete'), ('attached', 'Attached'), ('expired', 'Expired')], default='uploading', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', 'status'], name='recruitment_user_id_a56742_idx'), models.Index(fields=['status', 'updated_at'], name='recruitment_status_77e70c_idx')],
+            },
+        ),
+    ]
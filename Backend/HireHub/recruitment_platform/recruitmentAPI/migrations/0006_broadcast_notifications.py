@@ -0,0 +1,39 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0005_upload_sessions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BroadcastWatermark',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='broadcast_watermark', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('read_until', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='BroadcastNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(choices=[('NEW_FOLLOWER', 'New Follower'), ('CONNECTION_ACCEPTED', 'Connection Accepted'), ('POST_LIKE', 'Post Like'), ('POST_COMMENT', 'Post Comment'), ('NEW_JOB_POST', 'New Job Post'), ('JOB_OFFER_INITIAL', 'Job Offer Initial'), ('JOB_OFFER_ACCEPTED', 'Job Offer Accepted'), ('JOB_OFFER_REJECTED', 'Job Offer Rejected'), ('NEW_MESSAGE', 'New Message')], max_length=50)),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('related_object_type', models.CharField(blank=True, max_length=50, null=True)),
+                ('related_object_id', models.IntegerField(blank=True, null=True)),
+                ('sender', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='broadcasts_sent', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['-created_at'], name='recruitment_created_f3c684_idx'), models.Index(fields=['notification_type', '-created_at'], name='recruitment_notific_5d0c16_idx')],
+            },
+        ),
+    ]
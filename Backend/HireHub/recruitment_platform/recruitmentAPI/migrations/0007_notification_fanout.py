@@ -0,0 +1,35 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0006_broadcast_notifications'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationFanout',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(max_length=50)),
+                ('content', models.TextField()),
+                ('related_object_type', models.CharField(blank=True, max_length=50, null=True)),
+                ('related_object_id', models.IntegerField(blank=True, null=True)),
+                ('last_recipient_id', models.BigIntegerField(default=0)),
+                ('sent_count', models.PositiveIntegerField(default=0)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('DONE', 'Done')], default='PENDING', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('sender', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_fanouts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='recruitment_status_d58870_idx')],
+            },
+        ),
+    ]
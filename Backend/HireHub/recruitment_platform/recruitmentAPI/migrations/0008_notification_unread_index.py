@@ -0,0 +1,17 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0007_notification_fanout'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'is_read'], name='recruitment_recipie_d900fc_idx'),
+        ),
+    ]
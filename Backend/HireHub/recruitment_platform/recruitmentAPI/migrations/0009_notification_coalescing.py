@@ -0,0 +1,27 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0008_notification_unread_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='actor_count',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='recent_actor_ids',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'notification_type', 'related_object_id'], name='recruitment_recipie_c1b725_idx'),
+        ),
+    ]
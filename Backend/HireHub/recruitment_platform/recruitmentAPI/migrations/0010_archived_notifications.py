@@ -0,0 +1,34 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0009_notification_coalescing'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.BigIntegerField(unique=True)),
+                ('recipient_id', models.BigIntegerField()),
+                ('sender_id', models.BigIntegerField(blank=True, null=True)),
+                ('notification_type', models.CharField(max_length=50)),
+                ('content', models.TextField()),
+                ('created_at', models.DateTimeField()),
+                ('related_object_type', models.CharField(blank=True, max_length=50, null=True)),
+                ('related_object_id', models.IntegerField(blank=True, null=True)),
+                ('status', models.CharField(blank=True, max_length=20, null=True)),
+                ('actor_count', models.PositiveIntegerField(default=1)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['recipient_id', '-created_at'], name='recruitment_recipie_0005d3_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0010_archived_notifications'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='participant_key',
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+    ]
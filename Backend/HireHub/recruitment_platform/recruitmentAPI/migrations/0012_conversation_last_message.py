@@ -0,0 +1,33 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0011_conversation_participant_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='last_activity_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='recruitmentAPI.message'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message_preview',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='conversation',
+            index=models.Index(fields=['-last_activity_at'], name='recruitment_last_ac_16a61a_idx'),
+        ),
+    ]
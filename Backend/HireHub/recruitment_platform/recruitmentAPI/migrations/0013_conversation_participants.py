@@ -0,0 +1,28 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0012_conversation_last_message'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConversationParticipant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_read_message_id', models.BigIntegerField(default=0)),
+                ('conversation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='participant_states', to='recruitmentAPI.conversation')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conversation_states', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'conversation'], name='recruitment_user_id_17cec4_idx')],
+                'unique_together': {('conversation', 'user')},
+            },
+        ),
+    ]
@@ -0,0 +1,78 @@
+import hashlib
+
+from django.db import migrations
+from django.db.models import Max, Q
+
+PREVIEW_LENGTH = 255
+
+def build_participant_key(user_ids):
+    # Mirrors Conversation.build_participant_key; historical models carry no methods
+    ids = sorted({int(user_id) for user_id in user_ids})
+    if len(ids) == 2:
+        return f"{ids[0]}:{ids[1]}"
+    return hashlib.sha256(','.join(str(user_id) for user_id in ids).encode()).hexdigest()
+
+def backfill_conversations(apps, schema_editor):
+    """
+    Key existing conversations, point them at their newest message and turn
+    Message.read_by rows into per-participant read watermarks, then empty read_by.
+    """
+    Conversation = apps.get_model('recruitmentAPI', 'Conversation')
+    ConversationParticipant = apps.get_model('recruitmentAPI', 'ConversationParticipant')
+    Message = apps.get_model('recruitmentAPI', 'Message')
+
+    used_keys = set(
+        Conversation.objects.filter(participant_key__isnull=False).values_list('participant_key', flat=True)
+    )
+    for conversation in Conversation.objects.prefetch_related('participants').order_by('id').iterator(chunk_size=500):
+        participant_ids = [participant.id for participant in conversation.participants.all()]
+        update_fields = []
+
+        if conversation.participant_key is None and participant_ids:
+            key = build_participant_key(participant_ids)
+            # The oldest conversation keeps the key; later duplicates stay unkeyed
+            if key not in used_keys:
+                used_keys.add(key)
+                conversation.participant_key = key
+                update_fields.append('participant_key')
+
+        if conversation.last_message_id is None:
+            last_message = Message.objects.filter(conversation_id=conversation.id).order_by('-id').first()
+            if last_message:
+                conversation.last_message_id = last_message.id
+                conversation.last_message_preview = last_message.content[:PREVIEW_LENGTH]
+                conversation.last_activity_at = last_message.created_at
+                update_fields += ['last_message', 'last_message_preview', 'last_activity_at']
+
+        if update_fields:
+            conversation.save(update_fields=update_fields)
+
+        tracked = set(
+            ConversationParticipant.objects.filter(conversation_id=conversation.id).values_list('user_id', flat=True)
+        )
+        ConversationParticipant.objects.bulk_create([
+            ConversationParticipant(
+                conversation_id=conversation.id,
+                user_id=participant_id,
+                # Everything up to the newest message the user sent or was recorded reading
+                last_read_message_id=Message.objects.filter(
+                    Q(sender_id=participant_id) | Q(read_by__id=participant_id),
+                    conversation_id=conversation.id
+                ).aggregate(latest=Max('id'))['latest'] or 0
+            )
+            for participant_id in participant_ids
+            if participant_id not in tracked
+        ])
+
+    Message.read_by.through.objects.all().delete()
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0013_conversation_participants'),
+    ]
+
+    operations = [
+        # read_by is not restored on reverse; the watermarks stay authoritative
+        migrations.RunPython(backfill_conversations, migrations.RunPython.noop),
+    ]
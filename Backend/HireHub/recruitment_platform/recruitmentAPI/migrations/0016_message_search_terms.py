@@ -0,0 +1,27 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0015_message_history_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MessageSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=50)),
+                ('conversation_id', models.BigIntegerField()),
+                ('message', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='recruitmentAPI.message')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'conversation_id', 'message'], name='recruitment_term_56ba0d_idx')],
+                'unique_together': {('term', 'message')},
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0016_message_search_terms'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MessageOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('message', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='outbox_entry', to='recruitmentAPI.message')),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0017_message_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='batch_token',
+            field=models.UUIDField(blank=True, db_index=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:16
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+def backfill_updated_at(apps, schema_editor):
+    """Existing notifications last changed when they were created"""
+    Notification = apps.get_model('recruitmentAPI', 'Notification')
+    Notification.objects.update(updated_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0018_notification_batch_token'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='coalesce_key',
+            field=models.CharField(blank=True, editable=False, max_length=255, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-updated_at'], name='recruitment_recipie_1402f5_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.3 on 2026-10-19 02:18
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitmentAPI', '0019_notification_coalesce_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BroadcastRead',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('read_at', models.DateTimeField(auto_now_add=True)),
+                ('broadcast', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reads', to='recruitmentAPI.broadcastnotification')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='broadcast_reads', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('user', 'broadcast')},
+            },
+        ),
+    ]
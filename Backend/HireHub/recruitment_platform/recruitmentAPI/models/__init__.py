@@ -5,6 +5,7 @@ from .role_model import Role
 from .connection_model import ConnectionRequest
 from .job_model import JobPost
 from .quiz_model import Quiz, QuizAttempt
-from .notification_model import Notification
-from .message_model import Conversation, Message 
+from .notification_model import Notification, BroadcastNotification, BroadcastWatermark, BroadcastRead, NotificationFanout, ArchivedNotification
+from .message_model import Conversation, Message, ConversationParticipant, MessageSearchTerm, MessageOutbox
 from .interview_model import Interview
+from .upload_model import UploadSession
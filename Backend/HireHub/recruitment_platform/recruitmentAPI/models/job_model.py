@@ -82,6 +82,7 @@ class JobPost(models.Model):
     negative_feedback_count = models.IntegerField(default=0)
     recommendation_count = models.IntegerField(default=0)
     ai_matching_score = models.FloatField(null=True, blank=True)
+    hot_score = models.FloatField(default=0)
 
     class Meta:
         ordering = ['-created_at']
@@ -89,6 +90,7 @@ class JobPost(models.Model):
             models.Index(fields=['status', 'is_active']),
             models.Index(fields=['created_at']),
             models.Index(fields=['expires_at']),
+            models.Index(fields=['status', 'is_active', '-hot_score', '-id']),
         ]
 
     def __str__(self):
@@ -1,3 +1,4 @@
+import hashlib
 from django.db import models
 from django.conf import settings
 
@@ -6,14 +7,42 @@ class Conversation(models.Model):
         settings.AUTH_USER_MODEL,
         related_name='conversations'
     )
+    # Canonical id of the participant set, unique so each set has one conversation
+    participant_key = models.CharField(max_length=64, unique=True, null=True, blank=True)
+    # Inbox summary, kept in step with the newest message by MessageService
+    last_message = models.ForeignKey(
+        'Message',
+        on_delete=models.SET_NULL,
+        related_name='+',
+        null=True,
+        blank=True
+    )
+    last_message_preview = models.CharField(max_length=255, blank=True, default='')
+    last_activity_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    PREVIEW_LENGTH = 255
+
     def __str__(self):
         return f"Conversation {self.id} - {', '.join([str(user) for user in self.participants.all()])}"
     
     class Meta:
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['-last_activity_at']),
+        ]
+
+    @staticmethod
+    def build_participant_key(user_ids):
+        """
+        Ordered "<low>:<high>" pair for direct messages, SHA-256 of the sorted
+        ids for groups (so the key fits the column however large the group).
+        """
+        ids = sorted({int(user_id) for user_id in user_ids})
+        if len(ids) == 2:
+            return f"{ids[0]}:{ids[1]}"
+        return hashlib.sha256(','.join(str(user_id) for user_id in ids).encode()).hexdigest()
 
 class Message(models.Model):
     conversation = models.ForeignKey(
@@ -30,6 +59,8 @@ class Message(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     is_edited = models.BooleanField(default=False)
     is_deleted = models.BooleanField(default=False)
+    # Deprecated: read state lives in ConversationParticipant.last_read_message_id.
+    # Kept until backfill_conversations has migrated existing rows.
     read_by = models.ManyToManyField(
         settings.AUTH_USER_MODEL,
         related_name='read_messages',
@@ -40,4 +71,70 @@ class Message(models.Model):
         return f"Message {self.id} from {self.sender} in conversation {self.conversation.id}"
     
     class Meta:
-        ordering = ['created_at'] 
\ No newline at end of file
+        ordering = ['created_at']
+        indexes = [
+            # History paging walks a conversation by id
+            models.Index(fields=['conversation', 'id']),
+        ]
+
+class ConversationParticipant(models.Model):
+    """
+    Per-participant read watermark: every message with an id up to
+    last_read_message_id counts as read by this user.
+    """
+    conversation = models.ForeignKey(
+        Conversation,
+        on_delete=models.CASCADE,
+        related_name='participant_states'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='conversation_states'
+    )
+    last_read_message_id = models.BigIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['conversation', 'user']
+        indexes = [
+            models.Index(fields=['user', 'conversation']),
+        ]
+
+    def __str__(self):
+        return f"User {self.user_id} read conversation {self.conversation_id} up to {self.last_read_message_id}"
+
+class MessageSearchTerm(models.Model):
+    """Inverted index entry: one row per distinct word of a message"""
+    term = models.CharField(max_length=50)
+    message = models.ForeignKey(
+        Message,
+        on_delete=models.CASCADE,
+        related_name='search_terms'
+    )
+    # Denormalized so searches can be scoped without joining messages
+    conversation_id = models.BigIntegerField()
+
+    class Meta:
+        unique_together = ['term', 'message']
+        indexes = [
+            models.Index(fields=['term', 'conversation_id', 'message']),
+        ]
+
+class MessageOutbox(models.Model):
+    """
+    A saved message whose side effects (socket broadcast, NEW_MESSAGE
+    notifications) have not been dispatched yet. Written in the same
+    transaction as the message and deleted once dispatched.
+    """
+    message = models.OneToOneField(
+        Message,
+        on_delete=models.CASCADE,
+        related_name='outbox_entry'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self):
+        return f"Outbox entry for message {self.message_id}"
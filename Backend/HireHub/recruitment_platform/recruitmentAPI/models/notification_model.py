@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 class Notification(models.Model):
     NOTIFICATION_TYPES = [
@@ -36,15 +37,140 @@ class Notification(models.Model):
     notification_type = models.CharField(max_length=50, choices=NOTIFICATION_TYPES)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    # Inbox sort key: moves forward when a coalesced notification gains an actor
+    updated_at = models.DateTimeField(default=timezone.now)
     is_read = models.BooleanField(default=False)
     related_object_type = models.CharField(max_length=50, null=True, blank=True)
     related_object_id = models.IntegerField(null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, null=True, blank=True)
+    # Coalesced notifications stand for several actors; sender is the most recent one
+    actor_count = models.PositiveIntegerField(default=1)
+    recent_actor_ids = models.JSONField(default=list, blank=True)
+    # Recipient, type, object and window bucket of an unread coalesced notification; cleared on read
+    coalesce_key = models.CharField(max_length=255, null=True, blank=True, unique=True, editable=False)
+    # Set by NotificationService.bulk_create_notifications to find the rows it inserted
+    batch_token = models.UUIDField(null=True, blank=True, editable=False, db_index=True)
 
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['recipient', '-created_at']),
+            models.Index(fields=['recipient', '-updated_at']),
+            models.Index(fields=['recipient', 'is_read']),
+            models.Index(fields=['recipient', 'notification_type', 'related_object_id']),
             models.Index(fields=['notification_type']),
             models.Index(fields=['status']),
-        ] 
\ No newline at end of file
+        ] 
+
+class BroadcastNotification(models.Model):
+    """
+    A notification addressed to every user (e.g. NEW_JOB_POST).
+    Stored once and merged into each inbox at read time.
+    """
+    sender = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='broadcasts_sent',
+        null=True,
+        blank=True
+    )
+    notification_type = models.CharField(max_length=50, choices=Notification.NOTIFICATION_TYPES)
+    content = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    related_object_type = models.CharField(max_length=50, null=True, blank=True)
+    related_object_id = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['notification_type', '-created_at']),
+        ]
+
+
+class BroadcastWatermark(models.Model):
+    """Per-user read watermark: broadcasts created at or before read_until are read"""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='broadcast_watermark'
+    )
+    read_until = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class BroadcastRead(models.Model):
+    """A single broadcast a user marked read ahead of their watermark"""
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='broadcast_reads'
+    )
+    broadcast = models.ForeignKey(
+        BroadcastNotification,
+        on_delete=models.CASCADE,
+        related_name='reads'
+    )
+    read_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['user', 'broadcast']
+
+
+class NotificationFanout(models.Model):
+    """
+    A pending delivery of one notification to all of a sender's followers.
+    last_recipient_id is the resume cursor, advanced with each committed batch.
+    """
+    STATUS_PENDING = 'PENDING'
+    STATUS_DONE = 'DONE'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_DONE, 'Done'),
+    ]
+
+    sender = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_fanouts'
+    )
+    notification_type = models.CharField(max_length=50)
+    content = models.TextField()
+    related_object_type = models.CharField(max_length=50, null=True, blank=True)
+    related_object_id = models.IntegerField(null=True, blank=True)
+    last_recipient_id = models.BigIntegerField(default=0)
+    sent_count = models.PositiveIntegerField(default=0)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+
+class ArchivedNotification(models.Model):
+    """
+    Cold storage for read notifications past their retention period.
+    User ids are kept as plain columns so archiving never cascades or locks the users table.
+    """
+    original_id = models.BigIntegerField(unique=True)
+    recipient_id = models.BigIntegerField()
+    sender_id = models.BigIntegerField(null=True, blank=True)
+    notification_type = models.CharField(max_length=50)
+    content = models.TextField()
+    created_at = models.DateTimeField()
+    related_object_type = models.CharField(max_length=50, null=True, blank=True)
+    related_object_id = models.IntegerField(null=True, blank=True)
+    status = models.CharField(max_length=20, null=True, blank=True)
+    actor_count = models.PositiveIntegerField(default=1)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['recipient_id', '-created_at']),
+        ]
@@ -10,6 +10,19 @@ class Post(models.Model):
         ('none', 'None')
     ]
 
+    MEDIA_STATUS_NONE = 'none'
+    MEDIA_STATUS_PENDING = 'pending'
+    MEDIA_STATUS_PROCESSING = 'processing'
+    MEDIA_STATUS_READY = 'ready'
+    MEDIA_STATUS_FAILED = 'failed'
+    MEDIA_STATUS_CHOICES = [
+        (MEDIA_STATUS_NONE, 'None'),
+        (MEDIA_STATUS_PENDING, 'Pending'),
+        (MEDIA_STATUS_PROCESSING, 'Processing'),
+        (MEDIA_STATUS_READY, 'Ready'),
+        (MEDIA_STATUS_FAILED, 'Failed'),
+    ]
+
     id = models.AutoField(primary_key=True)
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='posts')
     content = models.TextField(blank=True)
@@ -21,10 +34,18 @@ class Post(models.Model):
     media_type = models.CharField(max_length=5, choices=MEDIA_TYPE_CHOICES, default='none')
     image = models.ImageField(upload_to='post_images/%Y/%m/%d/', null=True, blank=True)
     video = models.FileField(upload_to='post_videos/%Y/%m/%d/', null=True, blank=True)
+
+    # Resized/transcoded renditions generated by MediaService
+    media_status = models.CharField(max_length=10, choices=MEDIA_STATUS_CHOICES, default=MEDIA_STATUS_NONE)
+    media_variants = models.JSONField(default=dict, blank=True)
     
     # Cached counts for better performance
     comments_count = models.PositiveIntegerField(default=0)
     likes_count = models.PositiveIntegerField(default=0)
+
+    # Precomputed trending score, refreshed by TrendingService
+    hot_score = models.FloatField(default=0)
+    hot_score_updated_at = models.DateTimeField(null=True, blank=True)
     
     # Add status for soft delete and visibility
     is_active = models.BooleanField(default=True)
@@ -36,6 +57,7 @@ class Post(models.Model):
             BTreeIndex(fields=['-created_at']),
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['is_active', 'is_hidden', '-created_at']),
+            models.Index(fields=['is_active', 'is_hidden', '-hot_score', '-id']),
         ]
 
     def __str__(self):
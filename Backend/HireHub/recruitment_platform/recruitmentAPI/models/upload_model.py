@@ -0,0 +1,60 @@
+import os
+import uuid
+from django.db import models
+from django.conf import settings
+
+class UploadSession(models.Model):
+    """A resumable, chunked upload that is assembled on disk before attaching to a model field"""
+    TARGET_POST_VIDEO = 'post_video'
+    TARGET_CV = 'cv'
+    TARGET_CHOICES = [
+        (TARGET_POST_VIDEO, 'Post Video'),
+        (TARGET_CV, 'CV'),
+    ]
+
+    STATUS_UPLOADING = 'uploading'
+    STATUS_COMPLETE = 'complete'
+    STATUS_ATTACHED = 'attached'
+    STATUS_EXPIRED = 'expired'
+    STATUS_CHOICES = [
+        (STATUS_UPLOADING, 'Uploading'),
+        (STATUS_COMPLETE, 'Complete'),
+        (STATUS_ATTACHED, 'Attached'),
+        (STATUS_EXPIRED, 'Expired'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='upload_sessions'
+    )
+    target = models.CharField(max_length=20, choices=TARGET_CHOICES)
+    file_name = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100)
+    total_size = models.BigIntegerField()
+    received_bytes = models.BigIntegerField(default=0)
+    # Running SHA-256 chained over each chunk's digest, verifiable by the client
+    checksum = models.CharField(max_length=64, blank=True, default='')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_UPLOADING)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'status']),
+            models.Index(fields=['status', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f"Upload {self.id} ({self.target}) by {self.user_id}: {self.received_bytes}/{self.total_size}"
+
+    @property
+    def temp_path(self):
+        upload_dir = getattr(settings, 'CHUNKED_UPLOAD_DIR', os.path.join(settings.MEDIA_ROOT, 'uploads_tmp'))
+        return os.path.join(str(upload_dir), f"{self.id}.part")
+
+    @property
+    def is_complete(self):
+        return self.received_bytes >= self.total_size
@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
-from django.db import models
+from django.db import models, transaction
 from django.apps import apps
+from django.core.cache import cache
 from django.utils import timezone
 import numpy as np  # Import apps to dynamically get models
 
@@ -11,8 +12,32 @@ try:
 except ImportError:
     POSTGRES_AVAILABLE = False
 
+class UserQuerySet(models.QuerySet):
+    # Fields cached in the auth principal (see recruitmentAPI.authentication)
+    PRINCIPAL_FIELDS = {'is_active', 'user_type'}
+
+    def _invalidate_principals(self, user_ids):
+        cache_keys = [User.principal_cache_key(user_id) for user_id in user_ids]
+        if cache_keys:
+            transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+    def update(self, **kwargs):
+        # Bulk deactivations bypass User.save(), so drop the affected principals here
+        if self.PRINCIPAL_FIELDS & kwargs.keys():
+            user_ids = list(self.values_list('id', flat=True))
+            updated = super().update(**kwargs)
+            self._invalidate_principals(user_ids)
+            return updated
+        return super().update(**kwargs)
+
+    def delete(self):
+        user_ids = list(self.values_list('id', flat=True))
+        result = super().delete()
+        self._invalidate_principals(user_ids)
+        return result
+
 # Custom user manager for handling user creation
-class UserManager(BaseUserManager):
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     def create_user(self, email, password=None, **extra_fields):
         """
         Creates and saves a User with the given email and password.
@@ -157,6 +182,24 @@ class User(AbstractBaseUser, PermissionsMixin):
             return self.company_name or self.email
         return f"{self.first_name} {self.last_name}".strip() or self.email
 
+    @staticmethod
+    def principal_cache_key(user_id):
+        """Cache key of the minimal principal used by recruitmentAPI.authentication"""
+        return f"auth:principal:{user_id}"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Drop the cached auth principal (in the shared cache) once the change is visible,
+        # so a concurrent request cannot re-cache the old row before commit
+        cache_key = User.principal_cache_key(self.pk)
+        transaction.on_commit(lambda: cache.delete(cache_key))
+
+    def delete(self, *args, **kwargs):
+        cache_key = User.principal_cache_key(self.pk)
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(lambda: cache.delete(cache_key))
+        return result
+
     @property
     def full_name(self):
         if self.user_type == self.COMPANY_USER:
@@ -0,0 +1,64 @@
+import json
+import urllib.parse
+import logging
+from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.db import database_sync_to_async
+from recruitmentAPI.services.notification_services import NotificationService
+from .message_consumer import get_user_from_token
+
+logger = logging.getLogger(__name__)
+
+class NotificationConsumer(AsyncWebsocketConsumer):
+    """
+    Pushes new notifications and unread count changes to a user's open tabs,
+    replacing polling of the notification list and unread count endpoints.
+    """
+    async def connect(self):
+        token = self.scope['url_route']['kwargs'].get('token')
+        if not token:
+            logger.error("Notification WebSocket connection failed: No token provided")
+            await self.close()
+            return
+
+        try:
+            user = await database_sync_to_async(get_user_from_token)(urllib.parse.unquote(token))
+            if user is None:
+                logger.error("Failed to authenticate notification WebSocket")
+                await self.close()
+                return
+
+            self.user = user
+            self.group_name = NotificationService.user_group(user.id)
+            await self.channel_layer.group_add(self.group_name, self.channel_name)
+            await self.accept()
+
+            # Give the client its starting badge count so it does not need to poll
+            unread_count = await database_sync_to_async(NotificationService.get_unread_count)(user.id)
+            await self.send(text_data=json.dumps({
+                'type': 'unread_count',
+                'unread_count': unread_count
+            }))
+            logger.info(f"Notification WebSocket connected for user {user.id}")
+        except Exception as e:
+            logger.exception(f"Notification WebSocket connection error: {str(e)}")
+            await self.close()
+
+    async def disconnect(self, close_code):
+        if hasattr(self, 'group_name'):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+            logger.info(f"Notification WebSocket disconnected for user {self.user.id}, code: {close_code}")
+
+    async def notification_batch(self, event):
+        """Send new (or newly merged) notifications to WebSocket"""
+        await self.send(text_data=json.dumps({
+            'type': 'new_notifications',
+            'notifications': event['notifications'],
+            'unread_count': event['unread_count']
+        }))
+
+    async def notification_unread_count(self, event):
+        """Send an updated unread count to WebSocket"""
+        await self.send(text_data=json.dumps({
+            'type': 'unread_count',
+            'unread_count': event['unread_count']
+        }))
@@ -32,6 +32,18 @@ class ReplySerializer(serializers.ModelSerializer):
 
     def get_is_liked(self, obj):
 
+        # Shared (cached) payloads get viewer state applied on read
+        if self.context.get('shared'):
+
+            return False
+
+        # Liked ids resolved in one query by CommentService.get_liked_comment_ids
+        liked_ids = self.context.get('liked_comment_ids')
+
+        if liked_ids is not None:
+
+            return obj.id in liked_ids
+
         user = self.context['request'].user
 
         return obj.likes.filter(id=user.id).exists()
@@ -68,6 +80,18 @@ class CommentSerializer(serializers.ModelSerializer):
 
     def get_is_liked(self, obj):
 
+        # Shared (cached) payloads get viewer state applied on read
+        if self.context.get('shared'):
+
+            return False
+
+        # Liked ids resolved in one query by CommentService.get_liked_comment_ids
+        liked_ids = self.context.get('liked_comment_ids')
+
+        if liked_ids is not None:
+
+            return obj.id in liked_ids
+
         user = self.context['request'].user
 
         return obj.likes.filter(id=user.id).exists()
@@ -76,10 +100,13 @@ class CommentSerializer(serializers.ModelSerializer):
 
     def get_replies(self, obj):
 
-        # Get first few replies
+        # Use replies preloaded by CommentService.load_top_replies when available
+
+        replies = getattr(obj, 'limited_replies', None)
+
+        if replies is None:
 
-        replies = obj.replies.select_related('user')\
-            .prefetch_related('likes')[:3]
+            replies = obj.replies.select_related('user')[:3]
 
         return ReplySerializer(
 
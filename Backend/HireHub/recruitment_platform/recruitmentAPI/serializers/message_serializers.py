@@ -23,7 +23,7 @@ class UserBasicSerializer(serializers.ModelSerializer):
 
 class MessageSerializer(serializers.ModelSerializer):
     sender = UserBasicSerializer(read_only=True)
-    read_by = UserBasicSerializer(many=True, read_only=True)
+    read_by = serializers.SerializerMethodField()
     
     class Meta:
         model = Message
@@ -37,20 +37,52 @@ class MessageSerializer(serializers.ModelSerializer):
         message = Message.objects.create(**validated_data)
         return message
 
+    def get_read_by(self, obj):
+        """Ids of the other participants whose read watermark has reached this message"""
+        watermarks = self.context.get('read_watermarks', {})
+        return [
+            user_id for user_id, last_read_id in watermarks.items()
+            if last_read_id >= obj.id and user_id != obj.sender_id
+        ]
+
+class MessageHistorySerializer(MessageSerializer):
+    """Slim history payload: senders are sent once per page, not per message"""
+    sender_id = serializers.IntegerField(read_only=True)
+
+    class Meta(MessageSerializer.Meta):
+        fields = ['id', 'sender_id', 'content', 'created_at',
+                 'is_edited', 'is_deleted', 'read_by', 'conversation']
+
 class ConversationSerializer(serializers.ModelSerializer):
     participants = UserBasicSerializer(many=True, read_only=True)
     last_message = serializers.SerializerMethodField()
+    unread_count = serializers.SerializerMethodField()
+    online_participant_ids = serializers.SerializerMethodField()
     
     class Meta:
         model = Conversation
-        fields = ['id', 'participants', 'created_at', 'updated_at', 'last_message']
-        read_only_fields = ['created_at', 'updated_at']
+        fields = ['id', 'participants', 'created_at', 'updated_at', 'last_message', 'last_activity_at',
+                  'unread_count', 'online_participant_ids']
+        read_only_fields = ['created_at', 'updated_at', 'last_activity_at']
         
     def get_last_message(self, obj):
-        last_message = obj.messages.order_by('-created_at').first()
-        if last_message:
-            return MessageSerializer(last_message).data
-        return None
+        # Rendered from the denormalized summary so the inbox needs no per-row queries
+        if not obj.last_message_id:
+            return None
+        last_activity_at = serializers.DateTimeField().to_representation(obj.last_activity_at)
+        return {
+            'id': obj.last_message_id,
+            'content': obj.last_message_preview,
+            'created_at': last_activity_at,
+            'timestamp': last_activity_at
+        }
+
+    def get_unread_count(self, obj):
+        return self.context.get('unread_counts', {}).get(obj.id, 0)
+
+    def get_online_participant_ids(self, obj):
+        online = self.context.get('online_user_ids', set())
+        return [participant.id for participant in obj.participants.all() if participant.id in online]
 
 class ConversationCreateSerializer(serializers.ModelSerializer):
     participants = serializers.PrimaryKeyRelatedField(
@@ -76,7 +108,11 @@ class ConversationCreateSerializer(serializers.ModelSerializer):
         return value
         
     def create(self, validated_data):
+        from recruitmentAPI.services.message_services import MessageService
+
+        # Reuse the existing conversation for this participant set, if any
         participants = validated_data.pop('participants')
-        conversation = Conversation.objects.create(**validated_data)
-        conversation.participants.set(participants)
-        return conversation 
\ No newline at end of file
+        return MessageService.create_conversation(
+            self.context['request'].user,
+            [participant.id for participant in participants]
+        ) 
\ No newline at end of file
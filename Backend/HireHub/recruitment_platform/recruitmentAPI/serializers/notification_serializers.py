@@ -10,5 +10,15 @@ class NotificationSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'sender', 'notification_type', 'content',
             'related_object_id', 'related_object_type',
-            'is_read', 'created_at', 'status'
-        ] 
\ No newline at end of file
+            'is_read', 'created_at', 'updated_at', 'status',
+            'actor_count', 'recent_actor_ids'
+        ]
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Broadcasts are merged in as unsaved Notifications; give them a distinct id
+        broadcast_id = getattr(instance, 'broadcast_id', None)
+        data['is_broadcast'] = broadcast_id is not None
+        if broadcast_id is not None:
+            data['id'] = f"broadcast-{broadcast_id}"
+        return data
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from recruitmentAPI.serializers.comment_serializers import CommentSerializer
 from recruitmentAPI.models.post_model import Post
 from .user_serializers import UserMinimalSerializer
+from recruitmentAPI.services.media_services import MediaService
 
 class PostListSerializer(serializers.ModelSerializer):
     user = UserMinimalSerializer(read_only=True)
@@ -21,15 +22,29 @@ class PostListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'comments_count', 'likes_count']
 
     def get_is_liked(self, obj):
+        # Shared (cached) payloads get viewer state applied on read
+        if self.context.get('shared'):
+            return False
         user = self.context['request'].user
         return obj.likes.filter(id=user.id).exists()
 
     def get_media_urls(self, obj):
         urls = {}
+        variants = MediaService.get_variant_urls(obj)
         if obj.image:
-            urls['image'] = obj.image.url
+            image_variants = variants.get('image', {})
+            # Serve the resized rendition by default once it exists
+            urls['image'] = image_variants.get('large', obj.image.url)
+            urls['image_original'] = obj.image.url
+            if image_variants:
+                urls['image_variants'] = image_variants
+                urls['thumbnail'] = image_variants.get('thumbnail')
         if obj.video:
-            urls['video'] = obj.video.url
+            video_variants = variants.get('video', {})
+            urls['video'] = video_variants.get('low', obj.video.url)
+            urls['video_original'] = obj.video.url
+            if video_variants.get('poster'):
+                urls['video_poster'] = video_variants['poster']
         return urls
 
     def get_is_recommended(self, obj):
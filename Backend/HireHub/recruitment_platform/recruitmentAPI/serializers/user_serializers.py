@@ -1,5 +1,7 @@
 from rest_framework import serializers
+from urllib.parse import urljoin
 
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
 
 from recruitmentAPI.serializers.json_list_field import JSONListField
@@ -225,7 +227,8 @@ class UserMinimalSerializer(serializers.ModelSerializer):
             request = self.context.get('request')
             if request:
                 return request.build_absolute_uri(obj.profile_picture.url)
-            return obj.profile_picture.url
+            # Socket pushes and background jobs have no request to build from
+            return urljoin(settings.BACKEND_URL, obj.profile_picture.url)
         return None
 
     def to_representation(self, instance):
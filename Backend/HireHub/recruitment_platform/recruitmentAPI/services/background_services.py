@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections, transaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+class BackgroundService:
+    """
+    Runs side effects off the request path.
+
+    Work is handed to a small in-process thread pool once the surrounding
+    transaction commits. Anything that must survive a crash keeps its own
+    progress in the database and is resumed by a management command.
+    """
+    MAX_WORKERS = getattr(settings, 'BACKGROUND_TASK_WORKERS', 4)
+    _executor = None
+
+    @classmethod
+    def get_executor(cls):
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=cls.MAX_WORKERS,
+                thread_name_prefix='hirehub-bg'
+            )
+        return cls._executor
+
+    @staticmethod
+    def run_after_commit(func, *args, **kwargs):
+        """Schedule func(*args, **kwargs) to run in the background after commit"""
+        transaction.on_commit(lambda: BackgroundService.submit(func, *args, **kwargs))
+
+    @classmethod
+    def submit(cls, func, *args, **kwargs):
+        """Run func in the background immediately (or inline when eager)"""
+        if getattr(settings, 'BACKGROUND_TASKS_EAGER', False):
+            return cls._run(func, args, kwargs)
+        return cls.get_executor().submit(cls._run, func, args, kwargs)
+
+    @staticmethod
+    def _run(func, args, kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            logger.exception(f"Background task {getattr(func, '__qualname__', func)} failed: {str(e)}")
+        finally:
+            close_old_connections()
@@ -1,11 +1,14 @@
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
-from django.db.models import Prefetch, F
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 
 from recruitmentAPI.models.comment_model import Comment
 
 from recruitmentAPI.models.post_model import Post
 
-from ..models.notification_model import Notification
+from .notification_services import NotificationService
+from .trending_services import TrendingService
+from .post_services import PostService
 
 
 
@@ -15,6 +18,8 @@ class CommentService:
 
     MAX_REPLY_DEPTH = 1  # Only allow one level of replies
 
+    REPLIES_PREVIEW_LIMIT = 3  # Replies shown inline under each comment
+
 
 
     @staticmethod
@@ -67,17 +72,20 @@ class CommentService:
 
             )
 
+            TrendingService.refresh_post(post.id)
+            PostService.bump_post_version(post.id)
+
             
 
             # Create notification for post owner
 
             if post.user_id != user.id:  # Don't notify if user comments on their own post
 
-                Notification.objects.create(
+                NotificationService.create_notification(
 
-                    recipient_id=post.user_id,
+                    recipient=post.user_id,
 
-                    sender_id=user.id,
+                    sender=user.id,
 
                     notification_type='POST_COMMENT',
 
@@ -124,12 +132,14 @@ class CommentService:
                 content=content,
                 parent_comment=parent_comment
             )
+            TrendingService.refresh_post(parent_comment.post_id)
+            PostService.bump_post_version(parent_comment.post_id)
 
             # Create notification for comment owner
             if parent_comment.user_id != user.id:  # Don't notify if user replies to their own comment
-                Notification.objects.create(
-                    recipient_id=parent_comment.user_id,
-                    sender_id=user.id,
+                NotificationService.create_notification(
+                    recipient=parent_comment.user_id,
+                    sender=user.id,
                     notification_type='COMMENT_REPLY',
                     content='replied to your comment',
                     related_object_id=parent_comment.post.id,
@@ -146,7 +156,56 @@ class CommentService:
 
 
     @staticmethod
-    def get_comments_paginated(post_id, cursor=None, limit=10):
+    def load_top_replies(comments, limit=REPLIES_PREVIEW_LIMIT):
+        """
+        Attach the newest `limit` replies of every comment as `limited_replies`
+        using a single ROW_NUMBER() OVER (PARTITION BY parent_comment_id) query.
+        """
+        comments_by_id = {comment.id: comment for comment in comments}
+        for comment in comments:
+            comment.limited_replies = []
+
+        if not comments_by_id:
+            return comments
+
+        replies = Comment.objects.filter(
+            parent_comment_id__in=list(comments_by_id)
+        ).annotate(
+            reply_rank=Window(
+                expression=RowNumber(),
+                partition_by=[F('parent_comment_id')],
+                order_by=[F('created_at').desc(), F('id').desc()]
+            )
+        ).filter(
+            reply_rank__lte=limit
+        ).select_related('user').order_by('parent_comment_id', 'reply_rank')
+
+        for reply in replies:
+            comments_by_id[reply.parent_comment_id].limited_replies.append(reply)
+
+        return comments
+
+    @staticmethod
+    def get_liked_comment_ids(user, comments):
+        """Ids of the given comments (and their loaded replies) liked by the user, in one query"""
+        if not user or not user.is_authenticated:
+            return set()
+
+        comment_ids = []
+        for comment in comments:
+            comment_ids.append(comment.id)
+            comment_ids.extend(reply.id for reply in getattr(comment, 'limited_replies', []))
+
+        if not comment_ids:
+            return set()
+
+        return set(Comment.likes.through.objects.filter(
+            comment_id__in=comment_ids,
+            user_id=user.id
+        ).values_list('comment_id', flat=True))
+
+    @staticmethod
+    def get_comments_paginated(post_id, cursor=None, limit=10, user=None):
         """Get paginated comments for a post"""
         try:
             # Verify post exists
@@ -157,16 +216,7 @@ class CommentService:
             base_comments = Comment.objects.filter(
                 post_id=post_id,
                 parent_comment=None
-            ).select_related('user')\
-.prefetch_related(
-                'likes',
-                Prefetch(
-                    'replies',
-                    queryset=Comment.objects.select_related('user')\
-                                         .prefetch_related('likes')\
-                                         .order_by('-created_at')
-                )
-            ).order_by('-created_at')
+            ).select_related('user').order_by('-created_at')
 
             # Apply cursor pagination
             if cursor:
@@ -180,16 +230,15 @@ class CommentService:
             if has_next:
                 paginated_comments.pop()
 
-            # For each comment, get limited replies using list slicing after evaluation
-            for comment in paginated_comments:
-                replies_list = list(comment.replies.all())
-                comment.limited_replies = replies_list[:3]
+            # Load the first few replies of every comment on the page in one query
+            CommentService.load_top_replies(paginated_comments)
 
             next_cursor = paginated_comments[-1].created_at.isoformat() if has_next and paginated_comments else None
 
             return {
                 'comments': paginated_comments,
-                'next_cursor': next_cursor
+                'next_cursor': next_cursor,
+                'liked_comment_ids': CommentService.get_liked_comment_ids(user, paginated_comments)
             }
         except Exception as e:
             raise ValueError(str(e))
@@ -285,11 +334,11 @@ class CommentService:
 
                 if comment.user_id != user.id:  # Don't notify if user likes their own comment
 
-                    Notification.objects.create(
+                    NotificationService.create_notification(
 
-                        recipient_id=comment.user_id,
+                        recipient=comment.user_id,
 
-                        sender_id=user.id,
+                        sender=user.id,
 
                         notification_type='COMMENT_LIKE',
 
@@ -301,7 +350,7 @@ class CommentService:
 
                     )
 
-            
+            PostService.bump_post_version(comment.post_id)
 
             return comment, action
 
@@ -328,6 +377,7 @@ class CommentService:
             # Update comment
             comment.content = content
             comment.save()
+            PostService.bump_post_version(comment.post_id)
             
             return comment
         except Comment.DoesNotExist:
@@ -387,6 +437,8 @@ class CommentService:
             # Update post's comment count
             post.comments_count = F('comments_count') - 1
             post.save()
+            TrendingService.refresh_post(post.id)
+            PostService.bump_post_version(post.id)
             
             return True
             
@@ -1,5 +1,5 @@
 from ..models.connection_model import ConnectionRequest
-from ..models.notification_model import Notification
+from .notification_services import NotificationService
 from django.core.exceptions import ValidationError
 import logging
 from django.utils import timezone
@@ -39,9 +39,9 @@ class ConnectionService:
                 )
 
             # Create notification for receiver
-            Notification.objects.create(
-                recipient_id=receiver_id,
-                sender_id=sender_id,
+            NotificationService.create_notification(
+                recipient=receiver_id,
+                sender=sender_id,
                 notification_type='CONNECTION_REQUEST',
                 content='sent you a connection request',
                 related_object_id=connection_request.id,
@@ -67,9 +67,9 @@ class ConnectionService:
 
             # Create notification for sender if request is accepted
             if action.upper() == 'ACCEPT':
-                Notification.objects.create(
-                    recipient_id=request.sender_id,
-                    sender_id=user_id,
+                NotificationService.create_notification(
+                    recipient=request.sender_id,
+                    sender=user_id,
                     notification_type='CONNECTION_ACCEPTED',
                     content='accepted your connection request',
                     related_object_id=request_id,
@@ -18,6 +18,14 @@ class JobMatchingService:
             return ' '.join(str(item).lower().strip() for item in text if item)
         return text.lower().strip() if text else ""
 
+    @classmethod
+    def build_job_text(cls, job):
+        """Text used to embed a job; title and skills are repeated for extra weight"""
+        job_skills = cls.normalize_text(job.required_skills)
+        job_title = cls.normalize_text(job.title)
+        job_desc = cls.normalize_text(job.description)
+        return f"{job_title} {job_title} {job_desc} {job_skills} {job_skills}"
+
     @classmethod
     def calculate_match_score(cls, job, user):
         """Calculate match score between a job and a user using embeddings"""
@@ -30,9 +38,8 @@ class JobMatchingService:
             # Get job text combining title, description and skills
             job_skills = cls.normalize_text(job.required_skills)
             job_title = cls.normalize_text(job.title)
-            job_desc = cls.normalize_text(job.description)
             # Give more weight to title and skills
-            job_text = f"{job_title} {job_title} {job_desc} {job_skills} {job_skills}"
+            job_text = cls.build_job_text(job)
             
             print(f"\n=== Calculating Match Score for Job {job.id} ===")
             print(f"Job Title: {job_title}")
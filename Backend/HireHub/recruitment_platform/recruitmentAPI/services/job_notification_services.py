@@ -0,0 +1,139 @@
+import json
+import numpy as np
+from django.conf import settings
+from django.db.models import Count
+from django.utils import timezone
+from ..models.job_model import JobPost
+from ..models.notification_model import Notification
+from ..models.user_model import User
+from .background_services import BackgroundService
+from .job_matching_service import JobMatchingService
+from .notification_services import NotificationService
+import logging
+
+logger = logging.getLogger(__name__)
+
+class JobNotificationService:
+    """
+    Sends NEW_JOB_POST notifications only to the candidates whose profile
+    embeddings best match a new job, instead of to every user.
+    """
+    TOP_K = getattr(settings, 'JOB_NOTIFICATION_TOP_K', 200)
+    MIN_SCORE = getattr(settings, 'JOB_NOTIFICATION_MIN_SCORE', 0.45)  # cosine similarity
+    DAILY_CAP = getattr(settings, 'JOB_NOTIFICATION_DAILY_CAP', 5)  # per user
+    BATCH_SIZE = 2000
+
+    @staticmethod
+    def schedule(job):
+        """Run candidate matching once the job posting has committed"""
+        BackgroundService.run_after_commit(JobNotificationService.notify_matched_candidates, job.id)
+
+    @staticmethod
+    def _normalize(matrix):
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    @staticmethod
+    def find_top_candidates(job, limit):
+        """
+        Score every candidate embedding against the job in batches and keep
+        the best `limit` above MIN_SCORE. Returns [(user_id, score)], best first.
+        """
+        model = JobMatchingService.get_model()
+        job_vector = JobNotificationService._normalize(
+            np.asarray(model.encode(JobMatchingService.build_job_text(job)), dtype=np.float32)
+        )
+
+        candidates = User.objects.filter(
+            is_active=True,
+            user_type=User.NORMAL_USER,
+            profile_embedding__isnull=False
+        ).exclude(
+            id=job.posted_by_id
+        ).values_list('id', 'profile_embedding')
+
+        best_ids = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+
+        def score_batch(ids, vectors):
+            nonlocal best_ids, best_scores
+            scores = JobNotificationService._normalize(np.asarray(vectors, dtype=np.float32)) @ job_vector
+            keep = scores >= JobNotificationService.MIN_SCORE
+            best_ids = np.concatenate([best_ids, np.asarray(ids, dtype=np.int64)[keep]])
+            best_scores = np.concatenate([best_scores, scores[keep]])
+            if len(best_scores) > limit:
+                top = np.argpartition(-best_scores, limit)[:limit]
+                best_ids, best_scores = best_ids[top], best_scores[top]
+
+        ids, vectors = [], []
+        for user_id, embedding in candidates.iterator(chunk_size=JobNotificationService.BATCH_SIZE):
+            try:
+                vector = json.loads(embedding)
+            except (TypeError, ValueError):
+                continue
+            if len(vector) != len(job_vector):
+                continue
+            ids.append(user_id)
+            vectors.append(vector)
+            if len(ids) >= JobNotificationService.BATCH_SIZE:
+                score_batch(ids, vectors)
+                ids, vectors = [], []
+        if ids:
+            score_batch(ids, vectors)
+
+        order = np.argsort(-best_scores)
+        return [(int(best_ids[i]), float(best_scores[i])) for i in order]
+
+    @staticmethod
+    def _over_daily_cap(user_ids):
+        """Users who already received DAILY_CAP job notifications today"""
+        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return set(
+            Notification.objects.filter(
+                recipient_id__in=user_ids,
+                notification_type='NEW_JOB_POST',
+                created_at__gte=today_start
+            ).values('recipient_id').annotate(
+                received=Count('id')
+            ).filter(
+                received__gte=JobNotificationService.DAILY_CAP
+            ).values_list('recipient_id', flat=True)
+        )
+
+    @staticmethod
+    def notify_matched_candidates(job_id):
+        """Notify the top-K best matched candidates about a new job"""
+        try:
+            job = JobPost.objects.select_related('posted_by').get(id=job_id)
+        except JobPost.DoesNotExist:
+            return 0
+
+        # Over-select so capped users can be skipped without a second pass
+        matches = JobNotificationService.find_top_candidates(job, JobNotificationService.TOP_K * 2)
+        capped = JobNotificationService._over_daily_cap([user_id for user_id, _ in matches])
+        recipients = [user_id for user_id, _ in matches if user_id not in capped][:JobNotificationService.TOP_K]
+
+        Notification.objects.bulk_create([
+            Notification(
+                recipient_id=recipient_id,
+                sender=job.posted_by,
+                notification_type='NEW_JOB_POST',
+                content=f'posted a new job that matches your profile: {job.title}',
+                related_object_id=job.id,
+                related_object_type='JobPost'
+            )
+            for recipient_id in recipients
+        ], batch_size=500)
+        # MySQL does not return primary keys from bulk_create
+        created = list(Notification.objects.filter(
+            recipient_id__in=recipients,
+            notification_type='NEW_JOB_POST',
+            related_object_id=job.id,
+            related_object_type='JobPost'
+        ).values_list('recipient_id', 'id'))
+        NotificationService.increment_unread(created)
+        NotificationService.schedule_push([notification_id for _, notification_id in created])
+
+        logger.info(f"Notified {len(recipients)} matched candidates about job {job_id} ({len(capped)} capped)")
+        return len(recipients)
@@ -5,12 +5,15 @@ from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.models import Q, F, Case, When, IntegerField
 from django.core.cache import cache
+from django.conf import settings
 from ..models.job_model import JobPost
 from ..models import User
 from ..serializers.job_serializers import JobResponseSerializer, CreateJobSerializer
 from .quiz_services import QuizService
-from ..models.notification_model import Notification
+from .notification_services import NotificationService
+from .job_notification_services import JobNotificationService
 from .job_matching_service import JobMatchingService
+from .trending_services import TrendingService
 import re
 import logging
 
@@ -19,6 +22,10 @@ logger = logging.getLogger(__name__)
 class JobService:
     JOBS_PER_PAGE = 10
     CACHE_TTL = 300  # 5 minutes
+    SORT_RECENT = 'recent'
+    SORT_TRENDING = 'trending'
+    # 'targeted' notifies top matched candidates, 'broadcast' notifies everyone
+    JOB_NOTIFICATION_MODE = getattr(settings, 'JOB_NOTIFICATION_MODE', 'targeted')
 
     @staticmethod
     @transaction.atomic
@@ -51,22 +58,20 @@ class JobService:
         )
         
         job.save()
+        TrendingService.refresh_job(job.id)
 
-        # Create notifications for all users
-        users = User.objects.exclude(id=user_id).filter(is_active=True)
-        notifications = [
-            Notification(
-                recipient=recipient,
+        if JobService.JOB_NOTIFICATION_MODE == 'broadcast':
+            # One broadcast row reaches every user's inbox at read time
+            NotificationService.create_broadcast(
                 sender=user,
                 notification_type='NEW_JOB_POST',
                 content=f'posted a new job: {job.title}',
                 related_object_id=job.id,
                 related_object_type='JobPost'
             )
-            for recipient in users
-        ]
-        if notifications:
-            Notification.objects.bulk_create(notifications)
+        else:
+            # Notify only the best matched candidates, after commit and off the request path
+            JobNotificationService.schedule(job)
 
         # Generate quiz for the job
         QuizService.generate_quiz(job.id)
@@ -82,8 +87,12 @@ class JobService:
         return res
 
     @staticmethod
-    def search_jobs(filters: Dict, cursor=None, limit=JOBS_PER_PAGE, user=None) -> Dict:
-        """Search for jobs with filters and cursor-based pagination."""
+    def search_jobs(filters: Dict, cursor=None, limit=JOBS_PER_PAGE, user=None, sort=SORT_RECENT) -> Dict:
+        """Search for jobs with filters and cursor-based pagination.
+
+        sort='trending' orders by the precomputed hot_score instead of recency.
+        """
+        trending = sort == JobService.SORT_TRENDING
         try:
             print("\n=== Job Search Debug ===")
             print(f"Filters received: {filters}")
@@ -174,7 +183,11 @@ class JobService:
                     print("Not filtering by followed companies")
 
             # Execute query
-            jobs = JobPost.objects.filter(query).select_related('posted_by').order_by('-created_at')
+            jobs = JobPost.objects.filter(query).select_related('posted_by')
+            if trending:
+                jobs = jobs.order_by('-hot_score', '-id')
+            else:
+                jobs = jobs.order_by('-created_at')
             print(f"SQL Query: {jobs.query}")
 
             # Calculate recommendations if user is normal type
@@ -183,7 +196,12 @@ class JobService:
                 recommendations = JobService.calculate_job_recommendations(jobs, user)
 
             # Apply cursor pagination
-            if cursor:
+            if cursor and trending:
+                decoded = TrendingService.decode_cursor(cursor)
+                if decoded:
+                    score, last_id = decoded
+                    jobs = jobs.filter(Q(hot_score__lt=score) | Q(hot_score=score, id__lt=last_id))
+            elif cursor:
                 try:
                     cursor_date = datetime.fromisoformat(cursor.replace('Z', '+00:00'))
                     jobs = jobs.filter(created_at__lt=cursor_date)
@@ -199,7 +217,10 @@ class JobService:
             # Prepare next cursor
             next_cursor = None
             if has_next and result_jobs:
-                next_cursor = result_jobs[-1].created_at.isoformat()
+                if trending:
+                    next_cursor = TrendingService.encode_cursor(result_jobs[-1])
+                else:
+                    next_cursor = result_jobs[-1].created_at.isoformat()
 
             # Serialize results
             serialized_jobs = JobResponseSerializer(result_jobs, many=True).data
@@ -290,6 +311,8 @@ class JobService:
                 through_defaults={'saved_at': timezone.now(), 'expires_at': timezone.now() + timezone.timedelta(days=30)}
             )
 
+            TrendingService.refresh_job(job_id)
+
             # Invalidate relevant caches
             cache.delete_many([
                 f'job:detail:{job_id}',
@@ -312,6 +335,7 @@ class JobService:
                 job.negative_feedback_count = F('negative_feedback_count') + 1
             
             job.save(update_fields=['positive_feedback_count', 'negative_feedback_count'])
+            TrendingService.refresh_job(job_id)
             
             # Invalidate job cache
             cache.delete(f'job:detail:{job_id}')
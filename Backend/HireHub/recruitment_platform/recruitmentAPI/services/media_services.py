@@ -0,0 +1,197 @@
+import os
+import shutil
+import subprocess
+import tempfile
+from io import BytesIO
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+from ..models.post_model import Post
+from .background_services import BackgroundService
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MediaService:
+    """
+    Background pipeline that derives smaller renditions of post media.
+
+    Variant storage names are kept in ``Post.media_variants`` so serializers
+    can hand out compact URLs instead of the original upload.
+    """
+    IMAGE_WIDTHS = {'large': 1280, 'medium': 640}
+    THUMBNAIL_SIZE = (320, 320)
+    WEBP_QUALITY = 80
+    JPEG_QUALITY = 82
+    VIDEO_HEIGHT = 480
+    VIDEO_BITRATE = '800k'
+    AUDIO_BITRATE = '96k'
+    FFMPEG_BINARY = getattr(settings, 'FFMPEG_BINARY', 'ffmpeg')
+    FFMPEG_TIMEOUT = 600  # seconds
+    VARIANTS_DIR = 'post_media_variants'
+
+    @staticmethod
+    def schedule_post_media(post):
+        """Queue variant generation for a post once the upload is committed"""
+        if post.media_type == 'none':
+            return
+        MediaService.delete_variants(post)
+        Post.objects.filter(id=post.id).update(media_status=Post.MEDIA_STATUS_PENDING, media_variants={})
+        post.media_status = Post.MEDIA_STATUS_PENDING
+        post.media_variants = {}
+        BackgroundService.run_after_commit(MediaService.process_post_media, post.id)
+
+    @staticmethod
+    def process_post_media(post_id):
+        """Generate every variant for a post's image and video"""
+        from .post_services import PostService
+
+        try:
+            post = Post.objects.get(id=post_id)
+        except Post.DoesNotExist:
+            return None
+
+        Post.objects.filter(id=post_id).update(media_status=Post.MEDIA_STATUS_PROCESSING)
+        PostService.bump_post_version(post_id)
+        MediaService.delete_variants(post)
+
+        variants = {}
+        try:
+            if post.image:
+                variants['image'] = MediaService._process_image(post)
+            if post.video:
+                video_variants = MediaService._process_video(post)
+                if video_variants:
+                    variants['video'] = video_variants
+        except Exception as e:
+            logger.exception(f"Media processing failed for post {post_id}: {str(e)}")
+            Post.objects.filter(id=post_id).update(media_status=Post.MEDIA_STATUS_FAILED, media_variants=variants)
+            PostService.bump_post_version(post_id)
+            return None
+
+        Post.objects.filter(id=post_id).update(media_status=Post.MEDIA_STATUS_READY, media_variants=variants)
+        # The cached post detail still carries the old status and URLs
+        PostService.bump_post_version(post_id)
+        logger.info(f"Generated media variants for post {post_id}: {variants}")
+        return variants
+
+    @staticmethod
+    def _variant_name(post, filename):
+        return f"{MediaService.VARIANTS_DIR}/{post.id}/{filename}"
+
+    @staticmethod
+    def _save_image(post, image, filename, fmt, **options):
+        buffer = BytesIO()
+        image.save(buffer, format=fmt, **options)
+        return default_storage.save(MediaService._variant_name(post, filename), ContentFile(buffer.getvalue()))
+
+    @staticmethod
+    def _process_image(post):
+        """Resize to each target width, encode as WebP and build a square thumbnail"""
+        variants = {}
+        with post.image.open('rb') as source:
+            original = Image.open(source)
+            original.load()
+
+        original = ImageOps.exif_transpose(original)
+        if original.mode not in ('RGB', 'RGBA'):
+            original = original.convert('RGBA' if 'transparency' in original.info else 'RGB')
+
+        for name, width in MediaService.IMAGE_WIDTHS.items():
+            resized = original.copy()
+            if resized.width > width:
+                resized.thumbnail((width, width * 4), Image.LANCZOS)
+            variants[name] = MediaService._save_image(
+                post, resized, f"{name}.webp", 'WEBP', quality=MediaService.WEBP_QUALITY, method=4
+            )
+
+        # JPEG fallback for clients without WebP support
+        fallback = original.copy()
+        medium_width = MediaService.IMAGE_WIDTHS['medium']
+        if fallback.width > medium_width:
+            fallback.thumbnail((medium_width, medium_width * 4), Image.LANCZOS)
+        variants['medium_jpeg'] = MediaService._save_image(
+            post, fallback.convert('RGB'), 'medium.jpg', 'JPEG',
+            quality=MediaService.JPEG_QUALITY, optimize=True, progressive=True
+        )
+
+        thumbnail = ImageOps.fit(original, MediaService.THUMBNAIL_SIZE, Image.LANCZOS)
+        variants['thumbnail'] = MediaService._save_image(
+            post, thumbnail, 'thumbnail.webp', 'WEBP', quality=MediaService.WEBP_QUALITY
+        )
+        return variants
+
+    @staticmethod
+    def ffmpeg_available():
+        return shutil.which(MediaService.FFMPEG_BINARY) is not None
+
+    @staticmethod
+    def _process_video(post):
+        """Extract a poster frame and a lower-bitrate H.264 rendition with ffmpeg"""
+        if not MediaService.ffmpeg_available():
+            logger.info(f"ffmpeg not found, skipping video variants for post {post.id}")
+            return {}
+
+        variants = {}
+        with tempfile.TemporaryDirectory() as workdir:
+            source_path = os.path.join(workdir, 'source')
+            with post.video.open('rb') as source, open(source_path, 'wb') as target:
+                shutil.copyfileobj(source, target)
+
+            poster_path = os.path.join(workdir, 'poster.jpg')
+            MediaService._run_ffmpeg([
+                '-ss', '1', '-i', source_path,
+                '-frames:v', '1',
+                '-vf', f"scale=-2:'min({MediaService.VIDEO_HEIGHT},ih)'",
+                poster_path
+            ])
+            if os.path.exists(poster_path):
+                with open(poster_path, 'rb') as poster:
+                    variants['poster'] = default_storage.save(
+                        MediaService._variant_name(post, 'poster.jpg'), ContentFile(poster.read())
+                    )
+
+            low_path = os.path.join(workdir, 'low.mp4')
+            MediaService._run_ffmpeg([
+                '-i', source_path,
+                '-vf', f"scale=-2:'min({MediaService.VIDEO_HEIGHT},ih)'",
+                '-c:v', 'libx264', '-preset', 'veryfast', '-b:v', MediaService.VIDEO_BITRATE,
+                '-c:a', 'aac', '-b:a', MediaService.AUDIO_BITRATE,
+                '-movflags', '+faststart',
+                low_path
+            ])
+            if os.path.exists(low_path):
+                with open(low_path, 'rb') as low:
+                    variants['low'] = default_storage.save(
+                        MediaService._variant_name(post, 'low.mp4'), ContentFile(low.read())
+                    )
+
+        return variants
+
+    @staticmethod
+    def _run_ffmpeg(args):
+        command = [MediaService.FFMPEG_BINARY, '-y', '-loglevel', 'error'] + args
+        result = subprocess.run(command, capture_output=True, timeout=MediaService.FFMPEG_TIMEOUT)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {result.stderr.decode(errors='ignore')[:500]}")
+
+    @staticmethod
+    def delete_variants(post):
+        """Remove previously generated variant files for a post"""
+        for group in (post.media_variants or {}).values():
+            for name in group.values():
+                try:
+                    default_storage.delete(name)
+                except Exception as e:
+                    logger.warning(f"Could not delete media variant {name}: {str(e)}")
+
+    @staticmethod
+    def get_variant_urls(post):
+        """Map variant names to public URLs for the serializers"""
+        if post.media_status != Post.MEDIA_STATUS_READY:
+            return {}
+        return {
+            media: {name: default_storage.url(path) for name, path in group.items()}
+            for media, group in (post.media_variants or {}).items()
+        }
@@ -0,0 +1,123 @@
+import html
+import re
+from django.db.models import Count
+from ..models.message_model import Conversation, Message, MessageSearchTerm
+import logging
+
+logger = logging.getLogger(__name__)
+
+class MessageSearchService:
+    """
+    Full-text search over a user's chat history, backed by an inverted index
+    (MessageSearchTerm) that MessageService keeps current as messages change.
+    """
+    TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+    MIN_TERM_LENGTH = 2
+    MAX_TERM_LENGTH = 50
+    MAX_QUERY_TERMS = 8
+    SNIPPET_RADIUS = 60
+    PAGE_SIZE = 20
+
+    @staticmethod
+    def tokenize(text):
+        """
+        Distinct lower-cased words, in order of first appearance. Words longer than
+        MAX_TERM_LENGTH are indexed by their prefix, so they are deduplicated after truncation.
+        """
+        terms = []
+        seen = set()
+        for match in MessageSearchService.TOKEN_PATTERN.finditer((text or '').lower()):
+            term = match.group()[:MessageSearchService.MAX_TERM_LENGTH]
+            if len(term) < MessageSearchService.MIN_TERM_LENGTH or term in seen:
+                continue
+            seen.add(term)
+            terms.append(term)
+        return terms
+
+    @staticmethod
+    def index_messages(messages):
+        """Add index rows for new messages (deleted messages are never indexed)"""
+        MessageSearchTerm.objects.bulk_create([
+            MessageSearchTerm(term=term, message_id=message.id, conversation_id=message.conversation_id)
+            for message in messages if not message.is_deleted
+            for term in MessageSearchService.tokenize(message.content)
+        ], ignore_conflicts=True)
+
+    @staticmethod
+    def reindex_message(message):
+        """Replace a message's index rows after an edit or delete"""
+        MessageSearchTerm.objects.filter(message_id=message.id).delete()
+        MessageSearchService.index_messages([message])
+
+    @staticmethod
+    def highlight(content, terms):
+        """HTML-escaped snippet around the first match, with matched words wrapped in <mark>"""
+        # A term at MAX_TERM_LENGTH is a truncated prefix, so it matches the rest of its word too
+        pattern = re.compile(
+            r'\b(' + '|'.join(
+                re.escape(term) + (r'\w*' if len(term) >= MessageSearchService.MAX_TERM_LENGTH else '')
+                for term in terms
+            ) + r')\b',
+            re.IGNORECASE | re.UNICODE
+        )
+        first = pattern.search(content)
+        start = max((first.start() if first else 0) - MessageSearchService.SNIPPET_RADIUS, 0)
+        end = min((first.end() if first else 0) + MessageSearchService.SNIPPET_RADIUS, len(content))
+        snippet = content[start:end]
+
+        parts = []
+        position = 0
+        for match in pattern.finditer(snippet):
+            parts.append(html.escape(snippet[position:match.start()]))
+            parts.append(f"<mark>{html.escape(match.group())}</mark>")
+            position = match.end()
+        parts.append(html.escape(snippet[position:]))
+        return ('…' if start else '') + ''.join(parts) + ('…' if end < len(content) else '')
+
+    @staticmethod
+    def search(user, query, before_id=None, limit=None):
+        """
+        Messages in the user's conversations containing every word of the query,
+        newest first. Keyset-paginated on message id; returns (results, next_before_id).
+        """
+        limit = min(limit or MessageSearchService.PAGE_SIZE, 100)
+        terms = MessageSearchService.tokenize(query)[:MessageSearchService.MAX_QUERY_TERMS]
+        if not terms:
+            return [], None
+
+        user_conversations = Conversation.participants.through.objects.filter(
+            user_id=user.id
+        ).values('conversation_id')
+        matches = MessageSearchTerm.objects.filter(
+            term__in=terms,
+            conversation_id__in=user_conversations
+        )
+        if before_id is not None:
+            matches = matches.filter(message_id__lt=before_id)
+
+        # A message matches when it has a row for every query term
+        message_ids = list(
+            matches.values('message_id').annotate(
+                matched=Count('term')
+            ).filter(
+                matched=len(terms)
+            ).order_by('-message_id').values_list('message_id', flat=True)[:limit + 1]
+        )
+        has_more = len(message_ids) > limit
+        message_ids = message_ids[:limit]
+
+        messages = Message.objects.filter(
+            id__in=message_ids,
+            is_deleted=False
+        ).order_by('-id')
+        results = [
+            {
+                'id': message.id,
+                'conversation_id': message.conversation_id,
+                'sender_id': message.sender_id,
+                'created_at': message.created_at,
+                'highlight': MessageSearchService.highlight(message.content, terms)
+            }
+            for message in messages
+        ]
+        return results, (message_ids[-1] if has_more else None)
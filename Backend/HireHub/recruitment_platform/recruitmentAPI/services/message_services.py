@@ -1,18 +1,66 @@
-from django.db.models import Q
-from recruitmentAPI.models import Conversation, Message, User
+from django.db.models import Count, F, Max, Q
+from recruitmentAPI.models import Conversation, Message, User, ConversationParticipant, MessageOutbox, Notification
 from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
 import json
 from django.db import transaction
 from recruitmentAPI.services.notification_services import NotificationService
+from recruitmentAPI.services.message_search_services import MessageSearchService
+from recruitmentAPI.services.background_services import BackgroundService
 from django.utils import timezone
 from datetime import timedelta
 
 class MessageService:
+    HISTORY_PAGE_SIZE = 50
+    HISTORY_MAX_PAGE_SIZE = 200
+    OUTBOX_BATCH_SIZE = 500
+
+    @staticmethod
+    def user_group(user_id):
+        """Channel layer group that every chat socket of a user joins"""
+        return f"chat_user_{user_id}"
+
+    @staticmethod
+    def broadcast_to_participants(conversation_id, event):
+        """Deliver a chat event to each participant's user group"""
+        channel_layer = get_channel_layer()
+        participant_ids = Conversation.participants.through.objects.filter(
+            conversation_id=conversation_id
+        ).values_list('user_id', flat=True)
+        for participant_id in participant_ids:
+            async_to_sync(channel_layer.group_send)(MessageService.user_group(participant_id), event)
+
     @staticmethod
     def get_user_conversations(user):
-        """Get all conversations for a user"""
-        return Conversation.objects.filter(participants=user).prefetch_related('participants')
+        """Get all conversations for a user, most recently active first"""
+        return Conversation.objects.filter(participants=user).prefetch_related('participants').order_by(
+            F('last_activity_at').desc(nulls_last=True), '-updated_at'
+        )
+
+    @staticmethod
+    def build_preview(message):
+        return message.content[:Conversation.PREVIEW_LENGTH]
+
+    @staticmethod
+    def set_last_message(message):
+        """Point the conversation summary at a new message, unless a newer one already won"""
+        Conversation.objects.filter(
+            Q(last_message__isnull=True) | Q(last_message_id__lt=message.id),
+            id=message.conversation_id
+        ).update(
+            last_message=message,
+            last_message_preview=MessageService.build_preview(message),
+            last_activity_at=message.created_at,
+            updated_at=timezone.now()
+        )
+
+    @staticmethod
+    def refresh_last_message_preview(message):
+        """Re-sync the preview after the conversation's newest message is edited or deleted"""
+        Conversation.objects.filter(
+            id=message.conversation_id,
+            last_message_id=message.id
+        ).update(last_message_preview=MessageService.build_preview(message))
     
     @staticmethod
     def get_conversation_messages(conversation_id, user):
@@ -23,81 +71,195 @@ class MessageService:
         except Conversation.DoesNotExist:
             return None
     
+    @staticmethod
+    def get_message_page(conversation, before_id=None, after_id=None, limit=None):
+        """
+        One page of history in ascending order, walked by id.
+        before_id pages backwards (older), after_id forwards (newer); with
+        neither, the newest page is returned. has_more refers to the paging direction.
+        """
+        limit = min(limit or MessageService.HISTORY_PAGE_SIZE, MessageService.HISTORY_MAX_PAGE_SIZE)
+        messages = Message.objects.filter(conversation=conversation)
+
+        if after_id is not None:
+            page = list(messages.filter(id__gt=after_id).order_by('id')[:limit + 1])
+            has_more = len(page) > limit
+            page = page[:limit]
+        else:
+            if before_id is not None:
+                messages = messages.filter(id__lt=before_id)
+            page = list(messages.order_by('-id')[:limit + 1])
+            has_more = len(page) > limit
+            page = page[:limit][::-1]
+        return page, has_more
+
     @staticmethod
     def create_conversation(user, participant_ids):
-        """Create a new conversation with the given participants"""
-        # Check if a conversation with exactly these participants already exists
-        participants = list(User.objects.filter(id__in=participant_ids))
-        participants.append(user)
-        participants = list(set(participants))  # Remove duplicates
-        
-        # Check if a conversation with EXACTLY these participants exists
-        existing_conversations = Conversation.objects.all()
-        for conversation in existing_conversations:
-            conv_participants = set(conversation.participants.all())
-            if set(participants) == conv_participants:
-                return conversation
-        
-        # If no existing conversation found, create a new one
-        conversation = Conversation.objects.create()
-        conversation.participants.set(participants)
+        """Get the conversation with exactly these participants, creating it if needed"""
+        participant_ids = set(
+            User.objects.filter(id__in=participant_ids).values_list('id', flat=True)
+        )
+        participant_ids.add(user.id)
+        participant_key = Conversation.build_participant_key(participant_ids)
+
+        # The unique participant_key makes concurrent creates resolve to one row
+        with transaction.atomic():
+            conversation, created = Conversation.objects.get_or_create(participant_key=participant_key)
+            if created:
+                conversation.participants.set(participant_ids)
+                ConversationParticipant.objects.bulk_create([
+                    ConversationParticipant(conversation=conversation, user_id=participant_id)
+                    for participant_id in participant_ids
+                ])
         return conversation
     
     @staticmethod
-    def create_message(user, conversation_id, content):
-        """Create a new message in the conversation"""
-        try:
-            conversation = Conversation.objects.get(id=conversation_id, participants=user)
-            message = Message.objects.create(
-                conversation=conversation,
-                sender=user,
-                content=content
-            )
-            
-            # Update conversation timestamp
-            conversation.save()  # This will update the updated_at field
-            
-            # Notify clients via WebSocket
-            channel_layer = get_channel_layer()
-            message_data = {
-                'id': message.id,
-                'content': message.content,
-                'created_at': message.created_at.isoformat(),
-                'sender': {
-                    'id': user.id,
-                    'display_name': user.full_name,
-                    'first_name': user.first_name,
-                    'last_name': user.last_name
-                },
-                'conversation_id': conversation.id,
-                'is_edited': False,
-                'is_deleted': False
-            }
-            
-            async_to_sync(channel_layer.group_send)(
-                f"conversation_{conversation_id}",
-                {
-                    'type': 'chat_message',
-                    'message': message_data
-                }
-            )
-            
-            # Create notification for each recipient
-            for recipient in conversation.participants.all():
-                # Don't notify the sender
-                if recipient.id != user.id:
-                    NotificationService.create_notification(
-                        recipient=recipient,
-                        sender=user,
+    def build_message_data(message, user):
+        """WebSocket payload for a new message"""
+        return {
+            'id': message.id,
+            'content': message.content,
+            'created_at': message.created_at.isoformat(),
+            'sender': {
+                'id': user.id,
+                'display_name': user.full_name,
+                'first_name': user.first_name,
+                'last_name': user.last_name
+            },
+            'conversation_id': message.conversation_id,
+            'is_edited': False,
+            'is_deleted': False
+        }
+
+    @staticmethod
+    def persist_messages(user, items):
+        """
+        Save a burst of messages from one sender in a single transaction.
+
+        items is a list of (conversation_id, content). Returns one
+        (message, message_data) tuple per item, in order; message is None
+        when the user is not in that conversation. Each message gets an
+        outbox entry in the same transaction; broadcasts and NEW_MESSAGE
+        notifications are left to dispatch_outbox after commit.
+        """
+        conversation_ids = {conversation_id for conversation_id, _ in items}
+        conversations = Conversation.objects.filter(
+            id__in=conversation_ids,
+            participants=user
+        ).in_bulk()
+
+        results = []
+        latest = {}
+        with transaction.atomic():
+            for conversation_id, content in items:
+                conversation = conversations.get(conversation_id)
+                if conversation is None:
+                    results.append((None, None))
+                    continue
+                message = Message.objects.create(
+                    conversation=conversation,
+                    sender=user,
+                    content=content
+                )
+                MessageOutbox.objects.create(message=message)
+                latest[conversation.id] = message
+                results.append((message, MessageService.build_message_data(message, user)))
+
+            MessageSearchService.index_messages([message for message, _ in results if message])
+
+            for conversation_id, message in latest.items():
+                # Update the conversation's inbox summary and timestamp
+                MessageService.set_last_message(message)
+                # The sender has read everything up to their own message
+                MessageService.advance_read_watermark(user, conversations[conversation_id], message.id)
+
+            if latest:
+                BackgroundService.run_after_commit(MessageService.dispatch_outbox)
+        return results
+
+    @staticmethod
+    def dispatch_outbox():
+        """
+        Deliver pending outbox entries in message order, one batch at a time.
+        A batch's notifications are written and its chat events broadcast while
+        its entries are locked; the entries are deleted only once the broadcast
+        succeeded, so a failed send leaves the whole batch to be retried.
+        Returns the number of messages dispatched.
+        """
+        dispatched = 0
+        while True:
+            with transaction.atomic():
+                # The row locks keep concurrent dispatchers from delivering an entry twice
+                entries = list(
+                    MessageOutbox.objects.select_for_update().select_related(
+                        'message__sender'
+                    ).order_by('id')[:MessageService.OUTBOX_BATCH_SIZE]
+                )
+                if not entries:
+                    return dispatched
+
+                messages = [entry.message for entry in entries]
+                participants = {}
+                for conversation_id, participant_id in Conversation.participants.through.objects.filter(
+                    conversation_id__in={message.conversation_id for message in messages}
+                ).values_list('conversation_id', 'user_id'):
+                    participants.setdefault(conversation_id, []).append(participant_id)
+
+                # One NEW_MESSAGE notification per recipient and conversation, from its newest message
+                latest = {}
+                for message in messages:
+                    if message.id > getattr(latest.get(message.conversation_id), 'id', 0):
+                        latest[message.conversation_id] = message
+                NotificationService.bulk_create_notifications([
+                    Notification(
+                        recipient_id=recipient_id,
+                        sender_id=message.sender_id,
                         notification_type='NEW_MESSAGE',
-                        content=f"{user.full_name} sent you a message",
-                        related_object_id=conversation.id,
-                        related_object_type='conversation'
+                        content=f"{message.sender.full_name} sent you a message",
+                        related_object_id=conversation_id,
+                        related_object_type='conversation',
+                        recent_actor_ids=[message.sender_id]
                     )
-            
-            return message
-        except Conversation.DoesNotExist:
+                    for conversation_id, message in latest.items()
+                    for recipient_id in participants.get(conversation_id, [])
+                    # Don't notify the sender
+                    if recipient_id != message.sender_id
+                ])
+
+                # The messages themselves are already committed; a send failure raises
+                # and rolls back the notifications so the batch is retried as a whole
+                MessageService.send_events([
+                    (participants.get(message.conversation_id, []), {
+                        'type': 'chat_message',
+                        'message': MessageService.build_message_data(message, message.sender)
+                    })
+                    for message in messages
+                ])
+                MessageOutbox.objects.filter(id__in=[entry.id for entry in entries]).delete()
+            dispatched += len(entries)
+
+    @staticmethod
+    def send_events(events):
+        """Send (participant_ids, event) pairs to each participant's user group in one event loop pass"""
+        channel_layer = get_channel_layer()
+
+        async def send_all():
+            for participant_ids, event in events:
+                for participant_id in participant_ids:
+                    await channel_layer.group_send(MessageService.user_group(participant_id), event)
+
+        async_to_sync(send_all)()
+
+    @staticmethod
+    def create_message(user, conversation_id, content):
+        """Create a new message in the conversation; delivery happens after commit"""
+        try:
+            conversation_id = int(conversation_id)
+        except (TypeError, ValueError):
             return None
+
+        message, _ = MessageService.persist_messages(user, [(conversation_id, content)])[0]
+        return message
     
     @staticmethod
     def is_within_timeframe(message, hours=24):
@@ -114,26 +276,25 @@ class MessageService:
             if not MessageService.is_within_timeframe(message):
                 return None
                 
-            message.content = new_content
-            message.is_edited = True
-            message.save()
+            with transaction.atomic():
+                message.content = new_content
+                message.is_edited = True
+                message.save()
+                MessageService.refresh_last_message_preview(message)
+                MessageSearchService.reindex_message(message)
             
             # Notify clients via WebSocket
-            channel_layer = get_channel_layer()
             message_data = {
                 'id': message.id,
                 'content': message.content,
                 'is_edited': True,
-                'conversation_id': message.conversation.id
+                'conversation_id': message.conversation_id
             }
             
-            async_to_sync(channel_layer.group_send)(
-                f"conversation_{message.conversation.id}",
-                {
-                    'type': 'chat_message_updated',
-                    'message': message_data
-                }
-            )
+            MessageService.broadcast_to_participants(message.conversation_id, {
+                'type': 'chat_message_updated',
+                'message': message_data
+            })
             
             return message
         except Message.DoesNotExist:
@@ -149,50 +310,82 @@ class MessageService:
             if not MessageService.is_within_timeframe(message):
                 return None
                 
-            message.is_deleted = True
-            message.content = "[This message has been deleted]"
-            message.save()
+            with transaction.atomic():
+                message.is_deleted = True
+                message.content = "[This message has been deleted]"
+                message.save()
+                MessageService.refresh_last_message_preview(message)
+                MessageSearchService.reindex_message(message)
             
             # Notify clients via WebSocket
-            channel_layer = get_channel_layer()
             message_data = {
                 'id': message.id,
                 'is_deleted': True,
-                'conversation_id': message.conversation.id
+                'conversation_id': message.conversation_id
             }
             
-            async_to_sync(channel_layer.group_send)(
-                f"conversation_{message.conversation.id}",
-                {
-                    'type': 'chat_message_deleted',
-                    'message': message_data
-                }
-            )
+            MessageService.broadcast_to_participants(message.conversation_id, {
+                'type': 'chat_message_deleted',
+                'message': message_data
+            })
             
             return message
         except Message.DoesNotExist:
             return None
     
+    @staticmethod
+    def advance_read_watermark(user, conversation, message_id):
+        """Move a participant's read watermark forward to message_id (never backwards)"""
+        updated = ConversationParticipant.objects.filter(
+            conversation=conversation,
+            user=user,
+            last_read_message_id__lt=message_id
+        ).update(last_read_message_id=message_id)
+        if not updated:
+            # Conversations created before watermarks existed get their row lazily
+            ConversationParticipant.objects.get_or_create(
+                conversation=conversation,
+                user=user,
+                defaults={'last_read_message_id': message_id}
+            )
+        return updated
+
     @staticmethod
     def mark_messages_as_read(user, conversation_id):
         """Mark all messages in a conversation as read by the user"""
         try:
             conversation = Conversation.objects.get(id=conversation_id, participants=user)
-            unread_messages = Message.objects.filter(
+            latest_id = conversation.last_message_id or Message.objects.filter(
                 conversation=conversation
-            ).exclude(
-                sender=user
-            ).exclude(
-                read_by=user
-            )
-            
-            with transaction.atomic():
-                for message in unread_messages:
-                    message.read_by.add(user)
-            
+            ).aggregate(latest=Max('id'))['latest']
+            if latest_id:
+                MessageService.advance_read_watermark(user, conversation, latest_id)
             return True
         except Conversation.DoesNotExist:
             return False
+
+    @staticmethod
+    def get_unread_counts(user):
+        """Unread message count per conversation, {conversation_id: count}, in one query"""
+        return dict(
+            Message.objects.filter(
+                conversation__participant_states__user=user,
+                id__gt=F('conversation__participant_states__last_read_message_id')
+            ).exclude(
+                sender=user
+            ).values('conversation_id').annotate(
+                unread=Count('id')
+            ).values_list('conversation_id', 'unread')
+        )
+
+    @staticmethod
+    def get_read_watermarks(conversation):
+        """{user_id: last_read_message_id} for everyone in a conversation; read receipts derive from it"""
+        return dict(
+            ConversationParticipant.objects.filter(
+                conversation=conversation
+            ).values_list('user_id', 'last_read_message_id')
+        )
     
     @staticmethod
     def search_users(user, query):
@@ -0,0 +1,139 @@
+import gzip
+import json
+import os
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from datetime import timedelta
+from ..models.notification_model import Notification, BroadcastNotification, ArchivedNotification
+from .notification_services import NotificationService
+import logging
+
+logger = logging.getLogger(__name__)
+
+class NotificationRetentionService:
+    """
+    Moves read notifications older than their type's retention period out of
+    the hot Notification table, in small batches so each transaction stays short.
+    """
+    DEFAULT_POLICY = {
+        'default': 180,
+        'POST_LIKE': 30,
+        'COMMENT_LIKE': 30,
+        'NEW_POST': 60,
+        'NEW_JOB_POST': 60,
+    }
+    BATCH_SIZE = 1000
+    ARCHIVE_FIELDS = [
+        'id', 'recipient_id', 'sender_id', 'notification_type', 'content', 'created_at',
+        'related_object_type', 'related_object_id', 'status', 'actor_count'
+    ]
+
+    @staticmethod
+    def get_policy():
+        """Retention in days per notification type; None keeps a type forever"""
+        policy = dict(NotificationRetentionService.DEFAULT_POLICY)
+        policy.update(getattr(settings, 'NOTIFICATION_RETENTION_DAYS', {}))
+        return policy
+
+    @staticmethod
+    def _expired(notification_type, days, explicit_types):
+        """Read notifications of one policy entry that are past retention"""
+        expired = Notification.objects.filter(
+            is_read=True,
+            updated_at__lt=timezone.now() - timedelta(days=days)
+        ).exclude(
+            # Pending follow requests still need an answer
+            status='PENDING'
+        )
+        if notification_type == 'default':
+            return expired.exclude(notification_type__in=explicit_types)
+        return expired.filter(notification_type=notification_type)
+
+    @staticmethod
+    def _archive_batch(rows, export_file):
+        if export_file:
+            for row in rows:
+                row['created_at'] = row['created_at'].isoformat()
+                export_file.write(json.dumps(row) + '\n')
+        else:
+            ArchivedNotification.objects.bulk_create([
+                ArchivedNotification(
+                    original_id=row['id'],
+                    recipient_id=row['recipient_id'],
+                    sender_id=row['sender_id'],
+                    notification_type=row['notification_type'],
+                    content=row['content'],
+                    created_at=row['created_at'],
+                    related_object_type=row['related_object_type'],
+                    related_object_id=row['related_object_id'],
+                    status=row['status'],
+                    actor_count=row['actor_count']
+                )
+                for row in rows
+            ], ignore_conflicts=True)
+
+    @staticmethod
+    def archive_expired(batch_size=None, dry_run=False, export_dir=None):
+        """
+        Archive expired notifications for every policy entry.
+        With export_dir they are written to a gzipped JSON-lines file instead of
+        the archive table. Returns {notification_type: archived_count}.
+        """
+        batch_size = batch_size or NotificationRetentionService.BATCH_SIZE
+        policy = NotificationRetentionService.get_policy()
+        explicit_types = [t for t in policy if t != 'default']
+        archived = {}
+
+        export_file = None
+        if export_dir and not dry_run:
+            os.makedirs(export_dir, exist_ok=True)
+            export_path = os.path.join(
+                export_dir, f"notifications-{timezone.now().strftime('%Y%m%d%H%M%S')}.jsonl.gz"
+            )
+            export_file = gzip.open(export_path, 'at', encoding='utf-8')
+
+        try:
+            for notification_type, days in policy.items():
+                if days is None:
+                    continue
+                expired = NotificationRetentionService._expired(notification_type, days, explicit_types)
+                if dry_run:
+                    archived[notification_type] = expired.count()
+                    continue
+
+                count = 0
+                while True:
+                    ids = list(expired.order_by('id').values_list('id', flat=True)[:batch_size])
+                    if not ids:
+                        break
+                    with transaction.atomic():
+                        rows = list(Notification.objects.filter(id__in=ids).values(
+                            *NotificationRetentionService.ARCHIVE_FIELDS
+                        ))
+                        NotificationRetentionService._archive_batch(rows, export_file)
+                        Notification.objects.filter(id__in=ids).delete()
+                    count += len(ids)
+                archived[notification_type] = count
+                if count:
+                    logger.info(f"Archived {count} {notification_type} notifications older than {days} days")
+        finally:
+            if export_file:
+                export_file.close()
+
+        return archived
+
+    @staticmethod
+    def purge_expired_broadcasts(batch_size=None):
+        """Delete broadcasts that no inbox shows any more"""
+        batch_size = batch_size or NotificationRetentionService.BATCH_SIZE
+        cutoff = timezone.now() - NotificationService.BROADCAST_TTL
+        purged = 0
+        while True:
+            ids = list(BroadcastNotification.objects.filter(
+                created_at__lt=cutoff
+            ).order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                return purged
+            BroadcastNotification.objects.filter(id__in=ids).delete()
+            purged += len(ids)
@@ -1,23 +1,511 @@
-from ..models.notification_model import Notification
-from django.db.models import Q
-from django.core.paginator import Paginator
+from ..models.notification_model import Notification, BroadcastNotification, BroadcastWatermark, BroadcastRead, NotificationFanout
+from .background_services import BackgroundService
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, Max
+from django.utils import timezone
+from datetime import datetime, timedelta, timezone as dt_timezone
+from heapq import merge
+from itertools import islice
 import logging
+import time
+import uuid
 
 logger = logging.getLogger(__name__)
 
+User = get_user_model()
+
+class NotificationFeed:
+    """
+    Newest-first view over a user's personal notifications and the broadcasts
+    addressed to everyone, paged by keyset with page_after.
+    """
+    def __init__(self, user_id, personal, broadcasts, read_until):
+        self.user_id = user_id
+        self.personal = personal
+        self.broadcasts = broadcasts
+        self.read_until = read_until
+
+    def _present_broadcasts(self, broadcasts):
+        """Broadcast rows as notifications, read if under the watermark or read individually"""
+        unread_ids = [
+            broadcast.id for broadcast in broadcasts
+            if self.read_until is None or broadcast.created_at > self.read_until
+        ]
+        read_ids = set()
+        if unread_ids:
+            read_ids = set(BroadcastRead.objects.filter(
+                user_id=self.user_id,
+                broadcast_id__in=unread_ids
+            ).values_list('broadcast_id', flat=True))
+        return [
+            NotificationService.broadcast_as_notification(broadcast, self.read_until, read_ids)
+            for broadcast in broadcasts
+        ]
+
+    @staticmethod
+    def _after(queryset, position, field):
+        """Rows strictly after a (timestamp, id) keyset position on field, newest first"""
+        queryset = queryset.order_by(f'-{field}', '-id')
+        if position:
+            timestamp, obj_id = position
+            queryset = queryset.filter(
+                Q(**{f'{field}__lt': timestamp}) | Q(**{field: timestamp, 'id__lt': obj_id})
+            )
+        return queryset
+
+    def page_after(self, cursor, limit):
+        """
+        Keyset page of the merged feed. The cursor tracks the last position
+        consumed from each source, so no OFFSET or COUNT is needed.
+        Returns (items, next_cursor); next_cursor is None on the last page.
+        """
+        personal_position, broadcast_position = NotificationService.decode_cursor(cursor)
+        personal = list(
+            self._after(self.personal, personal_position, 'updated_at').select_related('sender')[:limit + 1]
+        )
+        broadcasts = self._present_broadcasts(list(
+            self._after(self.broadcasts, broadcast_position, 'created_at').select_related('sender')[:limit + 1]
+        ))
+        merged = list(islice(
+            merge(personal, broadcasts, key=lambda n: (n.updated_at, n.id), reverse=True),
+            limit + 1
+        ))
+        items = merged[:limit]
+
+        next_cursor = None
+        if len(merged) > limit:
+            for item in items:
+                if getattr(item, 'broadcast_id', None) is None:
+                    personal_position = (item.updated_at, item.id)
+                else:
+                    broadcast_position = (item.created_at, item.broadcast_id)
+            next_cursor = NotificationService.encode_cursor(personal_position, broadcast_position)
+        return items, next_cursor
+
 class NotificationService:
+    BROADCAST_ID_PREFIX = 'broadcast-'
+    BROADCAST_TTL = timedelta(days=30)  # Matches the default job posting lifetime
+    FANOUT_BATCH_SIZE = 1000
+    UNREAD_COUNT_TIMEOUT = 60 * 60 * 24  # Bounds drift from deletes and missed updates
+    # Same-type notifications on the same object within the window merge into one row
+    COALESCED_TYPES = {'POST_LIKE', 'POST_COMMENT'}
+    COALESCE_WINDOW = timedelta(hours=getattr(settings, 'NOTIFICATION_COALESCE_WINDOW_HOURS', 24))
+    RECENT_ACTORS_LIMIT = 3
+
     @staticmethod
-    def create_notification(recipient, notification_type, content, sender=None, 
-                          related_object_id=None, related_object_type=None):
-        """Create a new notification"""
-        return Notification.objects.create(
-            recipient=recipient,
+    def create_notification(recipient, notification_type, content, sender=None,
+                          related_object_id=None, related_object_type=None, status=None):
+        """Create a new notification and push it to the recipient once committed"""
+        if notification_type in NotificationService.COALESCED_TYPES and sender is not None:
+            return NotificationService._coalesce(
+                recipient, sender, notification_type, content, related_object_id, related_object_type
+            )
+
+        notification = Notification.objects.create(
+            recipient_id=getattr(recipient, 'id', recipient),
+            sender_id=getattr(sender, 'id', sender),
+            notification_type=notification_type,
+            content=content,
+            related_object_id=related_object_id,
+            related_object_type=related_object_type,
+            status=status,
+            recent_actor_ids=[getattr(sender, 'id', sender)] if sender is not None else []
+        )
+        transaction.on_commit(lambda: NotificationService.increment_unread([(notification.recipient_id, notification.id)]))
+        NotificationService.schedule_push([notification.id])
+        return notification
+
+    @staticmethod
+    def bulk_create_notifications(notifications):
+        """
+        Insert unsaved Notification instances in one query, bump the recipients'
+        unread counters and push them once the transaction commits. No coalescing.
+        """
+        if not notifications:
+            return
+        batch_token = uuid.uuid4()
+        for notification in notifications:
+            notification.batch_token = batch_token
+        Notification.objects.bulk_create(notifications)
+
+        # MySQL does not return primary keys from bulk_create; the token matches only this batch
+        created = list(Notification.objects.filter(
+            batch_token=batch_token
+        ).values_list('recipient_id', 'id'))
+        transaction.on_commit(lambda: NotificationService.increment_unread(created))
+        NotificationService.schedule_push([notification_id for _, notification_id in created])
+
+    @staticmethod
+    def _coalesce_key(recipient_id, notification_type, related_object_id, related_object_type):
+        """Key shared by same-type notifications on one object within the current window"""
+        bucket = int(timezone.now().timestamp() // NotificationService.COALESCE_WINDOW.total_seconds())
+        return f"{recipient_id}:{notification_type}:{related_object_type}:{related_object_id}:{bucket}"
+
+    @staticmethod
+    def _coalesce(recipient, sender, notification_type, content, related_object_id, related_object_type):
+        """
+        Create the recipient's notification for this window, or merge into it if it
+        is still unread. The unique coalesce_key makes concurrent first actions
+        converge on one row instead of inserting two.
+        """
+        recipient_id = getattr(recipient, 'id', recipient)
+        sender_id = getattr(sender, 'id', sender)
+        key = NotificationService._coalesce_key(
+            recipient_id, notification_type, related_object_id, related_object_type
+        )
+        with transaction.atomic():
+            notification, created = Notification.objects.select_for_update().get_or_create(
+                coalesce_key=key,
+                defaults={
+                    'recipient_id': recipient_id,
+                    'sender_id': sender_id,
+                    'notification_type': notification_type,
+                    'content': content,
+                    'related_object_id': related_object_id,
+                    'related_object_type': related_object_type,
+                    'recent_actor_ids': [sender_id]
+                }
+            )
+            if not created:
+                recent = [actor_id for actor_id in notification.recent_actor_ids or [] if actor_id != sender_id]
+                if len(recent) == len(notification.recent_actor_ids or []):
+                    # Repeat actions by one of the recent actors do not inflate the count
+                    notification.actor_count += 1
+                notification.recent_actor_ids = [sender_id] + recent[:NotificationService.RECENT_ACTORS_LIMIT - 1]
+                notification.sender_id = sender_id
+                others = notification.actor_count - 1
+                notification.content = (
+                    f"and {others} {'other' if others == 1 else 'others'} {content}" if others else content
+                )
+                # Move the merged row back to the top of the inbox; created_at stays put
+                notification.updated_at = timezone.now()
+                notification.save(update_fields=[
+                    'actor_count', 'recent_actor_ids', 'sender', 'content', 'updated_at'
+                ])
+
+        if created:
+            transaction.on_commit(lambda: NotificationService.increment_unread([(recipient_id, notification.id)]))
+        NotificationService.schedule_push([notification.id])
+        return notification
+
+    @staticmethod
+    def user_group(user_id):
+        """Channel layer group that every notification socket of a user joins"""
+        return f"notifications_{user_id}"
+
+    @staticmethod
+    def schedule_push(notification_ids):
+        """Push notifications over WebSockets after the creating transaction commits"""
+        if notification_ids:
+            BackgroundService.run_after_commit(NotificationService.push_notifications, list(notification_ids))
+
+    @staticmethod
+    def push_notifications(notification_ids):
+        """
+        Send new notifications to their recipients' socket groups: one event per
+        recipient carrying all of their notifications and their unread count
+        """
+        from ..serializers.notification_serializers import NotificationSerializer
+
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+
+        by_recipient = {}
+        for notification in Notification.objects.filter(
+            id__in=notification_ids
+        ).select_related('sender').order_by('updated_at'):
+            by_recipient.setdefault(notification.recipient_id, []).append(notification)
+        if not by_recipient:
+            return
+
+        unread_counts = NotificationService.get_unread_counts(list(by_recipient))
+        events = [
+            (recipient_id, {
+                'type': 'notification.batch',
+                'notifications': NotificationSerializer(notifications, many=True).data,
+                'unread_count': unread_counts[recipient_id]
+            })
+            for recipient_id, notifications in by_recipient.items()
+        ]
+
+        async def send_all():
+            for recipient_id, event in events:
+                try:
+                    await channel_layer.group_send(NotificationService.user_group(recipient_id), event)
+                except Exception as e:
+                    logger.error(f"Error pushing notifications to user {recipient_id}: {str(e)}")
+
+        async_to_sync(send_all)()
+
+    @staticmethod
+    def push_unread_count(user_id):
+        """Tell a user's open sockets that their unread count changed"""
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        try:
+            async_to_sync(channel_layer.group_send)(
+                NotificationService.user_group(user_id),
+                {
+                    'type': 'notification.unread_count',
+                    'unread_count': NotificationService.get_unread_count(user_id)
+                }
+            )
+        except Exception as e:
+            logger.error(f"Error pushing unread count to user {user_id}: {str(e)}")
+
+    @staticmethod
+    def create_broadcast(notification_type, content, sender=None,
+                         related_object_id=None, related_object_type=None):
+        """Create one notification row that every user sees in their inbox"""
+        broadcast = BroadcastNotification.objects.create(
             sender=sender,
             notification_type=notification_type,
             content=content,
             related_object_id=related_object_id,
             related_object_type=related_object_type
         )
+        transaction.on_commit(NotificationService._bump_broadcast_version)
+        return broadcast
+
+    @staticmethod
+    def _unread_key(user_id):
+        return f"notifications:unread:{user_id}"
+
+    @staticmethod
+    def _unread_counted_key(user_id):
+        """Highest notification id already included in the cached personal unread count"""
+        return f"notifications:unread_counted:{user_id}"
+
+    @staticmethod
+    def _get_broadcast_version():
+        """Global version bumped on every broadcast; keys the cached broadcast unread counts"""
+        version = cache.get('notifications:broadcast:version')
+        if version is None:
+            # Seed from the clock so an evicted key never rolls back to an older version
+            cache.add('notifications:broadcast:version', int(time.time() * 1000), None)
+            version = cache.get('notifications:broadcast:version')
+        return version
+
+    @staticmethod
+    def _bump_broadcast_version():
+        try:
+            cache.incr('notifications:broadcast:version')
+        except ValueError:
+            cache.set('notifications:broadcast:version', int(time.time() * 1000), None)
+
+    @staticmethod
+    def _broadcast_unread_key(user_id, version=None):
+        if version is None:
+            version = NotificationService._get_broadcast_version()
+        return f"notifications:broadcast_unread:{user_id}:v{version}"
+
+    @staticmethod
+    def increment_unread(created):
+        """
+        Bump cached unread counters for committed (recipient_id, notification_id) pairs.
+        A notification at or below the recipient's counted id was already included by
+        the recount that built the counter, so it is skipped rather than counted twice.
+        Missing counters are rebuilt lazily on read.
+        """
+        created = list(created)
+        counted = cache.get_many({
+            NotificationService._unread_counted_key(recipient_id) for recipient_id, _ in created
+        })
+        for recipient_id, notification_id in created:
+            counted_id = counted.get(NotificationService._unread_counted_key(recipient_id))
+            if counted_id is None or notification_id <= counted_id:
+                continue
+            try:
+                cache.incr(NotificationService._unread_key(recipient_id))
+            except ValueError:
+                pass
+
+    @staticmethod
+    def decrement_unread(user_id, amount):
+        if amount <= 0:
+            return
+        try:
+            if cache.decr(NotificationService._unread_key(user_id), amount) < 0:
+                NotificationService.invalidate_unread_count(user_id)
+        except ValueError:
+            pass
+
+    @staticmethod
+    def invalidate_unread_count(user_id):
+        """Drop a user's cached counters so the next read recounts them"""
+        cache.delete_many([
+            NotificationService._unread_key(user_id),
+            NotificationService._unread_counted_key(user_id),
+            NotificationService._broadcast_unread_key(user_id)
+        ])
+
+    @staticmethod
+    def fan_out_to_followers(sender, notification_type, content,
+                             related_object_id=None, related_object_type=None):
+        """
+        Queue a notification for every follower of sender. Delivery runs in the
+        background after commit; the fan-out row lets it resume after a crash.
+        """
+        fanout = NotificationFanout.objects.create(
+            sender=sender,
+            notification_type=notification_type,
+            content=content,
+            related_object_id=related_object_id,
+            related_object_type=related_object_type
+        )
+        BackgroundService.run_after_commit(NotificationService.process_fanout, fanout.id)
+        return fanout
+
+    @staticmethod
+    def process_fanout(fanout_id):
+        """Deliver a fan-out in follower-id order, committing one batch at a time"""
+        while True:
+            with transaction.atomic():
+                # The row lock serializes concurrent workers on the same fan-out
+                fanout = NotificationFanout.objects.select_for_update().filter(id=fanout_id).first()
+                if not fanout or fanout.status == NotificationFanout.STATUS_DONE:
+                    return
+
+                follower_ids = list(
+                    User.objects.filter(
+                        following=fanout.sender_id,
+                        id__gt=fanout.last_recipient_id
+                    ).order_by('id').values_list('id', flat=True)[:NotificationService.FANOUT_BATCH_SIZE]
+                )
+
+                if not follower_ids:
+                    fanout.status = NotificationFanout.STATUS_DONE
+                    fanout.save(update_fields=['status', 'updated_at'])
+                    logger.info(f"Fan-out {fanout_id} delivered to {fanout.sent_count} followers")
+                    return
+
+                Notification.objects.bulk_create([
+                    Notification(
+                        recipient_id=follower_id,
+                        sender_id=fanout.sender_id,
+                        notification_type=fanout.notification_type,
+                        content=fanout.content,
+                        related_object_id=fanout.related_object_id,
+                        related_object_type=fanout.related_object_type
+                    )
+                    for follower_id in follower_ids
+                ])
+
+                # MySQL does not return primary keys from bulk_create
+                created = list(Notification.objects.filter(
+                    recipient_id__in=follower_ids,
+                    sender_id=fanout.sender_id,
+                    notification_type=fanout.notification_type,
+                    related_object_id=fanout.related_object_id,
+                    related_object_type=fanout.related_object_type
+                ).values_list('recipient_id', 'id'))
+                transaction.on_commit(lambda: NotificationService.increment_unread(created))
+                NotificationService.schedule_push([notification_id for _, notification_id in created])
+
+                fanout.last_recipient_id = follower_ids[-1]
+                fanout.sent_count += len(follower_ids)
+                fanout.save(update_fields=['last_recipient_id', 'sent_count', 'updated_at'])
+
+    @staticmethod
+    def resume_pending_fanouts():
+        """Finish fan-outs interrupted by a crash or restart"""
+        pending_ids = list(NotificationFanout.objects.filter(
+            status=NotificationFanout.STATUS_PENDING
+        ).values_list('id', flat=True))
+        for fanout_id in pending_ids:
+            NotificationService.process_fanout(fanout_id)
+        return len(pending_ids)
+
+    @staticmethod
+    def broadcast_as_notification(broadcast, read_until, read_ids=()):
+        """Present a broadcast as an unsaved Notification so it serializes like one"""
+        notification = Notification(
+            sender=broadcast.sender,
+            notification_type=broadcast.notification_type,
+            content=broadcast.content,
+            created_at=broadcast.created_at,
+            updated_at=broadcast.created_at,
+            is_read=(read_until is not None and broadcast.created_at <= read_until) or broadcast.id in read_ids,
+            related_object_id=broadcast.related_object_id,
+            related_object_type=broadcast.related_object_type
+        )
+        notification.broadcast_id = broadcast.id
+        return notification
+
+    @staticmethod
+    def _get_broadcasts(user_id):
+        """Broadcasts visible to a user: sent after they joined, within the TTL, not by them"""
+        date_joined = User.objects.filter(id=user_id).values_list('date_joined', flat=True).first()
+        window_start = timezone.now() - NotificationService.BROADCAST_TTL
+        if date_joined and date_joined > window_start:
+            window_start = date_joined
+        return BroadcastNotification.objects.filter(
+            created_at__gte=window_start
+        ).exclude(
+            sender_id=user_id
+        ).order_by('-created_at')
+
+    @staticmethod
+    def _get_read_until(user_id):
+        return BroadcastWatermark.objects.filter(user_id=user_id).values_list('read_until', flat=True).first()
+
+    @staticmethod
+    def _advance_watermark(user_id, read_until):
+        """Move a user's broadcast read watermark forward (never backwards)"""
+        updated = BroadcastWatermark.objects.filter(
+            user_id=user_id,
+            read_until__lt=read_until
+        ).update(read_until=read_until)
+        if not updated:
+            BroadcastWatermark.objects.get_or_create(user_id=user_id, defaults={'read_until': read_until})
+        # Individual reads under the watermark are now implied by it
+        BroadcastRead.objects.filter(user_id=user_id, broadcast__created_at__lte=read_until).delete()
+        cache.delete(NotificationService._broadcast_unread_key(user_id))
+
+    @staticmethod
+    def _unread_broadcasts(user_id):
+        """Visible broadcasts above the user's watermark that they have not read individually"""
+        broadcasts = NotificationService._get_broadcasts(user_id)
+        read_until = NotificationService._get_read_until(user_id)
+        if read_until:
+            broadcasts = broadcasts.filter(created_at__gt=read_until)
+        return broadcasts.exclude(reads__user_id=user_id)
+
+    @staticmethod
+    def _mark_broadcasts_read(user_id, broadcast_ids):
+        """Record reads of specific broadcasts; returns how many were unread before"""
+        unread_ids = list(NotificationService._unread_broadcasts(user_id).filter(
+            id__in=broadcast_ids
+        ).values_list('id', flat=True))
+        if not unread_ids:
+            return 0
+        BroadcastRead.objects.bulk_create(
+            [BroadcastRead(user_id=user_id, broadcast_id=broadcast_id) for broadcast_id in unread_ids],
+            ignore_conflicts=True
+        )
+        cache.delete(NotificationService._broadcast_unread_key(user_id))
+        return len(unread_ids)
+
+    @staticmethod
+    def _split_ids(notification_ids):
+        """Separate personal notification ids from 'broadcast-<id>' ids"""
+        personal_ids, broadcast_ids = [], []
+        for notification_id in notification_ids or []:
+            value = str(notification_id)
+            if value.startswith(NotificationService.BROADCAST_ID_PREFIX):
+                value = value[len(NotificationService.BROADCAST_ID_PREFIX):]
+                if value.isdigit():
+                    broadcast_ids.append(int(value))
+            elif value.isdigit():
+                personal_ids.append(int(value))
+        return personal_ids, broadcast_ids
 
     @staticmethod
     def create_job_offer_notification(recipient, sender, job_id, job_title):
@@ -50,53 +538,145 @@ class NotificationService:
         )
 
     @staticmethod
-    def get_user_notifications(user_id, page=1, limit=20, notification_type=None):
-        """Get paginated notifications for a user"""
-        try:
-            logger.debug(f"Getting notifications for user {user_id}")
-            notifications = Notification.objects.filter(recipient_id=user_id)
-            
-            if notification_type:
-                logger.debug(f"Filtering by type: {notification_type}")
-                if notification_type == 'connection':
-                    notifications = notifications.filter(
-                        notification_type__in=['CONNECTION_REQUEST', 'CONNECTION_ACCEPTED']
-                    )
-            
-            # Order by created_at
-            notifications = notifications.order_by('-created_at')
-            
-            logger.debug(f"Found {notifications.count()} notifications")
-            
-            paginator = Paginator(notifications, limit)
-            page_obj = paginator.get_page(page)
-            
-            logger.debug(f"Returning page {page} of {paginator.num_pages}")
-            return page_obj
-        except Exception as e:
-            logger.error(f"Error in get_user_notifications: {str(e)}")
-            raise
+    def encode_cursor(personal_position, broadcast_position):
+        """Build a feed cursor from the last (timestamp, id) read from each source"""
+        def encode(position):
+            if not position:
+                return ''
+            created_at, obj_id = position
+            micros = (created_at - datetime(1970, 1, 1, tzinfo=dt_timezone.utc)) // timedelta(microseconds=1)
+            return f"{micros}_{obj_id}"
+        return f"{encode(personal_position)}.{encode(broadcast_position)}"
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """Parse a feed cursor into (personal_position, broadcast_position); invalid parts read as the start"""
+        def decode(part):
+            try:
+                micros, obj_id = part.split('_', 1)
+                created_at = datetime(1970, 1, 1, tzinfo=dt_timezone.utc) + timedelta(microseconds=int(micros))
+                return created_at, int(obj_id)
+            except (ValueError, AttributeError, OverflowError):
+                return None
+        if not cursor or '.' not in cursor:
+            return None, None
+        personal_part, broadcast_part = cursor.split('.', 1)
+        return decode(personal_part), decode(broadcast_part)
+
+    @staticmethod
+    def get_feed(user_id, notification_type=None):
+        """A user's notifications merged with broadcasts, optionally filtered by type"""
+        notifications = Notification.objects.filter(recipient_id=user_id)
+        broadcasts = NotificationService._get_broadcasts(user_id)
+
+        if notification_type:
+            logger.debug(f"Filtering by type: {notification_type}")
+            if notification_type == 'connection':
+                notifications = notifications.filter(
+                    notification_type__in=['CONNECTION_REQUEST', 'CONNECTION_ACCEPTED']
+                )
+                broadcasts = broadcasts.none()
+
+        # Order by latest activity so merged notifications resurface
+        notifications = notifications.order_by('-updated_at', '-id')
+        return NotificationFeed(user_id, notifications, broadcasts, NotificationService._get_read_until(user_id))
+
+    @staticmethod
+    def get_user_notifications_page(user_id, cursor=None, limit=20, notification_type=None):
+        """
+        Get one keyset page of a user's notifications, merged with broadcasts.
+        Runs no COUNT and no OFFSET, so deep pages cost the same as the first.
+        """
+        feed = NotificationService.get_feed(user_id, notification_type)
+        notifications, next_cursor = feed.page_after(cursor, limit)
+        return {
+            'notifications': notifications,
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None
+        }
 
     @staticmethod
     def mark_as_read(notification_ids, user_id):
         """Mark notifications as read"""
-        return Notification.objects.filter(
-            id__in=notification_ids,
-            recipient_id=user_id
-        ).update(is_read=True)
+        personal_ids, broadcast_ids = NotificationService._split_ids(notification_ids)
+        updated = Notification.objects.filter(
+            id__in=personal_ids,
+            recipient_id=user_id,
+            is_read=False
+        ).update(is_read=True, coalesce_key=None)
+        NotificationService.decrement_unread(user_id, updated)
+
+        if broadcast_ids:
+            # Only mark_all_as_read moves the watermark; older broadcasts stay unread
+            updated += NotificationService._mark_broadcasts_read(user_id, broadcast_ids)
+
+        if updated:
+            NotificationService.push_unread_count(user_id)
+        return updated
 
     @staticmethod
     def mark_all_as_read(user_id):
         """Mark all notifications as read for a user"""
-        return Notification.objects.filter(
+        NotificationService._advance_watermark(user_id, timezone.now())
+        updated = Notification.objects.filter(
             recipient_id=user_id,
             is_read=False
-        ).update(is_read=True)
+        ).update(is_read=True, coalesce_key=None)
+        # Recounted on the next read so the counter and its counted id stay consistent
+        cache.delete_many([
+            NotificationService._unread_key(user_id),
+            NotificationService._unread_counted_key(user_id)
+        ])
+        NotificationService.push_unread_count(user_id)
+        return updated
+
+    @staticmethod
+    def get_unread_counts(user_ids):
+        """Unread counts for many users, reading their cached counters in one round trip"""
+        version = NotificationService._get_broadcast_version()
+        keys = {
+            user_id: (
+                NotificationService._unread_key(user_id),
+                NotificationService._broadcast_unread_key(user_id, version)
+            )
+            for user_id in user_ids
+        }
+        cached = cache.get_many([key for pair in keys.values() for key in pair])
+        counts = {}
+        for user_id, (unread_key, broadcast_key) in keys.items():
+            if unread_key in cached and broadcast_key in cached:
+                counts[user_id] = max(cached[unread_key], 0) + cached[broadcast_key]
+            else:
+                counts[user_id] = NotificationService.get_unread_count(user_id)
+        return counts
 
     @staticmethod
     def get_unread_count(user_id):
-        """Get count of unread notifications"""
-        return Notification.objects.filter(
-            recipient_id=user_id,
-            is_read=False
-        ).count() 
\ No newline at end of file
+        """Get count of unread notifications from the cached counters"""
+        unread_key = NotificationService._unread_key(user_id)
+        broadcast_key = NotificationService._broadcast_unread_key(user_id)
+        cached = cache.get_many([unread_key, broadcast_key])
+
+        personal_unread = cached.get(unread_key)
+        if personal_unread is None:
+            recount = Notification.objects.filter(recipient_id=user_id).aggregate(
+                unread=Count('id', filter=Q(is_read=False)),
+                counted_id=Max('id')
+            )
+            personal_unread = recount['unread']
+            # Record what the recount covered before publishing it, so increments for
+            # rows it already saw are skipped instead of counted twice
+            cache.set(
+                NotificationService._unread_counted_key(user_id),
+                recount['counted_id'] or 0,
+                NotificationService.UNREAD_COUNT_TIMEOUT
+            )
+            # add() so a concurrent increment is never overwritten by a stale recount
+            cache.add(unread_key, personal_unread, NotificationService.UNREAD_COUNT_TIMEOUT)
+
+        broadcast_unread = cached.get(broadcast_key)
+        if broadcast_unread is None:
+            broadcast_unread = NotificationService._unread_broadcasts(user_id).count()
+            cache.set(broadcast_key, broadcast_unread, NotificationService.UNREAD_COUNT_TIMEOUT)
+
+        return max(personal_unread, 0) + broadcast_unread
@@ -1,4 +1,5 @@
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from django.db.models import Prefetch
 from recruitmentAPI.models.post_model import Post
 from recruitmentAPI.models.comment_model import Comment
@@ -6,10 +7,13 @@ from django.core.cache import cache
 from django.conf import settings
 import time
 from django.db.models import Q
-from ..models.notification_model import Notification
+from .notification_services import NotificationService
 from sentence_transformers import SentenceTransformer, util
 import numpy as np
 from django.db.models import Case, When, FloatField
+from .trending_services import TrendingService
+from .media_services import MediaService
+from ..serializers.post_serializers import PostDetailSerializer
 
 class PostService:
     MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
@@ -18,6 +22,8 @@ class PostService:
     ALLOWED_VIDEO_TYPES = ['video/mp4', 'video/quicktime']
     CACHE_TTL = getattr(settings, 'POST_CACHE_TTL', 300)  # 5 minutes default
     POSTS_PER_PAGE = 10
+    SORT_RECENT = 'recent'
+    SORT_TRENDING = 'trending'
     _model = None
 
     @classmethod
@@ -28,9 +34,10 @@ class PostService:
         return cls._model
 
     @staticmethod
-    def create_post(user, content, image=None, video=None):
+    def create_post(user, content, image=None, video=None, video_upload_id=None):
         """
-        Create a new post with optional media
+        Create a new post with optional media.
+        video_upload_id attaches a completed chunked upload instead of a multipart video.
         """
         try:
             post_data = {
@@ -52,13 +59,25 @@ class PostService:
             if image and video:
                 post_data['media_type'] = 'both'
 
-            post = Post.objects.create(**post_data)
-            
-            # Create notifications for followers using IDs
-            for follower_id in user.followers.values_list('id', flat=True):
-                Notification.objects.create(
-                    recipient_id=follower_id,
-                    sender_id=user.id,
+            upload_session = None
+            if video_upload_id and not video:
+                from .upload_services import UploadService
+                upload_session = UploadService.get_session(user, video_upload_id)
+                if upload_session.status != upload_session.STATUS_COMPLETE:
+                    raise ValueError("Video upload is not complete")
+
+            # A failed attach must not leave a post without its video behind
+            with transaction.atomic():
+                post = Post.objects.create(**post_data)
+                if upload_session:
+                    UploadService.attach_to_post(user, upload_session.id, post)
+                    post.save(update_fields=['video', 'media_type'])
+                post.hot_score = TrendingService.refresh_post(post.id)
+                MediaService.schedule_post_media(post)
+                
+                # Notify followers in the background once the post is committed
+                NotificationService.fan_out_to_followers(
+                    sender=user,
                     notification_type='NEW_POST',
                     content='created a new post',
                     related_object_id=post.id,
@@ -140,14 +159,16 @@ class PostService:
         return recommendations
 
     @staticmethod
-    def get_posts_paginated(cursor=None, limit=POSTS_PER_PAGE, user=None, followed_only=False):
+    def get_posts_paginated(cursor=None, limit=POSTS_PER_PAGE, user=None, followed_only=False, sort=SORT_RECENT):
         """
-        Get paginated posts with recommendations when followed_only is False
+        Get paginated posts with recommendations when followed_only is False.
+        sort='trending' orders by the precomputed hot_score instead.
         """
         print(f"Debug - followed_only: {followed_only}")  # Debug log
+        trending = sort == PostService.SORT_TRENDING
         
         # Generate cache key
-        cache_key = f"posts:list:{cursor}:{limit}:{followed_only}"
+        cache_key = f"posts:list:{cursor}:{limit}:{followed_only}:{sort}"
         if user:
             cache_key += f":{user.id}"
             
@@ -165,7 +186,7 @@ class PostService:
                     Q(user=user) |  # Include user's own posts
                     Q(user__in=following_ids)  # Include posts from followed users
                 )
-            else:
+            elif not trending:
                 # Show all posts with recommendations
                 all_posts = list(posts)
                 recommendations = PostService.calculate_post_recommendations(all_posts, user)
@@ -181,10 +202,19 @@ class PostService:
             'user'
         ).prefetch_related(
             'likes'
-        ).order_by('-created_at')  # Ensure newest posts appear first
+        )
 
-        if cursor:
-            posts = posts.filter(created_at__lt=cursor)
+        if trending:
+            # Served straight from the (is_active, is_hidden, -hot_score, -id) index
+            posts = posts.order_by('-hot_score', '-id')
+            decoded = TrendingService.decode_cursor(cursor) if cursor else None
+            if decoded:
+                score, last_id = decoded
+                posts = posts.filter(Q(hot_score__lt=score) | Q(hot_score=score, id__lt=last_id))
+        else:
+            posts = posts.order_by('-created_at')  # Ensure newest posts appear first
+            if cursor:
+                posts = posts.filter(created_at__lt=cursor)
 
         # Get posts with one extra for next page check
         posts = posts[:limit + 1]
@@ -195,7 +225,10 @@ class PostService:
         
         next_cursor = None
         if has_next and result_posts:
-            next_cursor = result_posts[-1].created_at.isoformat()
+            if trending:
+                next_cursor = TrendingService.encode_cursor(result_posts[-1])
+            else:
+                next_cursor = result_posts[-1].created_at.isoformat()
 
         # Add user-specific data
         if user:
@@ -252,16 +285,9 @@ class PostService:
     @staticmethod
     def get_post_detail(post_id, user=None):
         """
-        Get single post with caching
+        Get single post model instance with its first top-level comments.
+        Read paths should prefer get_post_detail_data, which is cached.
         """
-        cache_key = f"post:detail:{post_id}"
-        if user:
-            cache_key += f":{user.id}"
-
-        cached_post = cache.get(cache_key)
-        if cached_post:
-            return cached_post
-
         try:
             # Get the post with all necessary relations
             post = Post.objects.select_related(
@@ -280,10 +306,12 @@ class PostService:
                 parent_comment=None
             ).select_related(
                 'user'
-            ).prefetch_related(
-                'likes'
             ).order_by('-created_at')[:5])
 
+            # Load their first replies in one windowed query
+            from .comment_services import CommentService
+            CommentService.load_top_replies(comments)
+
             # Manually set the prefetched comments
             post._prefetched_objects_cache = {
                 'comments': comments
@@ -293,13 +321,82 @@ class PostService:
             if user:
                 post.user_has_liked = user in post.likes.all()
 
-            # Cache the result
-            cache.set(cache_key, post, PostService.CACHE_TTL)
             return post
 
         except ObjectDoesNotExist:
             return None
 
+    @staticmethod
+    def get_post_version(post_id):
+        """Current version of a post; bumped whenever its detail payload changes"""
+        version_key = f"post:version:{post_id}"
+        version = cache.get(version_key)
+        if version is None:
+            # Seed from the clock so an evicted key never rolls back to an older version
+            cache.add(version_key, int(time.time() * 1000), None)
+            version = cache.get(version_key)
+        return version
+
+    @staticmethod
+    def bump_post_version(post_id):
+        """Invalidate the shared detail payload of a post"""
+        version_key = f"post:version:{post_id}"
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, int(time.time() * 1000), None)
+
+    @staticmethod
+    def get_post_detail_data(post_id, request):
+        """
+        Get serialized post detail. The payload is built once per post version
+        and shared by all viewers; only the viewer's like state is applied per read.
+        """
+        cache_key = f"post:detail:{post_id}:v{PostService.get_post_version(post_id)}"
+        data = cache.get(cache_key)
+
+        if data is None:
+            post = PostService.get_post_detail(post_id)
+            if not post:
+                return None
+            data = PostDetailSerializer(
+                post,
+                context={'request': request, 'shared': True}
+            ).data
+            cache.set(cache_key, data, PostService.CACHE_TTL)
+
+        return PostService._apply_viewer_state(data, request.user)
+
+    @staticmethod
+    def _apply_viewer_state(data, user):
+        """Overlay per-viewer like flags on a shared post detail payload"""
+        data = dict(data)
+        comments = [dict(comment) for comment in data.get('top_level_comments', [])]
+        for comment in comments:
+            comment['replies'] = [dict(reply) for reply in comment.get('replies', [])]
+
+        if not user or not user.is_authenticated:
+            data['is_liked'] = False
+            data['top_level_comments'] = comments
+            return data
+
+        data['is_liked'] = Post.likes.through.objects.filter(
+            post_id=data['id'], user_id=user.id
+        ).exists()
+
+        comment_ids = [c['id'] for c in comments] + [r['id'] for c in comments for r in c['replies']]
+        liked_ids = set(Comment.likes.through.objects.filter(
+            comment_id__in=comment_ids, user_id=user.id
+        ).values_list('comment_id', flat=True)) if comment_ids else set()
+
+        for comment in comments:
+            comment['is_liked'] = comment['id'] in liked_ids
+            for reply in comment['replies']:
+                reply['is_liked'] = reply['id'] in liked_ids
+
+        data['top_level_comments'] = comments
+        return data
+
     @staticmethod
     def toggle_like(post_id, user):
         """
@@ -315,7 +412,7 @@ class PostService:
                 action = 'liked'
                 # Create notification for post owner
                 if post.user != user:  # Don't notify if user likes their own post
-                    Notification.objects.create(
+                    NotificationService.create_notification(
                         recipient=post.user,
                         sender=user,
                         notification_type='POST_LIKE',
@@ -325,11 +422,10 @@ class PostService:
                     )
             
             post.update_counts()
+            post.hot_score = TrendingService.refresh_post(post.id)
             
-            # Invalidate specific post cache
-            cache.delete(f"post:detail:{post_id}")
-            if user:
-                cache.delete(f"post:detail:{post_id}:{user.id}")
+            # Invalidate the shared post detail payload
+            PostService.bump_post_version(post_id)
             
             # Update feed version to invalidate all feed caches
             cache.set('post_feed_version', int(time.time()))
@@ -345,7 +441,7 @@ class PostService:
         Invalidate all caches related to a post
         """
         # Clear post detail cache
-        cache.delete(f"post:detail:{post_id}")
+        PostService.bump_post_version(post_id)
         
         # Update feed version to invalidate all feed caches
         cache.set('post_feed_version', int(time.time()))
@@ -359,9 +455,8 @@ class PostService:
             post = Post.objects.get(id=post_id, user_id=user_id)
             
             # Delete all related caches
+            PostService.bump_post_version(post_id)
             keys_to_delete = [
-                f"post:detail:{post_id}",
-                f"post:detail:{post_id}:{user_id}",
                 f"posts:list:None:{PostService.POSTS_PER_PAGE}",
                 f"posts:list:None:{PostService.POSTS_PER_PAGE}:{user_id}"
             ]
@@ -375,7 +470,8 @@ class PostService:
             
             cache.delete_many(keys_to_delete)
             
-            # Delete the post
+            # Delete the post and its generated media variants
+            MediaService.delete_variants(post)
             post.delete()
             
             return True
@@ -394,8 +490,13 @@ class PostService:
             else:
                 post.content = ''
             
+            media_changed = bool(remove_media or image or video)
+
             # Handle media deletion first
             if remove_media:
+                MediaService.delete_variants(post)
+                post.media_variants = {}
+                post.media_status = Post.MEDIA_STATUS_NONE
                 if post.image:
                     post.image.delete(save=False)
                 if post.video:
@@ -427,6 +528,9 @@ class PostService:
                     post.media_type = 'none'
             
             post.save()
+
+            if media_changed and not remove_media:
+                MediaService.schedule_post_media(post)
             
             # Clear post caches
             PostService.invalidate_post_caches(post_id)
@@ -0,0 +1,67 @@
+from django.core.cache import cache
+from django.utils import timezone
+from ..models.message_model import Conversation
+
+class PresenceService:
+    """
+    Online presence and typing state for chat, kept only in the cache.
+
+    A user is online while their heartbeat key is alive; chat sockets refresh it
+    on connect, every HEARTBEAT_INTERVAL while open, and on heartbeat frames.
+    Keys are not deleted on disconnect, since another tab may still be open;
+    users drop offline when the TTL lapses.
+    Nothing on this path writes to the database.
+    """
+    PRESENCE_TTL = 60  # seconds
+    HEARTBEAT_INTERVAL = 20  # seconds between refreshes by an open socket
+    TYPING_INTERVAL = 3  # at most one typing broadcast per user per conversation per interval
+    PARTICIPANTS_TTL = 60 * 10
+
+    @staticmethod
+    def _presence_key(user_id):
+        return f"presence:{user_id}"
+
+    @staticmethod
+    def heartbeat(user_id):
+        """Mark a user online for another PRESENCE_TTL seconds"""
+        cache.set(PresenceService._presence_key(user_id), timezone.now().isoformat(), PresenceService.PRESENCE_TTL)
+
+    @staticmethod
+    def get_online_status(user_ids):
+        """Bulk presence lookup: {user_id: last_seen or None} in one cache round trip"""
+        user_ids = list(user_ids)
+        keys = {PresenceService._presence_key(user_id): user_id for user_id in user_ids}
+        found = cache.get_many(keys.keys())
+        return {user_id: found.get(key) for key, user_id in keys.items()}
+
+    @staticmethod
+    def get_visible_user_ids(user, user_ids):
+        """The subset of user_ids that share a conversation with user; presence is only shown to them"""
+        return set(
+            Conversation.participants.through.objects.filter(
+                conversation__participants=user,
+                user_id__in=user_ids
+            ).values_list('user_id', flat=True)
+        )
+
+    @staticmethod
+    def get_participant_ids(conversation_id):
+        """Participant ids of a conversation, cached because membership never changes after creation"""
+        cache_key = f"conversation:participants:{conversation_id}"
+        participant_ids = cache.get(cache_key)
+        if participant_ids is None:
+            participant_ids = list(
+                Conversation.participants.through.objects.filter(
+                    conversation_id=conversation_id
+                ).values_list('user_id', flat=True)
+            )
+            cache.set(cache_key, participant_ids, PresenceService.PARTICIPANTS_TTL)
+        return participant_ids
+
+    @staticmethod
+    def should_broadcast_typing(user_id, conversation_id):
+        """
+        Coalesce typing events: True for the first event in each TYPING_INTERVAL,
+        False for the rest (cache.add only succeeds while the key is absent).
+        """
+        return cache.add(f"typing:{conversation_id}:{user_id}", 1, PresenceService.TYPING_INTERVAL)
@@ -0,0 +1,162 @@
+import math
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Count
+from django.utils import timezone
+from ..models.post_model import Post
+from ..models.job_model import JobPost
+
+logger = logging.getLogger(__name__)
+
+class TrendingService:
+    """
+    Precomputed, time-decayed "hot" scores for posts and jobs.
+
+    Scores are written to an indexed ``hot_score`` column so the trending
+    feed is a plain ORDER BY instead of scoring content per request.
+    """
+    GRAVITY = getattr(settings, 'TRENDING_GRAVITY', 1.8)
+    LIKE_WEIGHT = 1.0
+    COMMENT_WEIGHT = 2.0
+    SAVE_WEIGHT = 2.0
+    AFFINITY_WEIGHT = 0.5
+    # Content older than this keeps its last score; decay has already flattened it
+    REFRESH_WINDOW_DAYS = getattr(settings, 'TRENDING_REFRESH_WINDOW_DAYS', 7)
+    BATCH_SIZE = 500
+
+    @staticmethod
+    def _decay(created_at, now=None):
+        now = now or timezone.now()
+        age_hours = max((now - created_at).total_seconds() / 3600, 0)
+        return math.pow(age_hours + 2, TrendingService.GRAVITY)
+
+    @staticmethod
+    def score_post(likes_count, comments_count, author_followers, created_at, now=None):
+        """Score a post from its engagement counters, author reach and age"""
+        engagement = (
+            likes_count * TrendingService.LIKE_WEIGHT
+            + comments_count * TrendingService.COMMENT_WEIGHT
+        )
+        affinity = TrendingService.AFFINITY_WEIGHT * math.log1p(author_followers)
+        return (engagement + affinity + 1) / TrendingService._decay(created_at, now)
+
+    @staticmethod
+    def score_job(positive_feedback, negative_feedback, saves_count, company_followers, created_at, now=None):
+        """Score a job from feedback, saves, company reach and age"""
+        engagement = (
+            max(positive_feedback - negative_feedback, 0) * TrendingService.LIKE_WEIGHT
+            + saves_count * TrendingService.SAVE_WEIGHT
+        )
+        affinity = TrendingService.AFFINITY_WEIGHT * math.log1p(company_followers)
+        return (engagement + affinity + 1) / TrendingService._decay(created_at, now)
+
+    @staticmethod
+    def refresh_post(post_id):
+        """Recompute a single post's score after its counters change"""
+        row = Post.objects.filter(id=post_id).annotate(
+            author_followers=Count('user__followers', distinct=True)
+        ).values('likes_count', 'comments_count', 'author_followers', 'created_at').first()
+        if not row:
+            return None
+
+        score = TrendingService.score_post(
+            row['likes_count'], row['comments_count'], row['author_followers'], row['created_at']
+        )
+        Post.objects.filter(id=post_id).update(hot_score=score, hot_score_updated_at=timezone.now())
+        return score
+
+    @staticmethod
+    def refresh_job(job_id):
+        """Recompute a single job's score after its counters change"""
+        row = JobPost.objects.filter(id=job_id).annotate(
+            saves_count=Count('saved_by', distinct=True),
+            company_followers=Count('posted_by__followers', distinct=True)
+        ).values(
+            'positive_feedback_count', 'negative_feedback_count',
+            'saves_count', 'company_followers', 'created_at'
+        ).first()
+        if not row:
+            return None
+
+        score = TrendingService.score_job(
+            row['positive_feedback_count'], row['negative_feedback_count'],
+            row['saves_count'], row['company_followers'], row['created_at']
+        )
+        JobPost.objects.filter(id=job_id).update(hot_score=score)
+        return score
+
+    @staticmethod
+    def refresh_recent_posts(days=None):
+        """Re-apply recency decay to every post inside the refresh window"""
+        days = days or TrendingService.REFRESH_WINDOW_DAYS
+        now = timezone.now()
+        rows = Post.objects.filter(
+            is_active=True,
+            created_at__gte=now - timedelta(days=days)
+        ).annotate(
+            author_followers=Count('user__followers', distinct=True)
+        ).values_list('id', 'likes_count', 'comments_count', 'author_followers', 'created_at')
+
+        updated = 0
+        batch = []
+        for post_id, likes, comments, followers, created_at in rows.iterator(chunk_size=TrendingService.BATCH_SIZE):
+            batch.append(Post(
+                id=post_id,
+                hot_score=TrendingService.score_post(likes, comments, followers, created_at, now),
+                hot_score_updated_at=now
+            ))
+            if len(batch) >= TrendingService.BATCH_SIZE:
+                updated += Post.objects.bulk_update(batch, ['hot_score', 'hot_score_updated_at'])
+                batch = []
+        if batch:
+            updated += Post.objects.bulk_update(batch, ['hot_score', 'hot_score_updated_at'])
+
+        logger.info(f"Refreshed hot scores for {updated} posts")
+        return updated
+
+    @staticmethod
+    def refresh_recent_jobs(days=None):
+        """Re-apply recency decay to every active job inside the refresh window"""
+        days = days or TrendingService.REFRESH_WINDOW_DAYS
+        now = timezone.now()
+        rows = JobPost.objects.filter(
+            is_active=True,
+            created_at__gte=now - timedelta(days=days)
+        ).annotate(
+            saves_count=Count('saved_by', distinct=True),
+            company_followers=Count('posted_by__followers', distinct=True)
+        ).values_list(
+            'id', 'positive_feedback_count', 'negative_feedback_count',
+            'saves_count', 'company_followers', 'created_at'
+        )
+
+        updated = 0
+        batch = []
+        for job_id, positive, negative, saves, followers, created_at in rows.iterator(chunk_size=TrendingService.BATCH_SIZE):
+            batch.append(JobPost(
+                id=job_id,
+                hot_score=TrendingService.score_job(positive, negative, saves, followers, created_at, now)
+            ))
+            if len(batch) >= TrendingService.BATCH_SIZE:
+                updated += JobPost.objects.bulk_update(batch, ['hot_score'])
+                batch = []
+        if batch:
+            updated += JobPost.objects.bulk_update(batch, ['hot_score'])
+
+        logger.info(f"Refreshed hot scores for {updated} jobs")
+        return updated
+
+    @staticmethod
+    def encode_cursor(obj):
+        """Build a keyset cursor for hot_score ordering"""
+        return f"{obj.hot_score!r}_{obj.id}"
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """Parse a hot_score cursor, returning (score, id) or None"""
+        try:
+            score, obj_id = cursor.rsplit('_', 1)
+            return float(score), int(obj_id)
+        except (ValueError, AttributeError):
+            return None
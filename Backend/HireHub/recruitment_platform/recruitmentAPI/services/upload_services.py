@@ -0,0 +1,242 @@
+import hashlib
+import os
+from datetime import timedelta
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+from ..models.upload_model import UploadSession
+from .cv_services import CVService
+from .post_services import PostService
+import logging
+
+logger = logging.getLogger(__name__)
+
+class UploadService:
+    """
+    Chunked, resumable uploads for post videos and CVs.
+
+    Chunks are streamed straight into a part file and hashed as they arrive;
+    the finished file is renamed into place so it is never copied twice.
+    """
+    CHUNK_SIZE = getattr(settings, 'CHUNKED_UPLOAD_CHUNK_SIZE', 5 * 1024 * 1024)  # 5MB
+    MAX_CHUNK_SIZE = 2 * CHUNK_SIZE
+    SESSION_TTL = timedelta(hours=getattr(settings, 'CHUNKED_UPLOAD_TTL_HOURS', 24))
+
+    # Limits mirror PostService / CVService so chunked and direct uploads agree
+    TARGETS = {
+        UploadSession.TARGET_POST_VIDEO: {
+            'max_size': PostService.MAX_VIDEO_SIZE,
+            'content_types': PostService.ALLOWED_VIDEO_TYPES,
+            'extensions': {'.mp4', '.mov'},
+        },
+        UploadSession.TARGET_CV: {
+            'max_size': CVService.MAX_FILE_SIZE,
+            'content_types': ['application/pdf'],
+            'extensions': CVService.ALLOWED_EXTENSIONS,
+        },
+    }
+
+    @staticmethod
+    def start_upload(user, target, file_name, content_type, total_size):
+        """Validate the declared file and open a new upload session"""
+        config = UploadService.TARGETS.get(target)
+        if not config:
+            raise ValidationError(f"Unsupported upload target: {target}")
+
+        try:
+            total_size = int(total_size)
+        except (TypeError, ValueError):
+            raise ValidationError("total_size must be an integer")
+        if total_size <= 0:
+            raise ValidationError("total_size must be positive")
+        if total_size > config['max_size']:
+            raise ValidationError(f"File too large. Max size is {config['max_size'] // (1024 * 1024)}MB")
+
+        file_name = os.path.basename(file_name or '')
+        ext = os.path.splitext(file_name)[1].lower()
+        if ext not in config['extensions']:
+            raise ValidationError(f"Invalid file extension. Allowed: {', '.join(sorted(config['extensions']))}")
+        if content_type not in config['content_types']:
+            raise ValidationError(f"Invalid file type. Allowed: {', '.join(config['content_types'])}")
+
+        session = UploadSession.objects.create(
+            user=user,
+            target=target,
+            file_name=file_name,
+            content_type=content_type,
+            total_size=total_size
+        )
+        logger.info(f"Started {target} upload {session.id} for user {user.id} ({total_size} bytes)")
+        return session
+
+    @staticmethod
+    def get_session(user, upload_id):
+        try:
+            return UploadSession.objects.get(id=upload_id, user=user)
+        except (UploadSession.DoesNotExist, ValidationError, ValueError):
+            raise ValidationError("Upload not found")
+
+    @staticmethod
+    def _sniff_content_type(head):
+        """Identify the real file type from its leading bytes"""
+        if head.startswith(b'%PDF'):
+            return 'application/pdf'
+        if head[4:8] == b'ftyp':
+            brand = head[8:12]
+            return 'video/quicktime' if brand == b'qt  ' else 'video/mp4'
+        if head[4:8] in (b'moov', b'mdat', b'wide', b'free'):
+            return 'video/quicktime'
+        return None
+
+    @staticmethod
+    def append_chunk(user, upload_id, offset, chunk, checksum=None):
+        """
+        Append one chunk at the given offset.
+
+        The offset must match what the server has already stored; clients
+        resume by asking for the current offset and continuing from there.
+        """
+        try:
+            offset = int(offset)
+        except (TypeError, ValueError):
+            raise ValidationError("offset must be an integer")
+        if chunk.size > UploadService.MAX_CHUNK_SIZE:
+            raise ValidationError(f"Chunk too large. Max chunk size is {UploadService.MAX_CHUNK_SIZE} bytes")
+
+        with transaction.atomic():
+            session = UploadSession.objects.select_for_update().filter(id=upload_id, user=user).first()
+            if not session:
+                raise ValidationError("Upload not found")
+            if session.status != UploadSession.STATUS_UPLOADING:
+                raise ValidationError(f"Upload is already {session.status}")
+            if offset != session.received_bytes:
+                raise ValidationError(
+                    f"Unexpected offset {offset}; resume from {session.received_bytes}",
+                    code='offset_conflict'
+                )
+            if session.received_bytes + chunk.size > session.total_size:
+                raise ValidationError("Chunk exceeds the declared file size")
+
+            os.makedirs(os.path.dirname(session.temp_path), exist_ok=True)
+            digest = hashlib.sha256()
+            written = 0
+            with open(session.temp_path, 'r+b' if offset else 'wb') as part:
+                part.seek(offset)
+                part.truncate()
+                for piece in chunk.chunks():
+                    if offset == 0 and written == 0:
+                        sniffed = UploadService._sniff_content_type(piece[:16])
+                        if sniffed not in UploadService.TARGETS[session.target]['content_types']:
+                            raise ValidationError("File content does not match an allowed type")
+                    digest.update(piece)
+                    part.write(piece)
+                    written += len(piece)
+
+            chunk_digest = digest.hexdigest()
+            if checksum and checksum.lower() != chunk_digest:
+                with open(session.temp_path, 'r+b') as part:
+                    part.truncate(offset)
+                raise ValidationError("Chunk checksum mismatch")
+
+            session.received_bytes = offset + written
+            session.checksum = hashlib.sha256(f"{session.checksum}{chunk_digest}".encode()).hexdigest()
+            if session.is_complete:
+                session.status = UploadSession.STATUS_COMPLETE
+            session.save(update_fields=['received_bytes', 'checksum', 'status', 'updated_at'])
+
+        if session.status == UploadSession.STATUS_COMPLETE and session.target == UploadSession.TARGET_CV:
+            UploadService.attach_cv(session)
+        return session
+
+    @staticmethod
+    def _move_into_field(session, instance, field_name):
+        """
+        Point the field at its upload_to location and rename the assembled part
+        file there once the transaction commits. A rollback leaves the part file
+        in place, so the still-COMPLETE session can be attached again.
+        """
+        field = instance._meta.get_field(field_name)
+        name = default_storage.get_available_name(field.generate_filename(instance, session.file_name))
+        setattr(instance, field_name, name)
+        temp_path = session.temp_path
+        transaction.on_commit(lambda: UploadService._move_file(temp_path, name))
+        return name
+
+    @staticmethod
+    def _move_file(temp_path, name):
+        try:
+            final_path = default_storage.path(name)
+        except NotImplementedError:
+            # Remote storage backends need a real upload
+            with open(temp_path, 'rb') as part:
+                saved_name = default_storage.save(name, File(part))
+            if saved_name != name:
+                logger.error(f"Upload stored as {saved_name} instead of {name}")
+            os.remove(temp_path)
+        else:
+            os.makedirs(os.path.dirname(final_path), exist_ok=True)
+            os.replace(temp_path, final_path)
+
+    @staticmethod
+    def attach_to_post(user, upload_id, post):
+        """Attach a completed video upload to a post (caller saves the post)"""
+        session = UploadService.get_session(user, upload_id)
+        if session.target != UploadSession.TARGET_POST_VIDEO:
+            raise ValidationError("Upload is not a post video")
+        if session.status != UploadSession.STATUS_COMPLETE:
+            raise ValidationError("Upload is not complete")
+
+        if post.video:
+            post.video.delete(save=False)
+        UploadService._move_into_field(session, post, 'video')
+        post.media_type = 'both' if post.image else 'video'
+
+        session.status = UploadSession.STATUS_ATTACHED
+        session.save(update_fields=['status', 'updated_at'])
+        return post
+
+    @staticmethod
+    def attach_cv(session):
+        """Replace the user's CV with a completed upload"""
+        user = session.user
+        if user.cv_file:
+            user.cv_file.delete(save=False)
+        UploadService._move_into_field(session, user, 'cv_file')
+        user.cv_upload_date = timezone.now()
+        user.save(update_fields=['cv_file', 'cv_upload_date'])
+
+        session.status = UploadSession.STATUS_ATTACHED
+        session.save(update_fields=['status', 'updated_at'])
+        logger.info(f"CV uploaded successfully for user {user.email} via chunked upload {session.id}")
+        return user
+
+    @staticmethod
+    def expire_stale_sessions():
+        """Drop part files of uploads that have not progressed within the TTL"""
+        cutoff = timezone.now() - UploadService.SESSION_TTL
+        stale = UploadSession.objects.filter(
+            status__in=[UploadSession.STATUS_UPLOADING, UploadSession.STATUS_COMPLETE],
+            updated_at__lt=cutoff
+        )
+        expired = 0
+        for session in stale.iterator():
+            if os.path.exists(session.temp_path):
+                os.remove(session.temp_path)
+            expired += 1
+        stale.update(status=UploadSession.STATUS_EXPIRED)
+        return expired
+
+    @staticmethod
+    def serialize_session(session):
+        return {
+            'upload_id': str(session.id),
+            'target': session.target,
+            'status': session.status,
+            'offset': session.received_bytes,
+            'total_size': session.total_size,
+            'chunk_size': UploadService.CHUNK_SIZE,
+            'checksum': session.checksum,
+        }
@@ -7,7 +7,7 @@ import numpy as np
 import json
 from django.conf import settings
 import torch
-from ..models.notification_model import Notification
+from .notification_services import NotificationService
 
 class UserService:
     # Initialize the embedding model (will be loaded only once)
@@ -359,7 +359,7 @@ class UserService:
             # Check if profile is private
             if not user_to_follow.is_profile_public:
                 # Create follow request notification
-                Notification.objects.create(
+                NotificationService.create_notification(
                     recipient=user_to_follow,
                     sender=current_user,
                     notification_type='FOLLOW_REQUEST',
@@ -378,7 +378,7 @@ class UserService:
                 current_user.following.add(user_to_follow)
                 
                 # Create notification
-                Notification.objects.create(
+                NotificationService.create_notification(
                     recipient=user_to_follow,
                     sender=current_user,
                     notification_type='NEW_FOLLOWER',
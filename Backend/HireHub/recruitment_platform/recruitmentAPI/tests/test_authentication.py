@@ -0,0 +1,78 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import AccessToken
+
+from recruitmentAPI.authentication import CachedJWTAuthentication, LazyUser
+
+User = get_user_model()
+
+class WhoAmIView(APIView):
+    authentication_classes = [CachedJWTAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response({'id': request.user.id, 'user_type': request.user.user_type})
+
+class ProfileView(WhoAmIView):
+    def get(self, request):
+        return Response({'email': request.user.email})
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='candidate@example.com', password='secret-pass-123')
+        self.factory = APIRequestFactory()
+
+    def request(self, view, user=None):
+        token = AccessToken.for_user(user or self.user)
+        request = self.factory.get('/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        return view.as_view()(request)
+
+    def test_cached_principal_skips_users_table(self):
+        self.request(WhoAmIView)  # warms the principal cache
+
+        with self.assertNumQueries(0):
+            response = self.request(WhoAmIView)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'id': self.user.id, 'user_type': User.NORMAL_USER})
+
+    def test_truthiness_does_not_load_user(self):
+        user = LazyUser({'id': self.user.id, 'user_type': User.NORMAL_USER, 'is_active': True})
+
+        with self.assertNumQueries(0):
+            self.assertTrue(user)
+            self.assertTrue(user.is_authenticated)
+
+    def test_other_attributes_load_full_user(self):
+        self.request(ProfileView)
+
+        with self.assertNumQueries(1):
+            response = self.request(ProfileView)
+
+        self.assertEqual(response.data, {'email': 'candidate@example.com'})
+
+    def test_deactivated_user_is_rejected_after_save(self):
+        self.request(WhoAmIView)
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        response = self.request(WhoAmIView)
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_bulk_deactivation_is_rejected(self):
+        self.request(WhoAmIView)
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(id=self.user.id).update(is_active=False)
+
+        response = self.request(WhoAmIView)
+
+        self.assertEqual(response.status_code, 401)
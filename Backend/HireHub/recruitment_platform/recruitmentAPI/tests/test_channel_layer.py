@@ -0,0 +1,129 @@
+import asyncio
+import json
+import uuid
+from types import SimpleNamespace
+from unittest import mock, skipIf
+
+from asgiref.sync import sync_to_async
+from channels.layers import get_channel_layer
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from channels_redis.core import RedisChannelLayer
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+
+from recruitmentAPI.message_consumer import ChatConsumer
+from recruitmentAPI.routing import websocket_urlpatterns
+from recruitmentAPI.services.message_services import MessageService
+
+def redis_available():
+    try:
+        import redis
+        redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=1).ping()
+        return True
+    except Exception:
+        return False
+
+try:
+    from fakeredis import FakeServer
+    from fakeredis.aioredis import FakeConnection
+    from redis.asyncio import ConnectionPool
+
+    class FakeRedisChannelLayer(RedisChannelLayer):
+        """RedisChannelLayer on an in-process fakeredis server (needs lupa for group_send's Lua)"""
+        server = FakeServer()
+
+        def create_pool(self, index):
+            return ConnectionPool(connection_class=FakeConnection, server=FakeRedisChannelLayer.server)
+except ImportError:
+    FakeRedisChannelLayer = None
+
+# Prefer a real Redis; fall back to fakeredis so the suite still runs without one
+if redis_available():
+    CHANNEL_LAYER_CLASS = RedisChannelLayer
+elif FakeRedisChannelLayer is not None:
+    CHANNEL_LAYER_CLASS = FakeRedisChannelLayer
+else:
+    CHANNEL_LAYER_CLASS = None
+
+# A fresh prefix keeps test groups apart from a running server on the same Redis
+REDIS_CHANNEL_LAYER_CONFIG = {
+    'hosts': [settings.REDIS_URL],
+    'prefix': f'hirehub-test-{uuid.uuid4().hex[:8]}',
+}
+
+async def user_for_token(token):
+    """Test tokens are 'user-<id>'"""
+    return SimpleNamespace(id=int(token.split('-')[1]))
+
+@override_settings(
+    CHANNEL_LAYERS={
+        'default': {
+            'BACKEND': f'{CHANNEL_LAYER_CLASS.__module__}.{CHANNEL_LAYER_CLASS.__qualname__}' if CHANNEL_LAYER_CLASS else '',
+            'CONFIG': REDIS_CHANNEL_LAYER_CONFIG,
+        },
+    },
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+@skipIf(CHANNEL_LAYER_CLASS is None, 'Neither Redis nor fakeredis (with lupa) is available')
+class RedisChannelLayerTests(SimpleTestCase):
+    """Chat delivery through the Redis channel layer, on a real Redis or fakeredis"""
+    TIMEOUT = 3
+
+    def setUp(self):
+        patcher = mock.patch.object(ChatConsumer, 'get_user_from_token', new=mock.AsyncMock(side_effect=user_for_token))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def connect(self, user_id):
+        communicator = WebsocketCommunicator(URLRouter(websocket_urlpatterns), f'/ws/chat/user-{user_id}/')
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        return communicator
+
+    async def receive(self, communicator):
+        return json.loads(await communicator.receive_from(timeout=self.TIMEOUT))
+
+    async def test_group_send_from_another_process_reaches_consumer(self):
+        communicator = await self.connect(1)
+        try:
+            # A separate layer instance has its own connections, like another ASGI worker
+            other_process = CHANNEL_LAYER_CLASS(**REDIS_CHANNEL_LAYER_CONFIG)
+            await other_process.group_send(MessageService.user_group(1), {
+                'type': 'chat_message',
+                'message': {'id': 10, 'content': 'hello'}
+            })
+
+            event = await self.receive(communicator)
+            self.assertEqual(event['type'], 'new_message')
+            self.assertEqual(event['message']['id'], 10)
+        finally:
+            await communicator.disconnect()
+
+    async def test_send_events_reaches_each_participant_only(self):
+        alice, bob, carol = await asyncio.gather(self.connect(1), self.connect(2), self.connect(3))
+        try:
+            await sync_to_async(MessageService.send_events)([
+                ([1, 2], {'type': 'chat_message', 'message': {'id': 11, 'conversation_id': 5}})
+            ])
+
+            for communicator in (alice, bob):
+                event = await self.receive(communicator)
+                self.assertEqual(event['message']['id'], 11)
+            self.assertTrue(await carol.receive_nothing(timeout=0.5))
+        finally:
+            await asyncio.gather(alice.disconnect(), bob.disconnect(), carol.disconnect())
+
+    async def test_every_socket_of_a_user_receives_events(self):
+        first_tab, second_tab = await asyncio.gather(self.connect(4), self.connect(4))
+        try:
+            await get_channel_layer().group_send(MessageService.user_group(4), {
+                'type': 'chat_message_deleted',
+                'message': {'id': 12, 'is_deleted': True}
+            })
+
+            for communicator in (first_tab, second_tab):
+                event = await self.receive(communicator)
+                self.assertEqual(event['type'], 'message_deleted')
+        finally:
+            await asyncio.gather(first_tab.disconnect(), second_tab.disconnect())
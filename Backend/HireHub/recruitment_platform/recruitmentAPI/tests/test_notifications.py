@@ -0,0 +1,139 @@
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from recruitmentAPI.models.notification_model import BroadcastNotification, Notification
+from recruitmentAPI.services.notification_services import NotificationService
+
+User = get_user_model()
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CoalescedNotificationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(email='author@example.com', password='secret-pass-123')
+        self.fans = [
+            User.objects.create_user(email=f'fan{index}@example.com', password='secret-pass-123')
+            for index in range(3)
+        ]
+
+    def like(self, fan):
+        return NotificationService.create_notification(
+            recipient=self.author,
+            sender=fan,
+            notification_type='POST_LIKE',
+            content='liked your post',
+            related_object_id=7,
+            related_object_type='post'
+        )
+
+    def test_likes_in_one_window_share_a_row(self):
+        first = self.like(self.fans[0])
+        second = self.like(self.fans[1])
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(Notification.objects.filter(recipient=self.author).count(), 1)
+        second.refresh_from_db()
+        self.assertEqual(second.actor_count, 2)
+        self.assertEqual(second.content, 'and 1 other liked your post')
+
+    def test_merge_keeps_created_at_and_moves_updated_at(self):
+        first = self.like(self.fans[0])
+        merged = self.like(self.fans[1])
+        merged.refresh_from_db()
+
+        self.assertEqual(merged.created_at, first.created_at)
+        self.assertGreater(merged.updated_at, first.updated_at)
+
+    def test_read_notification_is_not_merged_into(self):
+        first = self.like(self.fans[0])
+        NotificationService.mark_as_read([first.id], self.author.id)
+
+        second = self.like(self.fans[1])
+
+        self.assertNotEqual(first.id, second.id)
+        first.refresh_from_db()
+        self.assertIsNone(first.coalesce_key)
+        self.assertEqual(first.actor_count, 1)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class BroadcastReadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.company = User.objects.create_user(email='company@example.com', password='secret-pass-123')
+        self.user = User.objects.create_user(email='reader@example.com', password='secret-pass-123')
+        self.older, self.newer = [
+            BroadcastNotification.objects.create(
+                sender=self.company,
+                notification_type='NEW_JOB_POST',
+                content=f'posted job {index}'
+            )
+            for index in range(2)
+        ]
+
+    def read_flags(self):
+        page = NotificationService.get_user_notifications_page(self.user.id, limit=10)
+        return {n.broadcast_id: n.is_read for n in page['notifications']}
+
+    def test_marking_one_broadcast_leaves_older_ones_unread(self):
+        updated = NotificationService.mark_as_read([f'broadcast-{self.newer.id}'], self.user.id)
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(self.read_flags(), {self.newer.id: True, self.older.id: False})
+        self.assertEqual(NotificationService.get_unread_count(self.user.id), 1)
+
+    def test_marking_a_read_broadcast_again_counts_nothing(self):
+        NotificationService.mark_as_read([f'broadcast-{self.newer.id}'], self.user.id)
+
+        self.assertEqual(NotificationService.mark_as_read([f'broadcast-{self.newer.id}'], self.user.id), 0)
+
+    def test_mark_all_as_read_covers_every_broadcast(self):
+        NotificationService.mark_as_read([f'broadcast-{self.newer.id}'], self.user.id)
+        NotificationService.mark_all_as_read(self.user.id)
+
+        self.assertEqual(self.read_flags(), {self.newer.id: True, self.older.id: True})
+        self.assertEqual(NotificationService.get_unread_count(self.user.id), 0)
+        self.assertFalse(self.user.broadcast_reads.exists())
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}},
+    BACKEND_URL='https://api.example.com'
+)
+class PushNotificationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.sender = User.objects.create_user(email='sender@example.com', password='secret-pass-123')
+        self.sender.profile_picture = 'profile_pictures/sender.jpg'
+        self.sender.save()
+        self.recipient = User.objects.create_user(email='recipient@example.com', password='secret-pass-123')
+
+    def test_one_event_per_recipient_with_absolute_avatars(self):
+        layer = get_channel_layer()
+        channel = async_to_sync(layer.new_channel)()
+        async_to_sync(layer.group_add)(NotificationService.user_group(self.recipient.id), channel)
+        notification_ids = [
+            Notification.objects.create(
+                recipient=self.recipient,
+                sender=self.sender,
+                notification_type='NEW_FOLLOWER',
+                content=content
+            ).id
+            for content in ('started following you', 'wants to follow you')
+        ]
+
+        NotificationService.push_notifications(notification_ids)
+
+        event = async_to_sync(layer.receive)(channel)
+        self.assertEqual(event['type'], 'notification.batch')
+        self.assertEqual([n['id'] for n in event['notifications']], notification_ids)
+        self.assertEqual(event['unread_count'], 2)
+        self.assertEqual(
+            event['notifications'][0]['sender']['profile_picture'],
+            'https://api.example.com/media/profile_pictures/sender.jpg'
+        )
+        self.assertNotIn(channel, layer.channels)
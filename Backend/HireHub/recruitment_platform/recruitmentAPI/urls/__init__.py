@@ -7,6 +7,7 @@ from .job_urls import urlpatterns as job_urls
 from .notification_urls import urlpatterns as notification_urls
 from .message_urls import urlpatterns as message_urls
 from .interview_urls import urlpatterns as interview_urls
+from .upload_urls import urlpatterns as upload_urls
 
 # For backward compatibility
 from .message_urls import urlpatterns as messaging_urls
@@ -23,4 +24,5 @@ urlpatterns = [
     path('notification/', include(notification_urls)),
     path('messaging/', include(message_urls)),
     path('interview/', include(interview_urls)),
+    path('upload/', include(upload_urls)),
 ]
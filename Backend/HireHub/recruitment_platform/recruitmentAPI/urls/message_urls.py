@@ -3,7 +3,9 @@ from rest_framework.routers import DefaultRouter
 from recruitmentAPI.views.message_view import (
     ConversationViewSet,
     MessageViewSet,
-    UserSearchView
+    UserSearchView,
+    PresenceView,
+    MessageSearchView
 )
 
 # Create a router and register our viewsets with it.
@@ -14,4 +16,6 @@ router.register(r'messages', MessageViewSet, basename='message')
 urlpatterns = [
     path('', include(router.urls)),
     path('search-users/', UserSearchView.as_view(), name='search-users'),
+    path('presence/', PresenceView.as_view(), name='presence'),
+    path('search/', MessageSearchView.as_view(), name='message-search'),
 ] 
\ No newline at end of file
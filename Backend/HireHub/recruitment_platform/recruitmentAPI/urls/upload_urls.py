@@ -0,0 +1,7 @@
+from django.urls import path
+from ..views.upload_views import UploadSessionView, UploadChunkView
+
+urlpatterns = [
+    path('', UploadSessionView.as_view(), name='upload-session'),
+    path('<uuid:upload_id>/', UploadChunkView.as_view(), name='upload-chunk'),
+]
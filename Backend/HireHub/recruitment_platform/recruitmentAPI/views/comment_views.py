@@ -38,7 +38,9 @@ class CommentListView(APIView):
 
                 cursor=cursor,
 
-                limit=limit
+                limit=limit,
+
+                user=request.user
 
             )
 
@@ -50,7 +52,13 @@ class CommentListView(APIView):
 
                 many=True, 
 
-                context={'request': request}
+                context={
+
+                    'request': request,
+
+                    'liked_comment_ids': result['liked_comment_ids']
+
+                }
 
             )
 
@@ -12,6 +12,7 @@ from ..serializers.job_serializers import (
     JobFeedbackSerializer
 )
 from ..services.job_services import JobService
+from ..services.trending_services import TrendingService
 from ..permissions import IsCompanyUser, IsJobOwner
 from ..models import JobPost
 
@@ -37,6 +38,7 @@ class JobListView(viewsets.ViewSet):
             OpenApiParameter(name='cursor', description='Pagination cursor (ISO8601 datetime)', required=False, type=str),
             OpenApiParameter(name='limit', description='Number of results per page', required=False, type=int),
             OpenApiParameter(name='followed_only', description='Show only jobs from followed companies', required=False, type=bool),
+            OpenApiParameter(name='sort', description='Ordering: recent (default) or trending', required=False, type=str),
         ],
         responses=JobResponseSerializer(many=True)
     )
@@ -100,8 +102,10 @@ class JobListView(viewsets.ViewSet):
             except (ValueError, TypeError):
                 limit = 10
 
+            sort = request.query_params.get('sort', JobService.SORT_RECENT)
+
             # Get search results
-            result = JobService.search_jobs(filters, cursor=cursor, limit=limit, user=request.user)
+            result = JobService.search_jobs(filters, cursor=cursor, limit=limit, user=request.user, sort=sort)
             return Response(result, status=status.HTTP_200_OK)
 
         except Exception as e:
@@ -242,6 +246,7 @@ class JobView(viewsets.ViewSet):
             else:
                 user.saved_jobs.add(job)
                 message = "Job saved successfully"
+            TrendingService.refresh_job(job.id)
             
             return Response({'message': message}, status=status.HTTP_200_OK)
             
@@ -9,9 +9,12 @@ from recruitmentAPI.serializers.message_serializers import (
     ConversationSerializer, 
     ConversationCreateSerializer,
     MessageSerializer,
+    MessageHistorySerializer,
     UserBasicSerializer
 )
 from recruitmentAPI.services.message_services import MessageService
+from recruitmentAPI.services.presence_services import PresenceService
+from recruitmentAPI.services.message_search_services import MessageSearchService
 
 class ConversationViewSet(viewsets.ModelViewSet):
     """
@@ -25,10 +28,24 @@ class ConversationViewSet(viewsets.ModelViewSet):
         return ConversationSerializer
 
     def get_queryset(self):
-        user = self.request.user
-        return Conversation.objects.filter(participants=user).prefetch_related(
-            'participants', 'messages'
-        ).order_by('-updated_at')
+        return MessageService.get_user_conversations(self.request.user)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action == 'list':
+            context['unread_counts'] = MessageService.get_unread_counts(self.request.user)
+        return context
+
+    def list(self, request, *args, **kwargs):
+        conversations = list(self.filter_queryset(self.get_queryset()))
+        # One cache round trip for the presence of everyone in the inbox
+        participant_ids = {participant.id for conversation in conversations for participant in conversation.participants.all()}
+        context = self.get_serializer_context()
+        context['online_user_ids'] = {
+            user_id for user_id, last_seen in PresenceService.get_online_status(participant_ids).items() if last_seen
+        }
+        serializer = self.get_serializer_class()(conversations, many=True, context=context)
+        return Response(serializer.data)
 
     def create(self, request):
         serializer = self.get_serializer(data=request.data, context={'request': request})
@@ -42,34 +59,40 @@ class ConversationViewSet(viewsets.ModelViewSet):
 
     @action(detail=True, methods=['get'])
     def messages(self, request, pk=None):
-        """Get all messages for a conversation"""
+        """
+        Get a page of messages for a conversation.
+        Query params: before_id (older page), after_id (newer messages), limit
+        """
         conversation = get_object_or_404(Conversation, pk=pk, participants=request.user)
-        
-        # Check if after_id parameter is provided (for fetching only new messages)
-        after_id = request.query_params.get('after_id')
-        if after_id:
-            # Fetch only messages newer than the specified ID
-            messages = Message.objects.filter(
-                conversation=conversation,
-                id__gt=after_id
-            ).select_related('sender')
-        else:
-            # Fetch all messages
-            messages = Message.objects.filter(
-                conversation=conversation
-            ).select_related('sender')
-        
-        page = self.paginate_queryset(messages)
-        if page is not None:
-            serializer = MessageSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = MessageSerializer(messages, many=True)
-        
+
+        try:
+            before_id = int(request.query_params['before_id']) if request.query_params.get('before_id') else None
+            after_id = int(request.query_params['after_id']) if request.query_params.get('after_id') else None
+            limit = max(int(request.query_params.get('limit', MessageService.HISTORY_PAGE_SIZE)), 1)
+        except ValueError:
+            return Response(
+                {'error': 'before_id, after_id and limit must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        messages, has_more = MessageService.get_message_page(
+            conversation, before_id=before_id, after_id=after_id, limit=limit
+        )
+
         # Mark messages as read
         MessageService.mark_messages_as_read(request.user, pk)
-        
-        return Response(serializer.data)
+        context = {'read_watermarks': MessageService.get_read_watermarks(conversation)}
+
+        sender_ids = {message.sender_id for message in messages}
+        senders = UserBasicSerializer(User.objects.filter(id__in=sender_ids), many=True).data
+
+        return Response({
+            'results': MessageHistorySerializer(messages, many=True, context=context).data,
+            'senders': {sender['id']: sender for sender in senders},
+            'has_more': has_more,
+            'before_id': messages[0].id if messages else before_id,
+            'after_id': messages[-1].id if messages else after_id
+        })
 
 class MessageViewSet(viewsets.ModelViewSet):
     """
@@ -162,4 +185,51 @@ class UserSearchView(APIView):
         users = MessageService.search_users(request.user, query)
         
         serializer = UserBasicSerializer(users, many=True)
-        return Response(serializer.data) 
\ No newline at end of file
+        return Response(serializer.data) 
+
+class PresenceView(APIView):
+    """
+    Bulk online lookup: GET ?user_ids=1,2,3
+    Only users who share a conversation with the requester are returned.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        user_ids = [
+            int(user_id) for user_id in request.query_params.get('user_ids', '').split(',')
+            if user_id.strip().isdigit()
+        ][:200]
+        statuses = PresenceService.get_online_status(
+            PresenceService.get_visible_user_ids(request.user, user_ids)
+        )
+        return Response({
+            str(user_id): {'online': last_seen is not None, 'last_seen': last_seen}
+            for user_id, last_seen in statuses.items()
+        })
+
+
+class MessageSearchView(APIView):
+    """
+    Search the user's messages: GET ?q=words&before_id=&limit=
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        query = request.query_params.get('q', '')
+        try:
+            before_id = int(request.query_params['before_id']) if request.query_params.get('before_id') else None
+            limit = max(int(request.query_params.get('limit', MessageSearchService.PAGE_SIZE)), 1)
+        except ValueError:
+            return Response(
+                {'error': 'before_id and limit must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results, next_before_id = MessageSearchService.search(
+            request.user, query, before_id=before_id, limit=limit
+        )
+        return Response({
+            'results': results,
+            'next_before_id': next_before_id,
+            'has_more': next_before_id is not None
+        })
@@ -12,32 +12,27 @@ class NotificationListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        """Get user's notifications"""
+        """
+        Get user's notifications.
+        Pass cursor (empty for the first page, then next_cursor) for keyset paging
+        without a total count.
+        """
         try:
             logger.debug(f"Getting notifications for user {request.user.id}")
-            page = int(request.GET.get('page', 1))
             limit = int(request.GET.get('limit', 20))
-            notification_type = request.GET.get('type')
-            
-            notifications = NotificationService.get_user_notifications(
+            result = NotificationService.get_user_notifications_page(
                 user_id=request.user.id,
-                page=page,
+                cursor=request.GET.get('cursor'),
                 limit=limit,
-                notification_type=notification_type
+                notification_type=request.GET.get('type')
             )
-            
-            logger.debug(f"Found {len(notifications)} notifications")
-            serializer = NotificationSerializer(notifications, many=True, context={'request': request})
-            
-            # Get unread count
-            unread_count = NotificationService.get_unread_count(request.user.id)
-            logger.debug(f"Unread count: {unread_count}")
-            
+            logger.debug(f"Found {len(result['notifications'])} notifications")
+            serializer = NotificationSerializer(result['notifications'], many=True, context={'request': request})
             return Response({
                 'notifications': serializer.data,
-                'has_next': notifications.has_next() if hasattr(notifications, 'has_next') else False,
-                'total_pages': notifications.paginator.num_pages if hasattr(notifications, 'paginator') else 1,
-                'unread_count': unread_count
+                'next_cursor': result['next_cursor'],
+                'has_next': result['has_next'],
+                'unread_count': NotificationService.get_unread_count(request.user.id)
             })
         except Exception as e:
             logger.error(f"Error in NotificationListView: {str(e)}")
@@ -43,12 +43,14 @@ class PostListView(APIView):
         cursor = request.GET.get('cursor')
         limit = int(request.GET.get('limit', 10))
         followed_only = request.GET.get('followed_only', '').lower() == 'true'
+        sort = request.GET.get('sort', PostService.SORT_RECENT)
         
         result = PostService.get_posts_paginated(
             cursor=cursor,
             limit=limit,
             user=request.user,
-            followed_only=followed_only
+            followed_only=followed_only,
+            sort=sort
         )
         
         serializer = PostListSerializer(
@@ -78,12 +80,17 @@ class PostListView(APIView):
             data = serializer.validated_data
             
             # Create post using PostService
-            post = PostService.create_post(
-                user=request.user,
-                content=data.get('content', ''),  # Default to empty string if content is not provided
-                image=request.FILES.get('image'),
-                video=request.FILES.get('video')
-            )
+            try:
+                post = PostService.create_post(
+                    user=request.user,
+                    content=data.get('content', ''),  # Default to empty string if content is not provided
+                    image=request.FILES.get('image'),
+                    video=request.FILES.get('video'),
+                    video_upload_id=request.data.get('video_upload_id')
+                )
+            except ValueError as e:
+                # Invalid media or an upload that is incomplete or not the user's
+                return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
             
             # Serialize the created post
             return_serializer = PostListSerializer(
@@ -136,18 +143,14 @@ class PostDetailView(APIView):
         """
         Get detailed post view including initial comments
         """
-        post = PostService.get_post_detail(post_id)
-        if not post:
+        data = PostService.get_post_detail_data(post_id, request)
+        if data is None:
             return Response(
                 {"error": "Post not found"}, 
                 status=status.HTTP_404_NOT_FOUND
             )
 
-            
-
-        serializer = PostDetailSerializer(post, context={'request': request})
-
-        return Response(serializer.data)
+        return Response(data)
 
     def put(self, request, post_id):
         """Update a post (full update)"""
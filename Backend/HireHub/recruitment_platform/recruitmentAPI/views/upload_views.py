@@ -0,0 +1,90 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from django.core.exceptions import ValidationError
+from ..models.upload_model import UploadSession
+from ..models.user_model import User
+from ..services.upload_services import UploadService
+from ..permissions import IsNormalOrCompanyUser
+import logging
+
+logger = logging.getLogger(__name__)
+
+class UploadSessionView(APIView):
+    permission_classes = [IsAuthenticated, IsNormalOrCompanyUser]
+
+    def post(self, request):
+        """
+        Start a chunked upload.
+        Body: target (post_video | cv), file_name, content_type, total_size
+        """
+        target = request.data.get('target')
+        if target == UploadSession.TARGET_CV and request.user.user_type != User.NORMAL_USER:
+            return Response(
+                {'error': 'Only normal users can upload a CV'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        try:
+            session = UploadService.start_upload(
+                user=request.user,
+                target=target,
+                file_name=request.data.get('file_name'),
+                content_type=request.data.get('content_type'),
+                total_size=request.data.get('total_size')
+            )
+            return Response(UploadService.serialize_session(session), status=status.HTTP_201_CREATED)
+        except ValidationError as e:
+            return Response({'error': e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+class UploadChunkView(APIView):
+    permission_classes = [IsAuthenticated, IsNormalOrCompanyUser]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+
+    def get(self, request, upload_id):
+        """Get upload progress; clients resume from the returned offset"""
+        try:
+            session = UploadService.get_session(request.user, upload_id)
+            return Response(UploadService.serialize_session(session))
+        except ValidationError as e:
+            return Response({'error': e.messages[0]}, status=status.HTTP_404_NOT_FOUND)
+
+    def put(self, request, upload_id):
+        """
+        Append a chunk.
+        Form fields: chunk (file), offset, checksum (optional SHA-256 hex of the chunk)
+        """
+        chunk = request.FILES.get('chunk')
+        if not chunk:
+            return Response({'error': 'No chunk provided'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            session = UploadService.append_chunk(
+                user=request.user,
+                upload_id=upload_id,
+                offset=request.data.get('offset'),
+                chunk=chunk,
+                checksum=request.data.get('checksum')
+            )
+            return Response(UploadService.serialize_session(session))
+        except ValidationError as e:
+            session = UploadSession.objects.filter(id=upload_id, user=request.user).first()
+            if not session:
+                response_status = status.HTTP_404_NOT_FOUND
+            elif getattr(e, 'code', None) == 'offset_conflict':
+                # The client is out of step; it resumes from the returned offset
+                response_status = status.HTTP_409_CONFLICT
+            else:
+                # Bad type, oversize chunk, checksum mismatch, finished upload...
+                response_status = status.HTTP_400_BAD_REQUEST
+            return Response({
+                'error': e.messages[0],
+                'offset': session.received_bytes if session else None
+            }, status=response_status)
+        except Exception as e:
+            logger.exception(f"Error appending chunk to upload {upload_id}: {str(e)}")
+            return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    post = put
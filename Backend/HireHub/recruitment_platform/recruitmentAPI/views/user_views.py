@@ -17,6 +17,7 @@ import logging
 from recruitmentAPI.permissions import IsNormalUser, IsCompanyUser, IsNormalOrCompanyUser
 from django.conf import settings
 from ..models.notification_model import Notification
+from ..serializers.notification_serializers import NotificationSerializer
 
 User = get_user_model()
 
@@ -420,7 +421,7 @@ class FollowUserView(APIView):
                         })
                     
                     # Create a new follow request notification
-                    Notification.objects.create(
+                    NotificationService.create_notification(
                         recipient=user_to_follow,
                         sender=current_user,
                         notification_type='NEW_FOLLOWER',
@@ -439,7 +440,7 @@ class FollowUserView(APIView):
                     current_user.following.add(user_to_follow)
                     
                     # Create notification for the user being followed
-                    Notification.objects.create(
+                    NotificationService.create_notification(
                         recipient=user_to_follow,
                         sender=current_user,
                         notification_type='NEW_FOLLOWER',
@@ -590,7 +591,7 @@ class HandleFollowRequestView(APIView):
                 notification.save()
 
                 # Create notification for the sender
-                Notification.objects.create(
+                NotificationService.create_notification(
                     recipient=notification.sender,
                     sender=request.user,
                     notification_type='CONNECTION_ACCEPTED',
@@ -640,6 +641,7 @@ class CancelFollowRequestView(APIView):
 
             if notification:
                 notification.delete()
+                NotificationService.invalidate_unread_count(target_user.id)
                 
                 return Response({
                     'message': 'Follow request cancelled successfully',
@@ -664,52 +666,34 @@ class GetNotificationsView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
+        """
+        Get a page of the user's notifications.
+        Query params: cursor (next_cursor of the previous page), limit, type
+        """
         try:
-            notifications = Notification.objects.filter(
-                recipient=request.user
-            ).order_by('-created_at')
-
-            # Convert notifications to list of dictionaries
-            notifications_data = []
-            for notification in notifications:
-                data = {
-                    'id': notification.id,
-                    'notification_type': notification.notification_type,
-                    'content': notification.content,
-                    'created_at': notification.created_at,
-                    'is_read': notification.is_read,
-                    'related_object_id': notification.related_object_id,
-                    'related_object_type': notification.related_object_type,
-                    'status': notification.status,  # Always include status field
-                    'sender': None
-                }
-                
-                if notification.sender:
-                    sender_data = {
-                        'id': notification.sender.id,
-                        'email': notification.sender.email,
-                        'first_name': notification.sender.first_name if hasattr(notification.sender, 'first_name') else None,
-                        'last_name': notification.sender.last_name if hasattr(notification.sender, 'last_name') else None,
-                        'profile_picture': request.build_absolute_uri(notification.sender.profile_picture.url) if notification.sender.profile_picture else None,
-                        'user_type': notification.sender.user_type
-                    }
-                    
-                    # Add company name for company users
-                    if notification.sender.user_type == 'Company':
-                        sender_data['company_name'] = notification.sender.company_name
-                        
-                    data['sender'] = sender_data
+            limit = min(max(int(request.GET.get('limit', 20)), 1), 100)
+        except ValueError:
+            return Response({
+                'error': 'limit must be an integer'
+            }, status=status.HTTP_400_BAD_REQUEST)
 
-                notifications_data.append(data)
+        try:
+            result = NotificationService.get_user_notifications_page(
+                user_id=request.user.id,
+                cursor=request.GET.get('cursor'),
+                limit=limit,
+                notification_type=request.GET.get('type')
+            )
+            serializer = NotificationSerializer(result['notifications'], many=True, context={'request': request})
 
             return Response({
-                'notifications': notifications_data,
-                'has_next': False,  # Implement pagination if needed
-                'total_pages': 1,
-                'unread_count': sum(1 for n in notifications if not n.is_read)
+                'notifications': serializer.data,
+                'next_cursor': result['next_cursor'],
+                'has_next': result['has_next'],
+                'unread_count': NotificationService.get_unread_count(request.user.id)
             })
         except Exception as e:
-            print(f"Error in GetNotificationsView: {str(e)}")  # Debug log
+            logger.error(f"Error in GetNotificationsView: {str(e)}")
             return Response({
                 'error': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -84,11 +84,55 @@ ASGI_APPLICATION = 'recruitment_platform.asgi.application'
 
 
 # Channels configuration
-CHANNEL_LAYERS = {
-    'default': {
-        'BACKEND': 'channels.layers.InMemoryChannelLayer',
-    },
-}
+# 'memory' only reaches sockets in the same process; use 'redis' to run several ASGI workers
+CHANNEL_LAYER_BACKEND = os.environ.get('CHANNEL_LAYER_BACKEND', 'memory')
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+
+if CHANNEL_LAYER_BACKEND == 'redis':
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {
+                # channels_redis keeps one connection pool per host and event loop
+                'hosts': [REDIS_URL],
+                'prefix': 'hirehub',
+                # Undelivered messages are dropped after this many seconds
+                'expiry': 30,
+                # Group memberships expire unless the consumer refreshes them by reconnecting;
+                # keep above the longest expected socket lifetime
+                'group_expiry': 86400,
+                # Messages buffered per channel before sends start failing
+                'capacity': 1000,
+            },
+        },
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        },
+    }
+
+# Cache
+# Unread counters, presence, typing coalescing and auth principals live here, so several
+# processes (ASGI workers, management commands) need 'redis'. Follows the channel layer
+# switch by default; the per-process 'memory' cache suits a single local process.
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', CHANNEL_LAYER_BACKEND)
+
+if CACHE_BACKEND == 'redis':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'hirehub-cache',
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    }
 
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
@@ -154,11 +198,44 @@ MEDIA_URL = '/media/'
 # Absolute filesystem path to the directory that will hold user-uploaded files
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Background task settings (see recruitmentAPI.services.background_services)
+BACKGROUND_TASK_WORKERS = int(os.environ.get('BACKGROUND_TASK_WORKERS', 4))
+# Run background tasks inline, e.g. for local debugging
+BACKGROUND_TASKS_EAGER = os.environ.get('BACKGROUND_TASKS_EAGER', 'false').lower() == 'true'
+
+# Chunked uploads are assembled here; keep it on the same filesystem as MEDIA_ROOT
+CHUNKED_UPLOAD_DIR = MEDIA_ROOT / 'uploads_tmp'
+CHUNKED_UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024  # 5MB
+
+# NEW_JOB_POST delivery: 'targeted' (top matched candidates) or 'broadcast' (everyone)
+JOB_NOTIFICATION_MODE = os.environ.get('JOB_NOTIFICATION_MODE', 'targeted')
+JOB_NOTIFICATION_TOP_K = 200
+JOB_NOTIFICATION_MIN_SCORE = 0.45
+JOB_NOTIFICATION_DAILY_CAP = 5
+
+# Likes/comments on the same post merge into one unread notification within this window
+NOTIFICATION_COALESCE_WINDOW_HOURS = 24
+
+# Days a read notification stays in the hot table, per type ('default' for the rest; None keeps forever)
+NOTIFICATION_RETENTION_DAYS = {
+    'default': 180,
+    'POST_LIKE': 30,
+    'COMMENT_LIKE': 30,
+    'NEW_POST': 60,
+    'NEW_JOB_POST': 60,
+}
+# Set to a directory to export archived notifications as .jsonl.gz instead of the archive table
+NOTIFICATION_ARCHIVE_EXPORT_DIR = os.environ.get('NOTIFICATION_ARCHIVE_EXPORT_DIR')
+
+# ffmpeg is optional; video variants are skipped when it is not installed
+FFMPEG_BINARY = os.environ.get('FFMPEG_BINARY', 'ffmpeg')
+
 # ...
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # Resolves request.user from a short-lived cached principal
+        'recruitmentAPI.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
@@ -289,6 +366,9 @@ SPECTACULAR_SETTINGS = {
 # Frontend URL for password reset
 FRONTEND_URL = 'http://localhost:3000'
 
+# Public API origin for absolute media URLs built outside a request (e.g. WebSocket pushes)
+BACKEND_URL = os.environ.get('BACKEND_URL', 'http://localhost:8000')
+
 # Graph Class Diagram Models 
 GRAPH_MODELS = {
   'all_applications': True,
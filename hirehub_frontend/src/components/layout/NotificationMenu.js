@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import {
     IconButton,
     Badge,
@@ -8,6 +8,7 @@ import {
     Typography,
     Avatar,
     Tooltip,
+    CircularProgress,
 } from '@mui/material';
 import NotificationsIcon from '@mui/icons-material/Notifications';
 import CheckCircleOutline from '@mui/icons-material/CheckCircleOutline';
@@ -34,6 +35,9 @@ const NotificationMenu = () => {
     const [anchorEl, setAnchorEl] = useState(null);
     const [notifications, setNotifications] = useState([]);
     const [unreadCount, setUnreadCount] = useState(0);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
+    const loadedOlderRef = useRef(false);
     const navigate = useNavigate();
     const { fetchProfileData } = useProfile();
 
@@ -47,7 +51,14 @@ const NotificationMenu = () => {
                 const notificationsData = response.data.notifications || [];
                 console.log('Notifications data:', notificationsData);
                 
-                setNotifications(notificationsData);
+                // Polling refreshes the newest page; keep any older pages already loaded
+                if (loadedOlderRef.current) {
+                    const freshIds = new Set(notificationsData.map(n => n.id));
+                    setNotifications(prev => [...notificationsData, ...prev.filter(n => !freshIds.has(n.id))]);
+                } else {
+                    setNotifications(notificationsData);
+                    setNextCursor(response.data.next_cursor || null);
+                }
                 setUnreadCount(response.data.unread_count || 0);
             } catch (error) {
                 console.error('Error fetching notifications:', error);
@@ -62,6 +73,35 @@ const NotificationMenu = () => {
         return () => clearInterval(interval);
     }, []);
 
+    const loadMoreNotifications = async () => {
+        if (!nextCursor || loadingMore) {
+            return;
+        }
+        setLoadingMore(true);
+        try {
+            const response = await userService.getNotifications(nextCursor);
+            const olderNotifications = response.data.notifications || [];
+            setNotifications(prev => {
+                const loadedIds = new Set(prev.map(n => n.id));
+                return [...prev, ...olderNotifications.filter(n => !loadedIds.has(n.id))];
+            });
+            setNextCursor(response.data.next_cursor || null);
+            loadedOlderRef.current = true;
+        } catch (error) {
+            console.error('Error loading more notifications:', error);
+            toast.error('Failed to load more notifications');
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
+    const handleScroll = (event) => {
+        const { scrollTop, scrollHeight, clientHeight } = event.currentTarget;
+        if (scrollHeight - scrollTop - clientHeight < 50) {
+            loadMoreNotifications();
+        }
+    };
+
     const handleClick = (event) => {
         setAnchorEl(event.currentTarget);
     };
@@ -144,6 +184,8 @@ const NotificationMenu = () => {
             // Refresh notifications list
             const updatedNotifications = await userService.getNotifications();
             setNotifications(updatedNotifications.data.notifications || []);
+            setNextCursor(updatedNotifications.data.next_cursor || null);
+            loadedOlderRef.current = false;
             setUnreadCount(updatedNotifications.data.unread_count || 0);
 
         } catch (error) {
@@ -304,7 +346,7 @@ const NotificationMenu = () => {
                             {' '}{notification.content}
                         </Typography>
                         <Typography variant="caption" color="text.secondary">
-                            {formatTimeAgo(notification.created_at)}
+                            {formatTimeAgo(notification.updated_at || notification.created_at)}
                         </Typography>
                     </Box>
                 </Box>
@@ -344,7 +386,7 @@ const NotificationMenu = () => {
                 <Box sx={{ p: 2, borderBottom: 1, borderColor: 'divider' }}>
                     <Typography variant="h6">Notifications</Typography>
                 </Box>
-                <Box sx={{ maxHeight: 300, overflowY: 'auto' }}>
+                <Box sx={{ maxHeight: 300, overflowY: 'auto' }} onScroll={handleScroll}>
                     {notifications.length > 0 ? (
                         notifications.map((notification) => renderNotificationContent(notification))
                     ) : (
@@ -354,6 +396,11 @@ const NotificationMenu = () => {
                             </Typography>
                         </MenuItem>
                     )}
+                    {loadingMore && (
+                        <Box sx={{ display: 'flex', justifyContent: 'center', py: 1 }}>
+                            <CircularProgress size={20} />
+                        </Box>
+                    )}
                 </Box>
             </Menu>
         </>
@@ -224,7 +224,10 @@ const ConversationView = ({ conversationId, currentUser }) => {
   const [newMessage, setNewMessage] = useState('');
   const [sending, setSending] = useState(false);
   const [conversation, setConversation] = useState(null);
+  const [hasOlder, setHasOlder] = useState(false);
+  const [loadingOlder, setLoadingOlder] = useState(false);
   const messagesEndRef = useRef(null);
+  const skipScrollRef = useRef(false);
   const wsRef = useRef(null);
   const justSentMessageRef = useRef(null);
   
@@ -387,6 +390,18 @@ const ConversationView = ({ conversationId, currentUser }) => {
     return conversation.participants.find(p => p.id !== currentUser.id);
   };
   
+  // Messages carry sender_id; sender details come once per page in `senders`
+  const withSenders = (data) => {
+    const messageData = data.results || data;
+    const senders = data.senders || {};
+    return Array.isArray(messageData)
+      ? messageData.map(message => ({
+          ...message,
+          sender: message.sender || senders[message.sender_id] || { id: message.sender_id }
+        }))
+      : [];
+  };
+  
   const fetchMessages = async () => {
     if (!conversationId) return;
     
@@ -394,11 +409,11 @@ const ConversationView = ({ conversationId, currentUser }) => {
       setLoading(true);
       setError(null);
       
+      // The newest page; older pages are fetched on demand with before_id
       const response = await api.get(`/api/messaging/conversations/${conversationId}/messages/`);
       
-      // Check if the response has a results field (for paginated responses)
-      const messageData = response.data.results || response.data;
-      setMessages(Array.isArray(messageData) ? messageData : []);
+      setMessages(withSenders(response.data));
+      setHasOlder(Boolean(response.data.has_more));
       
       setLoading(false);
     } catch (err) {
@@ -408,7 +423,36 @@ const ConversationView = ({ conversationId, currentUser }) => {
     }
   };
   
+  const loadOlderMessages = async () => {
+    if (!conversationId || loadingOlder || messages.length === 0) return;
+    
+    try {
+      setLoadingOlder(true);
+      
+      const response = await api.get(`/api/messaging/conversations/${conversationId}/messages/`, {
+        params: { before_id: messages[0].id }
+      });
+      
+      const olderMessages = withSenders(response.data);
+      // Keep the reader's position instead of jumping to the newest message
+      skipScrollRef.current = true;
+      setMessages(prevMessages => {
+        const loadedIds = new Set(prevMessages.map(message => message.id));
+        return [...olderMessages.filter(message => !loadedIds.has(message.id)), ...prevMessages];
+      });
+      setHasOlder(Boolean(response.data.has_more));
+    } catch (err) {
+      console.error('Error loading older messages:', err);
+    } finally {
+      setLoadingOlder(false);
+    }
+  };
+  
   useEffect(() => {
+    if (skipScrollRef.current) {
+      skipScrollRef.current = false;
+      return;
+    }
     // Scroll to bottom when messages change
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
   }, [messages]);
@@ -610,6 +654,13 @@ const ConversationView = ({ conversationId, currentUser }) => {
           </Box>
         ) : (
           <>
+            {hasOlder && (
+              <Box sx={{ display: 'flex', justifyContent: 'center', mb: 2 }}>
+                <Button size="small" onClick={loadOlderMessages} disabled={loadingOlder}>
+                  {loadingOlder ? <CircularProgress size={20} /> : 'Load older messages'}
+                </Button>
+              </Box>
+            )}
             {messages.map((message) => (
               <MessageBubble
                 key={message.id}
@@ -197,7 +197,7 @@ const NotificationMenu = () => {
                             {' '}{notification.content}
                         </Typography>
                         <Typography variant="caption" color="textSecondary" display="block">
-                            {formatTimeAgo(notification.created_at)}
+                            {formatTimeAgo(notification.updated_at || notification.created_at)}
                         </Typography>
                         {renderFollowRequestActions(notification)}
                     </Box>
@@ -1,4 +1,4 @@
-import React, { createContext, useContext, useState, useEffect } from 'react';
+import React, { createContext, useContext, useState, useEffect, useRef } from 'react';
 import { notificationService } from '../services/notificationService';
 import { toast } from 'react-hot-toast';
 import { useAuth } from './AuthContext';
@@ -18,6 +18,7 @@ export const NotificationProvider = ({ children }) => {
     const [notifications, setNotifications] = useState([]);
     const [unreadCount, setUnreadCount] = useState(0);
     const [loading, setLoading] = useState(false);
+    const socketRef = useRef(null);
 
     const fetchNotifications = async () => {
         if (!isAuthenticated) return;
@@ -47,6 +48,59 @@ export const NotificationProvider = ({ children }) => {
         }
     }, [isAuthenticated]);
 
+    // Live updates from the notification socket; polling above stays as a fallback
+    useEffect(() => {
+        if (!isAuthenticated) return;
+        const token = localStorage.getItem('token');
+        if (!token) return;
+
+        let reconnectTimer = null;
+        let closed = false;
+
+        const connect = () => {
+            const wsProtocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+            const wsUrl = `${wsProtocol}//${window.location.hostname}:8000/ws/notifications/${encodeURIComponent(token)}/`;
+            const ws = new WebSocket(wsUrl);
+            socketRef.current = ws;
+
+            ws.onmessage = (event) => {
+                try {
+                    const data = JSON.parse(event.data);
+                    if (data.type === 'new_notifications' && data.notifications) {
+                        // Merged notifications arrive again with the same id; move them to the top
+                        const incomingIds = new Set(data.notifications.map(n => n.id));
+                        setNotifications(prev => [
+                            ...[...data.notifications].reverse(),
+                            ...prev.filter(n => !incomingIds.has(n.id))
+                        ]);
+                    }
+                    if (typeof data.unread_count === 'number') {
+                        setUnreadCount(data.unread_count);
+                    }
+                } catch (error) {
+                    console.error('Error handling notification socket message:', error);
+                }
+            };
+
+            ws.onclose = () => {
+                socketRef.current = null;
+                if (!closed) {
+                    reconnectTimer = setTimeout(connect, 5000);
+                }
+            };
+        };
+
+        connect();
+        return () => {
+            closed = true;
+            clearTimeout(reconnectTimer);
+            if (socketRef.current) {
+                socketRef.current.close();
+                socketRef.current = null;
+            }
+        };
+    }, [isAuthenticated]);
+
     const markAsRead = async (notificationId) => {
         if (!isAuthenticated) return;
         
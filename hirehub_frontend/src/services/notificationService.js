@@ -1,9 +1,10 @@
 import api from './api';
 
 export const notificationService = {
-    getNotifications: async (page = 1, limit = 20, type = null) => {
+    // Keyset paging: pass the previous response's next_cursor for the next page
+    getNotifications: async (cursor = '', limit = 20, type = null) => {
         const params = new URLSearchParams();
-        params.append('page', page);
+        params.append('cursor', cursor || '');
         params.append('limit', limit);
         if (type) params.append('type', type);
         return api.get(`/notifications/?${params.toString()}`);
@@ -91,9 +91,10 @@ export const userService = {
     }
   },
 
-  getNotifications: async () => {
+  getNotifications: async (cursor = '') => {
     try {
-      const response = await api.get('/users/notifications/');
+      const params = cursor ? { cursor } : {};
+      const response = await api.get('/users/notifications/', { params });
       return response;
     } catch (error) {
       throw error;